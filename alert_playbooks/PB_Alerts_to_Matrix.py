@@ -26,7 +26,7 @@ import traceback
 from typing import Union, List
 import lib.logging_helper as logging_helper
 from lib.class_helper import CaseFile, AuditLog, Alert
-from lib.config_helper import Config
+from lib.config_helper import Config, get_log_levels
 import lib.iris_helper as iris_helper
 import integrations.matrix_notify as matrix_notify
 from lib.generic_helper import add_to_cache, get_from_cache, dict_get, redact_string
@@ -89,9 +89,7 @@ def irsoar_handle_alerts(alerts: Alert, Test: bool = False):
     """
     # Prepare the logger
     cfg = Config().cfg
-    config = cfg["integrations"]["dfir-iris"]
-    log_level_file = config["logging"]["log_level_file"]
-    log_level_stdout = config["logging"]["log_level_stdout"]
+    log_level_file, log_level_stdout = get_log_levels("dfir-iris")
     mlog = logging_helper.Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
     if PB_ENABLED == False:
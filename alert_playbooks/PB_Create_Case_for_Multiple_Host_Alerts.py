@@ -22,7 +22,7 @@ PB_ENABLED = True
 from typing import Union, List
 import lib.logging_helper as logging_helper
 from lib.class_helper import CaseFile, AuditLog, Alert
-from lib.config_helper import Config
+from lib.config_helper import get_log_levels
 import lib.iris_helper as iris_helper
 
 COUNT_ALERTS_FROM_SAME_HOST = 2
@@ -35,10 +35,7 @@ def irsoar_handle_alerts(alerts: Alert, Test: bool = False):
         alerts (Alert): The alert to handle
     """
     # Prepare the logger
-    cfg = Config().cfg
-    config = cfg["integrations"]["dfir-iris"]
-    log_level_file = config["logging"]["log_level_file"]
-    log_level_stdout = config["logging"]["log_level_stdout"]
+    log_level_file, log_level_stdout = get_log_levels("dfir-iris")
     mlog = logging_helper.Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
     if PB_ENABLED == False:
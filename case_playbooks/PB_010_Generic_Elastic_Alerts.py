@@ -24,7 +24,7 @@ PB_ENABLED = True
 from typing import Union, List
 import lib.logging_helper as logging_helper
 from lib.class_helper import CaseFile, AuditLog, Alert
-from lib.config_helper import Config
+from lib.config_helper import get_log_levels
 
 from case_playbooks.bb_elastic_context_fetcher import (
     bb_get_context_process_children,
@@ -36,9 +36,7 @@ from case_playbooks.bb_elastic_context_fetcher import (
 )
 
 # Prepare the logger
-cfg = Config().cfg
-log_level_file = cfg["integrations"]["elastic_siem"]["logging"]["log_level_file"]
-log_level_stdout = cfg["integrations"]["elastic_siem"]["logging"]["log_level_stdout"]
+log_level_file, log_level_stdout = get_log_levels("elastic_siem")
 mlog = logging_helper.Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
 
@@ -22,13 +22,11 @@ PB_ENABLED = True
 
 from lib.class_helper import CaseFile, AuditLog, Alert, ContextLog, ContextFlow, ContextFile
 from lib.logging_helper import Log
-from lib.config_helper import Config
+from lib.config_helper import get_log_levels
 from integrations.ibm_qradar import irsoar_provide_context_for_alerts
 
 # Prepare the logger
-cfg = Config().cfg
-log_level_file = cfg["integrations"]["ibm_qradar"]["logging"]["log_level_file"]
-log_level_stdout = cfg["integrations"]["ibm_qradar"]["logging"]["log_level_stdout"]
+log_level_file, log_level_stdout = get_log_levels("ibm_qradar")
 mlog = Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
 
@@ -21,13 +21,11 @@ PB_ENABLED = True
 
 from lib.class_helper import CaseFile, AuditLog, Alert, ContextLog, ContextFlow, ContextFile, Rule
 from lib.logging_helper import Log
-from lib.config_helper import Config
-from lib.generic_helper import format_results, dict_get
+from lib.config_helper import get_log_levels
+from lib.generic_helper import format_results
 
 # Prepare the logger
-cfg = Config().cfg
-log_level_file = cfg["integrations"]["ibm_qradar"]["logging"]["log_level_file"]
-log_level_stdout = cfg["integrations"]["ibm_qradar"]["logging"]["log_level_stdout"]
+log_level_file, log_level_stdout = get_log_levels("ibm_qradar")
 mlog = Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
 
@@ -44,23 +42,24 @@ def irsoar_can_handle_alert(case_file: CaseFile) -> bool:
         mlog.info(f"Playbook '{PB_NAME}' is disabled. Not handling alert.")
         return False
 
-    for alert in case_file.alerts:
-        # Check if any of the detecions of the alert case is a QRadar Offense
-        try:
-            case_file.get_iris_case_number()
-        except ValueError:
-            mlog.info(f"Playbook '{PB_NAME}' cannot handle alert '{alert.name}' ({alert.uuid}), as there is noiris-casein it.")
-            return False
-
-        if alert.vendor_id == "IBM QRadar":
-            for log in case_file.context_logs:
-                if (
-                    dict_get(log.custom_fields, "Alert - Signature") != None
-                    and dict_get(log.custom_fields, "Alert - Action") != "store"
-                ):
-                    mlog.info(f"Playbook '{PB_NAME}' can handle alert '{alert.name}' ({alert.uuid}).")
-                    return True
-    mlog.info(f"Playbook '{PB_NAME}' cannot handle alert '{alert.name}' ({alert.uuid}).")
+    # The iris-case does not depend on the alert, so it only has to be checked once
+    try:
+        case_file.get_iris_case_number()
+    except ValueError:
+        mlog.info(f"Playbook '{PB_NAME}' cannot handle case '{case_file.uuid}', as there is no iris-case in it.")
+        return False
+
+    # Check if any of the detecions of the alert case is a QRadar Offense
+    if not any(alert.vendor_id == "IBM QRadar" for alert in case_file.alerts):
+        mlog.info(f"Playbook '{PB_NAME}' cannot handle case '{case_file.uuid}', as there is no QRadar alert in it.")
+        return False
+
+    # get_suricata_index() yields lazily, so any() stops reading context_logs at the first Suricata log that was not only stored
+    if any(entry[4] != "store" for entry in case_file.get_suricata_index()):
+        mlog.info(f"Playbook '{PB_NAME}' can handle case '{case_file.uuid}'.")
+        return True
+
+    mlog.info(f"Playbook '{PB_NAME}' cannot handle case '{case_file.uuid}'.")
     return False
 
 
@@ -75,11 +74,8 @@ def irsoar_handle_alert(case_file: CaseFile, DRY_RUN=False) -> CaseFile:
         CaseFile: The alert case with the context processes
     """
     alert_title = case_file.get_title()
-    alerts_to_handle = []
-    for alert in case_file.alerts:
-        if alert.vendor_id == "IBM QRadar":
-            mlog.debug(f"Adding alert: '{alert.name}' ({alert.uuid}) to list.")
-            alerts_to_handle.append(alert)
+    alerts_to_handle = [alert for alert in case_file.alerts if alert.vendor_id == "IBM QRadar"]
+    mlog.debug(f"Found {len(alerts_to_handle)} QRadar alerts in case to handle.")
 
     if len(alerts_to_handle) == 0:
         mlog.critical("Found no alerts in alert case to handle.")
@@ -96,8 +92,6 @@ def irsoar_handle_alert(case_file: CaseFile, DRY_RUN=False) -> CaseFile:
     )
     case_file.update_audit(current_action, logger=mlog)
 
-    rules_new = []
-
     # The following fields are parsed from the Suricata Alert:
     #           '"Alert - Created"',
     #            '"Alert - Action"',
@@ -108,20 +102,19 @@ def irsoar_handle_alert(case_file: CaseFile, DRY_RUN=False) -> CaseFile:
     #            '"Alert - Signature"',
     #            '"Alert - Updated"',
 
-    for log in case_file.context_logs:
-        custom_fields = log.custom_fields
-        if dict_get(custom_fields, "Alert - Signature") != None:
-            rule = Rule(
-                dict_get(custom_fields, "Alert - SID", "Unknown"),
-                custom_fields["Alert - Signature"],
-                custom_fields["Alert - Severity"],
-                description="Category: " + custom_fields["Alert - Category"],
-                tags=["Suricata", custom_fields["Alert - Category"]],
-                raw=str(custom_fields),
-                updated_at=dict_get(custom_fields, "Alert - Updated"),
-            )
-            rules_new.append(rule)
-            # TODO: Add 'query' of Suricata rules from external source
+    rules_new = []
+    for sid, signature, severity, category, action, updated, custom_fields in case_file.get_suricata_index():
+        rule = Rule(
+            sid,
+            signature,
+            severity,
+            description="Category: " + str(category),
+            tags=["Suricata", category],
+            raw=str(custom_fields),
+            updated_at=updated,
+        )
+        rules_new.append(rule)
+        # TODO: Add 'query' of Suricata rules from external source
 
     alert.rules.append(rules_new)
     case_file.update_audit(current_action.set_successful(message="Successfully added rules to alert."), logger=mlog)
@@ -143,20 +136,17 @@ def irsoar_handle_alert(case_file: CaseFile, DRY_RUN=False) -> CaseFile:
             current_action.set_warning(warning_message="No Suricata rules were found. Adding empty note."), logger=mlog
         )
 
-    note_body = "<h2>Suricata Alert Rules</h2>"
-    note_body += "<p>These are the Suricata Alert Rules that were parsed from the ContextLogs:</p>"
-    note_body += "<br><br>"
-    note_body += format_results(rules_new, "html", "")
+    note_body = (
+        "<h2>Suricata Alert Rules</h2>"
+        "<p>These are the Suricata Alert Rules that were parsed from the ContextLogs:</p>"
+        "<br><br>" + format_results(rules_new, "html", "")
+    )
 
-    article_id = irsoar_add_note_to_iris_case(iris_case_number, "raw", DRY_RUN, note_title, note_body, "text/html")
-    if article_id is None:
-        mlog.critical(f"Could not add note toiris-case'{iris_case_number}'.")
-        case_file.update_audit(
-            current_action.set_error(message=f"Could not add note toiris-case'{iris_case_number}'."), logger=mlog
-        )
-        return case_file
+    # The note is sent to the iris-case together with the other queued updates once the case is handled
+    if not DRY_RUN:
+        case_file.queue_note(note_title, note_body, group_title="IRIS-SOAR Suricata")
     case_file.update_audit(
-        current_action.set_successful(message=f"Successfully added note toiris-case'{iris_case_number}'."), logger=mlog
+        current_action.set_successful(message=f"Successfully queued note for iris-case '{iris_case_number}'."), logger=mlog
     )
 
     # Updateiris-casetitle to include the Suricata Alert Signature
@@ -172,57 +162,33 @@ def irsoar_handle_alert(case_file: CaseFile, DRY_RUN=False) -> CaseFile:
         )
         return case_file
 
-    title = "[IRIS-SOAR] Suricata Alert: "
-    title_rule = rules_new[0].name
-    title += title_rule
-
-    # Search each rule for any other unique rule name that is not the first one
-    new_rule_names = []
-    for rule in rules_new:
-        new_rule_names.append(rule.name)
-    new_rule_names = list(set(new_rule_names))
-
-    if len(new_rule_names) > 1:
-        for rule_name in new_rule_names:
-            if rule_name != title_rule:
-                title += ", " + rule_name
-
-    offender = []
-    for log in case_file.context_logs:
-        if log.source_device is not None:
-            offender.append(log.source_device.name)
-
-    if len(offender) == 0:
-        offender.append(log.source_ip)
-    if len(offender) == 1:
-        title += " | Offender: " + str(offender[0])
-    else:
-        offender = list(set(offender))
-        title += " | Offender: " + ", ".join(offender)
+    # Unique rule names and offenders in order of appearance (keeps the title stable between runs)
+    new_rule_names = list(dict.fromkeys(rule.name for rule in rules_new))
+    title = "[IRIS-SOAR] Suricata Alert: " + ", ".join(new_rule_names)
+
+    # The offenders are taken from all context logs, not only the ones with a Suricata alert
+    offender = [log.source_device.name for log in case_file.context_logs if log.source_device is not None]
+    if len(offender) == 0 and len(case_file.context_logs) > 0:
+        offender.append(case_file.context_logs[-1].source_ip)
+    offender = list(dict.fromkeys(str(name) for name in offender))
+    title += " | Offender: " + ", ".join(offender)
 
     mlog.info(f"Crafted newiris-casetitle: '{title}'")
 
-    iris_case_number = irsoar_update_iris_case_title(case_file, title)
-    if iris_case_number is None or type(iris_case_number) == Exception:
-        mlog.critical(f"Could not updateiris-case'{iris_case_number}'.")
-        case_file.update_audit(current_action.set_error(message=f"Could not updateiris-case'{iris_case_number}'."), logger=mlog)
-        return case_file
+    if not DRY_RUN:
+        case_file.queue_title_update(title)
     case_file.update_audit(
-        current_action.set_successful(message=f"Successfully updatediris-case'{iris_case_number}' title to '{title}'."),
+        current_action.set_successful(message=f"Successfully queued title update of iris-case '{iris_case_number}' to '{title}'."),
         logger=mlog,
     )
 
     # Update Alert severity
     current_action = AuditLog(PB_NAME, 4, "Updating alert severity.", "Updating alert severity based on Suricata Alert Severity.")
     case_file.update_audit(current_action, logger=mlog)
-    max_severity = 0
-    for rule in rules_new:
-        if rule.severity and int(rule.severity) > max_severity:
-            max_severity = int(rule.severity)
+    max_severity = max((int(rule.severity) for rule in rules_new if rule.severity), default=0)
 
     if max_severity > 0:
-        alert.severity = max_severity * 10
-        case_file.alerts[0] = alert
+        alert.severity = max_severity * 10  # 'alert' is the same object as in case_file.alerts
         case_file.update_audit(
             current_action.set_successful(message=f"Successfully updated alert severity to '{max_severity}'."), logger=mlog
         )
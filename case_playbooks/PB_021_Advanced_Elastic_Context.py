@@ -36,7 +36,7 @@ from lib.class_helper import (
     ContextRegistry,
 )
 from lib.logging_helper import Log
-from lib.config_helper import Config
+from lib.config_helper import Config, get_log_levels
 from integrations.elastic_siem import irsoar_provide_context_for_alerts
 from lib.generic_helper import format_results, dict_get
 from case_playbooks.bb_elastic_context_fetcher import (
@@ -49,9 +49,7 @@ from case_playbooks.bb_elastic_context_fetcher import (
 )
 
 # Prepare the logger
-cfg = Config().cfg
-log_level_file = cfg["integrations"]["ibm_qradar"]["logging"]["log_level_file"]
-log_level_stdout = cfg["integrations"]["ibm_qradar"]["logging"]["log_level_stdout"]
+log_level_file, log_level_stdout = get_log_levels("ibm_qradar")
 mlog = Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
 
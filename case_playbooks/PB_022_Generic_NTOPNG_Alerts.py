@@ -21,13 +21,11 @@ PB_ENABLED = True
 
 from lib.class_helper import CaseFile, AuditLog, Alert, ContextLog, ContextFlow, ContextFile, Rule
 from lib.logging_helper import Log
-from lib.config_helper import Config
-from lib.generic_helper import format_results, dict_get
+from lib.config_helper import get_log_levels
+from lib.generic_helper import format_results
 
 # Prepare the logger
-cfg = Config().cfg
-log_level_file = cfg["integrations"]["ibm_qradar"]["logging"]["log_level_file"]
-log_level_stdout = cfg["integrations"]["ibm_qradar"]["logging"]["log_level_stdout"]
+log_level_file, log_level_stdout = get_log_levels("ibm_qradar")
 mlog = Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
 
@@ -54,9 +52,11 @@ def irsoar_can_handle_alert(case_file: CaseFile) -> bool:
 
         if alert.vendor_id == "IBM QRadar":
             for log in case_file.context_logs:
+                custom_fields = log.custom_fields
                 if (
-                    dict_get(log.custom_fields, "Alert - Signature") != None
-                    and dict_get(log.custom_fields, "Alert - Action") == "store"
+                    custom_fields
+                    and "Alert - Signature" in custom_fields
+                    and custom_fields.get("Alert - Action") == "store"
                 ):
                     mlog.info(f"Playbook '{PB_NAME}' can handle alert '{alert.name}' ({alert.uuid}).")
                     return True
@@ -110,15 +110,15 @@ def irsoar_handle_alert(case_file: CaseFile, DRY_RUN=False) -> CaseFile:
 
     for log in case_file.context_logs:
         custom_fields = log.custom_fields
-        if dict_get(custom_fields, "Alert - Signature") != None:
+        if custom_fields and "Alert - Signature" in custom_fields:
             rule = Rule(
-                dict_get(custom_fields, "Alert - SID", "Unknown"),
+                custom_fields.get("Alert - SID", "Unknown"),
                 custom_fields["Alert - Signature"],
                 custom_fields["Alert - Severity"],
                 description="Category: " + custom_fields["Alert - Category"],
                 tags=["NTOP-NG", custom_fields["Alert - Category"]],
                 raw=str(custom_fields),
-                updated_at=dict_get(custom_fields, "Alert - Updated"),
+                updated_at=custom_fields.get("Alert - Updated"),
             )
             rules_new.append(rule)
             # TODO: Add 'query' of NTOP-NG rules from external source
@@ -36,15 +36,14 @@ from typing import Union, List
 
 import lib.logging_helper as logging_helper
 from lib.class_helper import CaseFile, ContextProcess, AuditLog, Alert, ContextThreatIntel, DNSQuery, HTTP
-from lib.config_helper import Config
+from lib.config_helper import Config, get_log_levels
 from lib.generic_helper import cast_to_ipaddress, format_results, is_local_tld
 
 from integrations.virus_total import irsoar_provide_context_for_alerts
 
 # Prepare the logger
 cfg = Config().cfg
-log_level_file = cfg["integrations"]["virus_total"]["logging"]["log_level_file"]
-log_level_stdout = cfg["integrations"]["virus_total"]["logging"]["log_level_stdout"]
+log_level_file, log_level_stdout = get_log_levels("virus_total")
 mlog = logging_helper.Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
 
@@ -25,15 +25,14 @@ NOTIFY_RESOLVED_CASES = True  # If resolved cases should still be notified
 
 import lib.logging_helper as logging_helper
 from lib.class_helper import CaseFile, AuditLog
-from lib.config_helper import Config
+from lib.config_helper import Config, get_log_levels
 from lib.generic_helper import handle_percentage
 
 from integrations.matrix_notify import irsoar_notify
 
 # Prepare the logger
 cfg = Config().cfg
-log_level_file = cfg["integrations"]["matrix_notify"]["logging"]["log_level_file"]
-log_level_stdout = cfg["integrations"]["matrix_notify"]["logging"]["log_level_stdout"]
+log_level_file, log_level_stdout = get_log_levels("matrix_notify")
 mlog = logging_helper.Log("playbooks." + PB_NAME, log_level_file, log_level_stdout)
 
 
@@ -40,12 +40,11 @@ import uuid
 import lib.logging_helper as logging_helper
 from lib.class_helper import CaseFile, ContextProcess, ContextFlow, ContextFile, ContextRegistry
 from integrations.elastic_siem import irsoar_provide_context_for_alerts
-from lib.config_helper import Config
+from lib.config_helper import Config, get_log_levels
 
 # Prepare the logger
 cfg = Config().cfg
-log_level_file = cfg["integrations"]["elastic_siem"]["logging"]["log_level_file"]
-log_level_stdout = cfg["integrations"]["elastic_siem"]["logging"]["log_level_stdout"]
+log_level_file, log_level_stdout = get_log_levels("elastic_siem")
 mlog = logging_helper.Log("playbooks." + BB_NAME, log_level_file, log_level_stdout)
 
 
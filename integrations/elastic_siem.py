@@ -141,7 +141,7 @@ def init_logging(config):
     log_level_stdout = config["logging"]["log_level_stdout"]
     log_level_syslog = config["logging"]["log_level_syslog"]
 
-    mlog = logging_helper.Log(__name__, log_level_stdout=log_level_stdout, log_level_file=log_level_file)
+    mlog = logging_helper.get_log(__name__, log_level_stdout=log_level_stdout, log_level_file=log_level_file)
 
     # Disable elasticsearch warnings (you can remove this if you want to see the warnings)
     es_log = logging.getLogger("elasticsearch")
@@ -339,7 +339,7 @@ def init_logging(config):
     log_level_stdout = config["logging"]["log_level_stdout"]
     log_level_syslog = config["logging"]["log_level_syslog"]
 
-    mlog = logging_helper.Log(__name__, log_level_stdout=log_level_stdout, log_level_file=log_level_file)
+    mlog = logging_helper.get_log(__name__, log_level_stdout=log_level_stdout, log_level_file=log_level_file)
     return mlog
 
 
@@ -723,9 +723,11 @@ def create_logs_from_events(mlog, offense_id, all_events):
 
     mlog.debug("Creating logs from events...")
     log_list = []
+    debug = mlog.is_enabled_for("DEBUG")  # Checked once, so the events and logs are only formatted when they are logged
 
     for event in all_events:
-        mlog.debug("Creating log from event: " + str(event))
+        if debug:
+            mlog.debug("Creating log from event: " + str(event))
 
         try:
             device = None
@@ -779,7 +781,8 @@ def create_logs_from_events(mlog, offense_id, all_events):
                 ]
             }
 
-            mlog.debug("Creating log context for event: " + repr(event))
+            if debug:
+                mlog.debug("Creating log context for event: " + repr(event))
             log = ContextLog(
                 offense_id,
                 event["Log Source Time"],
@@ -791,7 +794,8 @@ def create_logs_from_events(mlog, offense_id, all_events):
                 log_severity=severity,
                 log_custom_fields=custom_fields,
             )
-            mlog.debug("Log context created: " + str(log))
+            if debug:
+                mlog.debug("Log context created: " + str(log))
             log_list.append(log)
 
         except KeyError as e:
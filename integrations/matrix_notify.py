@@ -8,7 +8,7 @@
 #
 # Integration Version: 0.0.1
 from lib.generic_helper import get_from_cache, add_to_cache, dict_get
-from lib.logging_helper import Log
+from lib.logging_helper import get_log
 import matrix_client.api as matrix_client_api
 import traceback
 
@@ -23,7 +23,7 @@ def irsoar_notify(config: dict, message: str, allow_multiple: bool = False) -> b
 
     :return: True if the notification was sent successfully, False otherwise.
     """
-    mlog = Log(
+    mlog = get_log(
         "matrix_notify",
         log_level_file=config["logging"]["log_level_file"],
         log_level_stdout=config["logging"]["log_level_stdout"],
@@ -190,61 +190,7 @@ def handle_response(
                             property = property.split(":")
                             whois_dict[property[0]] = property[1]
 
-                    whois = Whois(
-                        domain_name=dict_get(whois_dict, "domain_name"),
-                        registry_domain_id=dict_get(whois_dict, "registry_domain_id"),
-                        registrar_whois_server=dict_get(whois_dict, "registrar_whois_server"),
-                        registrar_url=dict_get(whois_dict, "registrar_url"),
-                        updated_date=dict_get(whois_dict, "updated_date"),
-                        creation_date=dict_get(whois_dict, "creation_date"),
-                        registry_expiry_date=dict_get(whois_dict, "registry_expiry_date"),
-                        registrar=dict_get(whois_dict, "registrar"),
-                        registrar_abuse_contact_email=dict_get(whois_dict, "registrar_abuse_contact_email"),
-                        registrar_abuse_contact_phone=dict_get(whois_dict, "registrar_abuse_contact_phone"),
-                        domain_status=dict_get(whois_dict, "domain_status"),
-                        registry_registrant_id=dict_get(whois_dict, "registry_registrant_id"),
-                        registrant_name=dict_get(whois_dict, "registrant_name"),
-                        registrant_organization=dict_get(whois_dict, "registrant_organization"),
-                        registrant_street=dict_get(whois_dict, "registrant_street"),
-                        registrant_city=dict_get(whois_dict, "registrant_city"),
-                        registrant_state_province=dict_get(whois_dict, "registrant_state_province"),
-                        registrant_postal_code=dict_get(whois_dict, "registrant_postal_code"),
-                        registrant_country=dict_get(whois_dict, "registrant_country"),
-                        registrant_phone=dict_get(whois_dict, "registrant_phone"),
-                        registrant_phone_ext=dict_get(whois_dict, "registrant_phone_ext"),
-                        registrant_fax=dict_get(whois_dict, "registrant_fax"),
-                        registrant_fax_ext=dict_get(whois_dict, "registrant_fax_ext"),
-                        registrant_email=dict_get(whois_dict, "registrant_email"),
-                        registry_admin_id=dict_get(whois_dict, "registry_admin_id"),
-                        admin_name=dict_get(whois_dict, "admin_name"),
-                        admin_organization=dict_get(whois_dict, "admin_organization"),
-                        admin_street=dict_get(whois_dict, "admin_street"),
-                        admin_city=dict_get(whois_dict, "admin_city"),
-                        admin_state_province=dict_get(whois_dict, "admin_state_province"),
-                        admin_postal_code=dict_get(whois_dict, "admin_postal_code"),
-                        admin_country=dict_get(whois_dict, "admin_country"),
-                        admin_phone=dict_get(whois_dict, "admin_phone"),
-                        admin_phone_ext=dict_get(whois_dict, "admin_phone_ext"),
-                        admin_fax=dict_get(whois_dict, "admin_fax"),
-                        admin_fax_ext=dict_get(whois_dict, "admin_fax_ext"),
-                        admin_email=dict_get(whois_dict, "admin_email"),
-                        registry_tech_id=dict_get(whois_dict, "registry_tech_id"),
-                        tech_name=dict_get(whois_dict, "tech_name"),
-                        tech_organization=dict_get(whois_dict, "tech_organization"),
-                        tech_street=dict_get(whois_dict, "tech_street"),
-                        tech_city=dict_get(whois_dict, "tech_city"),
-                        tech_state_province=dict_get(whois_dict, "tech_state_province"),
-                        tech_postal_code=dict_get(whois_dict, "tech_postal_code"),
-                        tech_country=dict_get(whois_dict, "tech_country"),
-                        tech_phone=dict_get(whois_dict, "tech_phone"),
-                        tech_phone_ext=dict_get(whois_dict, "tech_phone_ext"),
-                        tech_fax=dict_get(whois_dict, "tech_fax"),
-                        tech_fax_ext=dict_get(whois_dict, "tech_fax_ext"),
-                        tech_email=dict_get(whois_dict, "tech_email"),
-                        name_server1=dict_get(whois_dict, "name_server1"),
-                        name_server2=dict_get(whois_dict, "name_server2"),
-                        dnssec=dict_get(whois_dict, "dnssec"),
-                    )
+                    whois = Whois(**{attr: dict_get(whois_dict, attr) for attr in Whois.__slots__})
                     context.whois = whois
                     mlog.debug(f"Added WHOIS information: {str(whois)}")
 
@@ -341,7 +287,7 @@ def irsoar_provide_context_for_alerts(
     ]  # be aware that only configs from this integration are available not the general config
     log_level_stdout = config["logging"]["log_level_stdout"]
     log_level_syslog = config["logging"]["log_level_syslog"]
-    mlog = logging_helper.Log(__name__, log_level_stdout=log_level_stdout, log_level_file=log_level_file)
+    mlog = logging_helper.get_log(__name__, log_level_stdout=log_level_stdout, log_level_file=log_level_file)
 
     # Check if the required type is supported
     if required_type not in [ContextThreatIntel]:
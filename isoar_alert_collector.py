@@ -179,47 +179,47 @@ def main(config, fromDaemon=False, debug=False):
             # Try to expand fill context dict fields:
             try:
                 alert: class_helper.Alert = alert
-                file_dict = alert.file.__dict__() if alert.file else {}
+                file_dict = alert.file.to_dict() if alert.file else {}
                 alert_context_dict = del_none_from_dict(file_dict)
 
                 # Add the device
-                device_dict = alert.device.__dict__() if alert.device else {}
+                device_dict = alert.device.to_dict() if alert.device else {}
                 alert_context_dict |= del_none_from_dict(device_dict)
 
                 # Add the flow
-                flow_dict = alert.flow.__dict__() if alert.flow else {}
+                flow_dict = alert.flow.to_dict() if alert.flow else {}
                 alert_context_dict |= del_none_from_dict(flow_dict)
 
                 # Add the log
-                log_dict = alert.log.__dict__() if alert.log else {}
+                log_dict = alert.log.to_dict() if alert.log else {}
                 alert_context_dict |= del_none_from_dict(log_dict)
 
                 # Add the process
-                process_dict = alert.process.__dict__() if alert.process else {}
+                process_dict = alert.process.to_dict() if alert.process else {}
                 alert_context_dict |= del_none_from_dict(process_dict)
 
                 # Add the threat_intel
-                threat_intel_dict = alert.threat_intel.__dict__() if alert.threat_intel else {}
+                threat_intel_dict = alert.threat_intel.to_dict() if alert.threat_intel else {}
                 alert_context_dict |= del_none_from_dict(threat_intel_dict)
 
                 # Add the location
-                location_dict = alert.location.__dict__() if alert.location else {}
+                location_dict = alert.location.to_dict() if alert.location else {}
                 alert_context_dict |= del_none_from_dict(location_dict)
 
                 # Add the user
-                user_dict = alert.user.__dict__() if alert.user else {}
+                user_dict = alert.user.to_dict() if alert.user else {}
                 alert_context_dict |= del_none_from_dict(user_dict)
 
                 # Add the registry
-                registry_dict = alert.registry.__dict__() if alert.registry else {}
+                registry_dict = alert.registry.to_dict() if alert.registry else {}
                 alert_context_dict |= del_none_from_dict(registry_dict)
 
                 # Add the http
-                http_dict = alert.flow.http.__dict__() if alert.flow and alert.flow.http else {}
+                http_dict = alert.flow.http.to_dict() if alert.flow and alert.flow.http else {}
                 alert_context_dict |= del_none_from_dict(http_dict)
 
                 # Add the dns
-                dns_dict = alert.flow.dns_query.__dict__() if alert.flow and alert.flow.dns_query else {}
+                dns_dict = alert.flow.dns_query.to_dict() if alert.flow and alert.flow.dns_query else {}
                 alert_context_dict |= del_none_from_dict(dns_dict)
 
                 # Add 'highlighted fields'
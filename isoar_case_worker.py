@@ -13,6 +13,10 @@
 
 import traceback
 import json
+import importlib
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from dfir_iris_client.session import ClientSession
 from dfir_iris_client.alert import Alert
@@ -29,7 +33,7 @@ THRESHOLD_CLOSE_ALERTS_MINUTES = (
 
 
 def check_module_exists(module_name, alert_playbook=False, case_playbook=False):
-    """Checks if a module exists.
+    """Checks if a module exists (without executing it).
 
     Args:
         module_name (str): The name of the module
@@ -37,19 +41,53 @@ def check_module_exists(module_name, alert_playbook=False, case_playbook=False):
     Returns:
         bool: True if the module exists, False if not
     """
+    if alert_playbook:
+        package = "alert_playbooks."
+    elif case_playbook:
+        package = "case_playbooks."
+    else:
+        package = "integrations."
+
     try:
-        if not alert_playbook:
-            __import__("integrations." + module_name)
-        else:
-            if alert_playbook:
-                __import__("alert_playbooks." + module_name)
-            elif case_playbook:
-                __import__("case_playbooks." + module_name)
-        return True
+        return importlib.util.find_spec(package + module_name) is not None
     except ModuleNotFoundError:
         return False
     except ImportError:
         return False
+    except ValueError:
+        return False
+
+
+def load_playbook_modules(playbooks_config, mlog, alert_playbook=False, case_playbook=False):
+    """Imports every enabled and existing playbook once.
+
+    Args:
+        playbooks_config (dict): The playbook section of the config (playbook name -> settings)
+        mlog (Log): The logger object
+        alert_playbook (bool): If the playbooks are alert_playbooks
+        case_playbook (bool): If the playbooks are case_playbooks
+
+    Returns:
+        dict: The imported playbook modules keyed by playbook name (in config order)
+    """
+    package = "alert_playbooks." if alert_playbook else "case_playbooks."
+    playbook_modules = {}
+    for playbook_name, playbook_config in playbooks_config.items():
+        # Check if the playbook is enabled
+        if not playbook_config["enabled"]:
+            mlog.warning("The playbook " + playbook_name + " is disabled. Skipping.")
+            continue
+
+        # Check if the playbook exists
+        if not check_module_exists(playbook_name, alert_playbook=alert_playbook, case_playbook=case_playbook):
+            mlog.error("The playbook " + playbook_name + " does not exist. Skipping.")
+            continue
+
+        try:
+            playbook_modules[playbook_name] = importlib.import_module(package + playbook_name)
+        except Exception as e:
+            mlog.error("The playbook " + playbook_name + " could not be imported. Skipping. Error: " + traceback.format_exc())
+    return playbook_modules
 
 
 def check_module_has_function(module_name, function_name, mlog):
@@ -108,36 +146,22 @@ def main(config, fromDaemon=False, debug=False):
     )
 
     # Get all alert in DFIR-IRIS that are 'new' or 'pending'
-
-    # Get all alerts that are 'new'
-    alert_obj_new = Alert(session)
-    response_new = alert_obj_new.filter_alerts(alert_status_id=2)
-
-    if not response_new.is_success:
-        mlog.error("Failed to get alerts from DFIR-IRIS. Error: " + response_new.log_error())
-        return
-    else:
-        mlog.info("Successfully requested alerts from DFIR-IRIS (new).")
-        # print(response.get_data())
-        alerts = response_new.get_data_field("alerts")
-
-        if not alerts:
-            mlog.info("No new alerts found.")
-
-    # Get all alerts that are 'pending'
-    alert_obj_pending = Alert(session)
-    response_pending = alert_obj_pending.filter_alerts(alert_status_id=5)
-
-    if not response_pending.is_success:
-        mlog.error("Failed to get alerts from DFIR-IRIS. Error: " + response_pending.log_error())
-        return
-    else:
-        mlog.info("Successfully requested alerts from DFIR-IRIS (pending).")
-        # print(response.get_data())
-        alerts.extend(pending_alerts := response_pending.get_data_field("alerts"))
-
-        if not pending_alerts:
-            mlog.info("No pending alerts found.")
+    # (the filter endpoint only accepts a single status id, so one listing per status is needed)
+    alerts = []
+    alert_obj = Alert(session)
+    for status_name, status_id in (("new", 2), ("pending", 5)):
+        response = alert_obj.filter_alerts(alert_status_id=status_id)
+
+        if not response.is_success():
+            mlog.error("Failed to get alerts from DFIR-IRIS. Error: " + str(response.log_error()))
+            return
+        else:
+            mlog.info(f"Successfully requested alerts from DFIR-IRIS ({status_name}).")
+            status_alerts = response.get_data_field("alerts")
+            if not status_alerts:
+                mlog.info(f"No {status_name} alerts found.")
+            else:
+                alerts.extend(status_alerts)
 
     if len(alerts) == 0:
         mlog.info("No alerts found.")
@@ -145,6 +169,14 @@ def main(config, fromDaemon=False, debug=False):
 
     mlog.info("Successfully got {0} alerts from DFIR-IRIS.".format(len(alerts)))
 
+    # Fetch the full alert data for all alerts with one request instead of one request per alert
+    alert_ids = [alert["alert_id"] for alert in alerts if dict_get(alert, "alert_id") is not None]
+    try:
+        iris_alerts = class_helper.Alert.bulk_load_from_iris(session, alert_ids)
+    except Exception as e:
+        mlog.warning("Failed to bulk load alerts from DFIR-IRIS. Falling back to loading them one by one. Error: " + str(e))
+        iris_alerts = {}
+
     for alert in alerts:
         # Transform each Alert dict to a Alert object
         if dict_get(alert, "alert_title") is None:
@@ -155,11 +187,13 @@ def main(config, fromDaemon=False, debug=False):
             mlog.info(f"Transforming alert {alert['alert_title']} to Alert object...")
             alert_id = alert["alert_id"]
             alert_obj = class_helper.Alert()
-            alert_obj.load_from_iris(alert_id)
+            alert_obj.load_from_iris(alert_id, iris_alert=iris_alerts.get(alert_id))
             # alert_obj.iris_update_state("pending")
             alert_list.append(alert_obj)
         except Exception as e:
-            mlog.error(f"Failed to transform alert {alert['alert_title']} to Alert object. Error: " + traceback.format_exc())
+            mlog.error(f"Failed to transform alert {alert['alert_title']} to Alert object. Error: {e}")
+            if mlog.is_enabled_for("DEBUG"):
+                mlog.debug(traceback.format_exc())
             continue
 
     mlog.info("Finished transforming alerts to Alert objects.")
@@ -167,22 +201,11 @@ def main(config, fromDaemon=False, debug=False):
     # Now we must ask each "alert_playbook" if it wants to create a new case for (one- / multiple of-) the alerts. The playbook has to return the list of case objects it created.
     mlog.info("Asking alert_playbooks if they want to create a new case for the alerts...")
     case_list = []
-    for alert_playbook in config["alert_playbooks"]:
-        # Check if the alert_playbook is enabled
-        if not config["alert_playbooks"][alert_playbook]["enabled"]:
-            mlog.warning("The alert_playbook " + alert_playbook + " is disabled. Skipping.")
-            continue
-
-        # Check if the alert_playbook exists
-        if not check_module_exists(alert_playbook, alert_playbook=True):
-            mlog.error("The alert_playbook " + alert_playbook + " does not exist. Skipping.")
-            continue
-
+    alert_playbook_modules = load_playbook_modules(config["alert_playbooks"], mlog, alert_playbook=True)
+    for alert_playbook, alert_playbook_import in alert_playbook_modules.items():
         # Let the alert_playbook handle the alert
         try:
             mlog.info(f"Alert_playbook can handle the alerts. Calling it to handle.")
-            module_import = __import__("alert_playbooks." + alert_playbook)
-            alert_playbook_import = getattr(module_import, alert_playbook)
             case_list.append(alert_playbook_import.irsoar_handle_alerts(alert_list))
 
             # Set the status of the alert to 'pending'
@@ -200,9 +223,9 @@ def main(config, fromDaemon=False, debug=False):
                     alert.iris_update_state("pending")
 
         except Exception as e:
-            mlog.warning(
-                "The alert_playbook " + alert_playbook + " failed to handle the alerts. Error: " + traceback.format_exc()
-            )
+            mlog.warning(f"The alert_playbook {alert_playbook} failed to handle the alerts. Error: {e}")
+            if mlog.is_enabled_for("DEBUG"):
+                mlog.debug(traceback.format_exc())
             continue
 
     # Loop through each returned case and check if any case_playbook can handle it
@@ -210,38 +233,30 @@ def main(config, fromDaemon=False, debug=False):
         mlog.info("No case was created for the alerts. No case playbook will be called.")
         return
 
-    for case in case_list:
+    # Import the case_playbooks only once for all cases
+    case_playbooks_config = config["case_playbooks"] if "case_playbooks" in config else config["playbooks"]
+    playbook_modules = load_playbook_modules(case_playbooks_config, mlog, case_playbook=True)
+
+    case_file_history_lock = threading.Lock()
+
+    def handle_case(case):
+        """Lets every case_playbook check and handle the given case (runs in a worker thread)."""
         alert_title = case.get_title()
         alert_id = case.uuid
         alertHandled = False
 
         # Check every playbook if it can handle the alert
-        for playbook_name in config["playbooks"]:
-            # Check if the playbook is enabled
-            if not config["playbooks"][playbook_name]["enabled"]:
-                mlog.warning("The playbook " + playbook_name + " is disabled. Skipping.")
-                continue
-
-            # Check if the playbook exists
-            if not check_module_exists(playbook_name, case_playbook=True):
-                mlog.error("The playbook " + playbook_name + " does not exist. Skipping.")
-                continue
-
+        for playbook_name, playbook_import in playbook_modules.items():
             # Ask the playbook if it can handle the alert
             try:
                 mlog.info(
                     f"Calling playbook {playbook_name} to check if it can handle current alert '{alert_title}' ({str(alert_id)})"
                 )
-                module_import = __import__("playbooks." + playbook_name)
-                playbook_import = getattr(module_import, playbook_name)
                 can_handle = playbook_import.irsoar_can_handle_alert(case)
             except Exception as e:
-                mlog.warning(
-                    "The playbook "
-                    + playbook_name
-                    + " failed to check if it can handle the alert. Error: "
-                    + traceback.format_exc()
-                )
+                mlog.warning(f"The playbook {playbook_name} failed to check if it can handle the alert. Error: {e}")
+                if mlog.is_enabled_for("DEBUG"):
+                    mlog.debug(traceback.format_exc())
                 continue
 
             # Let the playbook handle the alert
@@ -250,9 +265,9 @@ def main(config, fromDaemon=False, debug=False):
                     mlog.info(f"Playbook can handle the alert. Calling it to handle: '{alert_title}' ({str(alert_id)})")
                     case_file_new = playbook_import.irsoar_handle_alert(case)
                 except Exception as e:
-                    mlog.warning(
-                        "The playbook " + playbook_name + " failed to handle the alert. Error: " + traceback.format_exc()
-                    )
+                    mlog.warning(f"The playbook {playbook_name} failed to handle the alert. Error: {e}")
+                    if mlog.is_enabled_for("DEBUG"):
+                        mlog.debug(traceback.format_exc())
                     continue
 
                 # Check if the playbook handled the alert correctly
@@ -266,7 +281,8 @@ def main(config, fromDaemon=False, debug=False):
                 # Add the alert case to the detectior case array
                 mlog.info(f"Adding alert case for alert {alert_title} ({str(alert_id)}) to the alert case array.")
                 case_file_new.playbooks.append(playbook_name)
-                case_file_history.append(case_file_new)
+                with case_file_history_lock:
+                    case_file_history.append(case_file_new)
             else:
                 mlog.info(f"Playbook can not handle the alert. Skipping.")
 
@@ -287,26 +303,41 @@ def main(config, fromDaemon=False, debug=False):
             if DEBUG_ADD_AUDIT_LOG_TO_IRIS_CASE:
                 mlog.debug("Adding audit log to iris_case...")
                 try:
-                    trail_str = ""
-                    for audit in case.audit_trail:
-                        if audit.result_had_errors:
-                            trail_str += "<p style='color:red'>"
-                        elif audit.result_had_warnings:
-                            trail_str += "<p style='color:orange'>"
-                        else:
-                            trail_str += "<p style='color:green'>"
-                        trail_str += str(audit).replace("\n", "<br>") + "</p><br>"
-                    # Add to iris-case
                     iris_case_number = case.get_iris_case_number()
-                    if not iris_case_number:
-                        mlog.warning("Could not add audit log toiris-casebecause noiris-casenumber was found.")
-                        continue
-                    iris_case = case.add_note_to_iris(title="(DEBUG) Audit Log Trail", group="IRIS-SOAR Audit", content=trail_str)
-                    mlog.info("Added audit log toiris-case" + str(iris_case_number) + ".")
-                except Exception as e:
-                    mlog.error(
-                        "Failed to add audit log toiris-case" + str(iris_case_number) + ". Error: " + traceback.format_exc()
-                    )
+                except ValueError:
+                    iris_case_number = None
+
+                if not iris_case_number:
+                    mlog.warning("Could not add audit log to iris-case because no iris-case number was found.")
+                else:
+                    try:
+                        trail_parts = []
+                        for audit in case.audit_trail:
+                            if audit.result_had_errors:
+                                color = "red"
+                            elif audit.result_had_warnings:
+                                color = "orange"
+                            else:
+                                color = "green"
+                            trail_parts.append(f"<p style='color:{color}'>" + str(audit).replace("\n", "<br>") + "</p><br>")
+                        trail_str = "".join(trail_parts)
+
+                        # Add to iris-case
+                        case.queue_note(title="(DEBUG) Audit Log Trail", content=trail_str, group_title="IRIS-SOAR Audit")
+                        mlog.info("Queued audit log for iris-case " + str(iris_case_number) + ".")
+                    except Exception as e:
+                        mlog.error(
+                            "Failed to add audit log to iris-case " + str(iris_case_number) + ". Error: " + traceback.format_exc()
+                        )
+
+        # Send all queued notes and title updates of the case to DFIR-IRIS at once
+        if not case.flush_iris_updates():
+            mlog.error("Failed to send the queued updates of case " + alert_title + " (" + str(alert_id) + ") to DFIR-IRIS.")
+
+    # The cases are independent of each other and handling them is mostly waiting for API calls, so they can be handled in parallel.
+    # Defaults to a single worker; more can be enabled with 'worker_threads' in the config.
+    with ThreadPoolExecutor(max_workers=config.get("worker_threads", 1)) as executor:
+        list(executor.map(handle_case, case_list))
 
     mlog.info("Finished worker script.")
 
@@ -2,35 +2,580 @@
 # Created by: Martin Offermann
 # This module is a helper module that privides important classes and functions for the IRIS-SOAR project.
 
-from typing import DefaultDict, Union, List
+from typing import DefaultDict, Iterator, Union, List
 import random
 import datetime
 import ipaddress
-import datetime
+import socket
 import json
+import sys
+import array
 import uuid
-import pandas as pd
-import traceback
+from uuid import uuid4
+from time import time_ns
+import threading
+import contextlib
+
+try:
+    import orjson  # Optional, speeds up the compact serialization of nested objects
+except ImportError:
+    orjson = None
 
 import lib.config_helper as config_helper
 import lib.logging_helper as logging_helper
 from lib.generic_helper import (
     del_none_from_dict,
     handle_percentage,
+    handle_percentages,
     cast_to_ipaddress,
     add_to_timeline,
     remove_duplicates_from_dict,
+    remove_duplicates_from_list,
     dict_get,
 )
 import lib.iris_helper as iris_helper
 
+mlog = logging_helper.get_log("lib.class_helper")
+
 DEFAULT_IP = ipaddress.ip_address("127.0.0.1")  # When no IP address is provided, this is used
 THRESHOLD_PROCESS_IO_BYTES = 100000  # Threshold for the process IO bytes (100 KB)
+INTERNED_CUSTOM_FIELDS = ("Alert - Action", "Alert - Category")  # Enum-like custom field values that are compared in playbooks
+_EMPTY_TUPLE = ()  # Shared default for list attributes that were not given
+_FLOW_ID_RNG = random.Random()  # Own generator for random flow IDs, independent of the shared module-level one
+_TRIVIAL_STRINGS = ("", "Unknown", "N/A")  # String values that are left out of the JSON representation like None
+
+# Valid values of the enum-like context fields
+_DNS_TYPES = frozenset(("A", "AAAA", "CNAME", "MX", "NS", "PTR", "SOA", "SRV", "TXT"))
+_HTTP_METHODS = frozenset(("GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH", "Unknown (Encrypted)"))
+_HTTP_TYPES = frozenset(("HTTP", "HTTPS"))
+_URL_SCHEMES = {"HTTP": "http://", "HTTPS": "https://"}  # HTTP.type -> prefix of HTTP.full_url
+_FLOW_DIRECTIONS = frozenset(("L2R", "R2L", "L2L", "R2R", None))
+# Flow direction by (source IP is private, destination IP is private)
+_FLOW_DIRECTION_BY_PRIVACY = {(True, True): "L2L", (True, False): "L2R", (False, True): "R2L", (False, False): "R2R"}
+_FW_ACTIONS = frozenset(("Permit", "Deny", "Deny / Failed Connection", "Reject", "Unknown"))
 
 # TODO: Implement all functions used by isoar_worker.py and its modules
 
 
-class Location:
+_BATCH_TIMESTAMP = threading.local()  # Holds the frozen creation timestamp of the current thread's batch_timestamp() block
+
+
+@contextlib.contextmanager
+def batch_timestamp():
+    """Freezes the creation timestamp of Location and Person objects to one value while the block runs (e.g. for bulk loads).
+
+    Yields:
+        datetime: The frozen timestamp
+    """
+    previous = getattr(_BATCH_TIMESTAMP, "now", None)
+    _BATCH_TIMESTAMP.now = datetime.datetime.now()
+    try:
+        yield _BATCH_TIMESTAMP.now
+    finally:
+        _BATCH_TIMESTAMP.now = previous
+
+
+# Datetimes are passed to default=str, so they look the same as with the json module, which also accepts non-string keys
+_ORJSON_COMPACT = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson is not None else None
+_ORJSON_INDENTED = _ORJSON_COMPACT | orjson.OPT_INDENT_2 if orjson is not None else None
+
+
+def _json_default(obj):
+    """The default= hook of the JSON serialization. Context objects are written as nested JSON objects, anything else with str()."""
+    to_json_dict = getattr(obj, "_to_json_dict", None)
+    if to_json_dict is not None:
+        return to_json_dict()
+    return str(obj)
+
+
+def _dumps_indented(dict_):
+    """Serializes a context dictionary for __str__() with a 2 space indent. Uses orjson if it is installed, else the json module.
+    Both produce the same text (UTF-8 instead of escaped non-ASCII characters, datetimes and other objects via _json_default()).
+    Note: Earlier versions wrote a 4 space indent with escaped non-ASCII characters. As this text ends up in IRIS notes
+    and logs, consumers that compare it literally have to expect the new format (the parsed JSON is the same).
+    """
+    if orjson is not None:
+        return orjson.dumps(dict_, option=_ORJSON_INDENTED, default=_json_default).decode()
+    return json.dumps(dict_, indent=2, ensure_ascii=False, sort_keys=False, default=_json_default)
+
+
+def _dumps_indented_bytes(dict_):
+    """Same as _dumps_indented(), but returns the UTF-8 encoded JSON. Skips the decode step if orjson is installed."""
+    if orjson is not None:
+        return orjson.dumps(dict_, option=_ORJSON_INDENTED, default=_json_default)
+    return json.dumps(dict_, indent=2, ensure_ascii=False, sort_keys=False, default=_json_default).encode()
+
+
+def _dumps_compact_bytes(dict_):
+    """Serializes a context dictionary to UTF-8 encoded JSON without indentation, e.g. for one line of NDJSON."""
+    if orjson is not None:
+        return orjson.dumps(dict_, option=_ORJSON_COMPACT, default=_json_default)
+    return json.dumps(dict_, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode()
+
+
+# Types whose string form can never be "[]", so del_none_from_dict() would always keep them
+_PLAIN_TYPES = frozenset((bool, int, float, datetime.datetime, uuid.UUID, ipaddress.IPv4Address, ipaddress.IPv6Address))
+_NONE_FILTERS = {}  # Class -> generated del_none_from_dict() replacement for the class' to_dict() keys
+
+
+def _compile_none_filter(cls_name, keys):
+    """Generates a function that returns a copy of a to_dict() result with the given keys, cleaned like del_none_from_dict().
+
+    The checks are unrolled per key and values of plain types and nested context objects skip the str(value) == "[]" test.
+    Raises KeyError if the dictionary has other keys, so that the caller can fall back to del_none_from_dict().
+
+    Args:
+        cls_name (str): The name of the class (used for the code object name)
+        keys (tuple): The keys of the class' to_dict() result
+
+    Returns:
+        function: The filter function
+    """
+    lines = ["def strip_none(d):", f"    if len(d) != {len(keys)}:", "        raise KeyError('other keys than on first use')", "    out = {}"]
+    for key in keys:
+        lines += [
+            f"    value = d[{key!r}]",
+            "    if value is not None:",
+            "        value_type = type(value)",
+            "        if value_type is str:",
+            "            if value not in _DROPPED_STRINGS:",
+            f"                out[{key!r}] = value",
+            "        elif value_type in _PLAIN_TYPES:",
+            f"            out[{key!r}] = value",
+            "        elif value_type is list:",
+            "            for item in value:",
+            "                if isinstance(item, dict):",
+            "                    del_none_from_dict(item)",
+            f"            out[{key!r}] = value",
+            "        elif hasattr(value, '_to_json_dict'):",  # Nested context objects are serialized once, by _json_default()
+            f"            out[{key!r}] = value",
+            "        elif str(value) != '[]':",
+            "            if isinstance(value, dict):",
+            "                del_none_from_dict(value)",
+            f"            out[{key!r}] = value",
+        ]
+    lines.append("    return out")
+    namespace = {
+        "_DROPPED_STRINGS": _TRIVIAL_STRINGS + ("[]",),
+        "_PLAIN_TYPES": _PLAIN_TYPES,
+        "del_none_from_dict": del_none_from_dict,
+    }
+    exec(compile("\n".join(lines) + "\n", f"<{cls_name} none filter>", "exec"), namespace)
+    return namespace["strip_none"]
+
+
+def _strip_none(cls, dict_):
+    """Same as del_none_from_dict(dict_) for a to_dict() result of the given class, using a filter generated on first use."""
+    strip_none = _NONE_FILTERS.get(cls)
+    if strip_none is None:
+        strip_none = _NONE_FILTERS[cls] = _compile_none_filter(cls.__name__, tuple(dict_))
+    try:
+        return strip_none(dict_)
+    except KeyError:  # to_dict() returned other keys than on first use
+        return del_none_from_dict(dict_)
+
+
+def _key_table(prefix, slots):
+    """Returns the {prefixed dict key: attribute name} table used by load_from_dict().
+
+    Private slots (e.g. '_local_ip') map to the property of the same public name.
+    """
+    return {prefix + name.lstrip("_"): name.lstrip("_") for name in slots if name != "_cached_json"}
+
+
+def _ns_to_datetime(value):
+    """Returns a creation time taken with time_ns() as a datetime. Other values (e.g. datetimes) are returned as they are."""
+    return datetime.datetime.fromtimestamp(value / 1e9) if type(value) is int else value
+
+
+def _utf8_len(text):
+    """Returns the UTF-8 encoded length of a string. ASCII strings are not encoded, as their length is the same."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _truncate_utf8(text, max_bytes):
+    """Truncates a string to at most max_bytes UTF-8 bytes, without splitting a character."""
+    if text.isascii():
+        return text[:max_bytes]
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", "ignore")
+
+
+def _intern(value):
+    """Interns a string value, so that equal low-cardinality values share one object. Other values are returned as they are."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _pack_ports(ports):
+    """Returns the given ports sorted and unique as an unsigned short array (2 bytes per port instead of a full int object).
+
+    Ports that do not fit into the array (e.g. strings) are returned as they are. No ports result in an empty tuple.
+    """
+    if not ports:
+        return _EMPTY_TUPLE
+    try:
+        return array.array("H", sorted(set(ports)))
+    except (TypeError, OverflowError):
+        return ports
+
+
+def _pack_ip(ip):
+    """Returns an IPv4 address as its 32-bit integer. Other values (e.g. IPv6 addresses or None) are returned as they are."""
+    return int(ip) if type(ip) is ipaddress.IPv4Address else ip
+
+
+def _pack_ips(ips):
+    """Returns a list of IP addresses packed with _pack_ip().
+
+    If all addresses are IPv4, they are returned as an unsigned int array instead (4 bytes per address). IPv4 strings are
+    parsed with socket.inet_pton() and converted in one pass, without creating an IPv4Address object for each of them.
+    """
+    packed = []
+    for ip in ips:
+        if type(ip) is str:
+            try:
+                packed.append(socket.inet_pton(socket.AF_INET, ip))
+                continue
+            except OSError:
+                pass
+        ip = cast_to_ipaddress(ip)
+        if type(ip) is not ipaddress.IPv4Address:
+            break
+        packed.append(ip.packed)
+    else:
+        ips_v4 = array.array("I")
+        ips_v4.frombytes(b"".join(packed))
+        if sys.byteorder == "little":
+            ips_v4.byteswap()  # inet_pton() returns network byte order
+        return ips_v4
+    return [_pack_ip(cast_to_ipaddress(ip)) for ip in ips]  # Mixed IPv4 and IPv6 addresses keep their order
+
+
+def _unpack_ip(ip):
+    """Reverses _pack_ip() and returns the IP address object."""
+    return ipaddress.IPv4Address(ip) if type(ip) is int else ip
+
+
+def _check_services(services, message):
+    """Raises a TypeError with the given message if any of the given objects is not a Service.
+
+    Checks the class-level '_iris_kind' tag instead of calling isinstance() for every item.
+    """
+    if any(getattr(service, "_iris_kind", None) != "service" for service in services):
+        raise TypeError(message)
+
+
+def _nested_str(item):
+    """Returns the string representation of an object that is nested in another object's dictionary."""
+    if isinstance(item, _CachedJSON):
+        return item.to_json(compact=True)
+    return str(item)
+
+
+def _str_list(items):
+    """Returns the string representation of every item in the given list."""
+    return [_nested_str(item) for item in items]
+
+
+def _nested_obj(item):
+    """Converter for fields that hold context objects (or lists of them).
+
+    to_dict() writes them with str(), while _to_json_dict() keeps the objects, so that they are serialized
+    as nested JSON by _json_default() instead of as escaped JSON strings.
+    """
+    return str(item)
+
+
+def _lazy_str(value):
+    """Converter for scalar fields that are not JSON types themselves (datetimes, IP addresses, UUIDs).
+
+    to_dict() writes them with str(), while _to_json_dict() keeps the raw values. They are only converted
+    if they are actually serialized (UUIDs natively by orjson, anything else by _json_default()).
+    """
+    return str(value)
+
+
+def _str_or_none(value):
+    """Returns str(value), but keeps None as None (instead of the string 'None'), like the generated to_dict() methods."""
+    return None if value is None else str(value)
+
+
+def _ref_list(items):
+    """Returns the UUIDs of the given items. Used for references between objects that are only expanded on request."""
+    return [item.uuid for item in items]
+
+
+def _records_to_objects(cls, records):
+    """Creates objects of the given class from a DataFrame or a list of prefixed dictionaries.
+
+    Args:
+        cls (type): The class to create the objects of. Has to define the '_PREFIX' of its dictionary keys
+            and may define its '_PERCENTAGE_FIELDS'.
+        records (Union[pd.DataFrame, List[dict]]): The records to load
+
+    Returns:
+        list: The created objects
+    """
+    import inspect
+    import pandas as pd  # Only needed for bulk loads, so they are not imported with the module
+
+    if not isinstance(records, pd.DataFrame):
+        records = pd.DataFrame(records, dtype=object)
+
+    records = records.rename(columns=lambda column: column.removeprefix(cls._PREFIX))
+    parameters = inspect.signature(cls).parameters
+    records = records[[column for column in records.columns if column in parameters]]
+    # pandas stores integer columns with missing values as float, so whole-number percentage columns are made integer again
+    for column in getattr(cls, "_PERCENTAGE_FIELDS", ()):
+        if column in records and records[column].dtype.kind == "f":
+            values = records[column].dropna()
+            if (values == values.round()).all():
+                records[column] = records[column].astype("Int64")
+    records = records.astype(object).where(records.notna(), None)  # Missing values have to be None, not NaN
+
+    # Percentage columns are validated once per column instead of once per object
+    for column in getattr(cls, "_PERCENTAGE_FIELDS", ()):
+        if column in records:
+            handle_percentages(records[column])
+    create = getattr(cls, "_from_trusted", cls)  # The records were already validated above
+    with batch_timestamp():
+        return [create(**record) for record in records.to_dict("records")]
+
+
+def _compile_serializers(cls_name, fields):
+    """Generates the to_dict() and _to_json_dict() methods of a class from its field table.
+
+    The field table is unrolled into plain Python source once, so serializing an object does not have to loop over the table.
+
+    Fields with the _ref_list converter are written as a list of UUIDs, unless the methods are called with expand=True.
+    Then the referenced objects are included as (compact, not further expanded) JSON strings instead.
+
+    Args:
+        cls_name (str): The name of the class (used in the docstrings and the code object names)
+        fields (tuple): A tuple of (key, attribute, converter) entries. The converter may be None.
+
+    Returns:
+        tuple: The to_dict() and _to_json_dict() functions
+    """
+    namespace = {"_nested_str": _nested_str, "_DROPPED_STRINGS": _TRIVIAL_STRINGS + ("[]",)}
+    dict_lines = []
+    json_lines = []
+    for index, (key, attr, convert) in enumerate(fields):
+        if convert is None:
+            expr = f"self.{attr}"
+        elif convert is _str_list:
+            expr = f"[_nested_str(item) for item in self.{attr}]"
+        elif convert is _ref_list:
+            expr = f"([_nested_str(item) for item in self.{attr}] if expand else [item.uuid for item in self.{attr}])"
+        else:
+            namespace[f"_convert_{index}"] = convert
+            expr = f"_convert_{index}(self.{attr})"
+        if convert in (str, _nested_str, _nested_obj, _lazy_str):
+            # None stays None instead of becoming the string 'None' (and nested objects are not serialized for it)
+            dict_lines.append(f"        {key!r}: None if self.{attr} is None else {expr},")
+        else:
+            dict_lines.append(f"        {key!r}: {expr},")
+
+        # Only the checks that the field's converter can actually fail are emitted:
+        # lists are always kept, converted strings can only be trivial, raw values can be anything
+        if convert in (list, _str_list, _ref_list):
+            json_lines.append(f"    json_dict[{key!r}] = {expr}")
+        elif convert is _lazy_str:
+            json_lines.append(f"    value = self.{attr}")
+            json_lines.append("    if value is not None and not (type(value) is str and value in _DROPPED_STRINGS):")
+            json_lines.append(f"        json_dict[{key!r}] = value")
+        elif convert is _nested_obj:
+            json_lines.append(f"    value = self.{attr}")
+            json_lines.append("    if value is not None and value != [] and not (type(value) is str and value in _DROPPED_STRINGS):")
+            json_lines.append(f"        json_dict[{key!r}] = value")
+        elif convert in (str, _nested_str):
+            json_lines.append(f"    if self.{attr} is not None:")
+            json_lines.append(f"        value = {expr}")
+            json_lines.append("        if value not in _DROPPED_STRINGS:")
+            json_lines.append(f"            json_dict[{key!r}] = value")
+        else:
+            json_lines.append(f"    value = {expr}")
+            json_lines.append("    if value is not None and not (type(value) is str and value in _DROPPED_STRINGS):")
+            json_lines.append(f"        json_dict[{key!r}] = value")
+
+    source = "def to_dict(self, expand=False):\n    return {\n" + "\n".join(dict_lines) + "\n    }\n\n\n"
+    source += "def _to_json_dict(self, expand=False):\n    json_dict = {}\n" + "\n".join(json_lines) + "\n    return json_dict\n"
+    exec(compile(source, f"<{cls_name} serializers>", "exec"), namespace)
+
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = f"Returns the dictionary representation of the {cls_name} object."
+    to_dict.__qualname__ = f"{cls_name}.to_dict"
+    to_json_dict = namespace["_to_json_dict"]
+    to_json_dict.__doc__ = f"Returns the dictionary representation of the {cls_name} object without None values and trivial strings."
+    to_json_dict.__qualname__ = f"{cls_name}._to_json_dict"
+    return to_dict, to_json_dict
+
+
+def _compile_init(cls_name, attrs):
+    """Generates an __init__() method that takes one argument per attribute and assigns it unchanged.
+
+    Args:
+        cls_name (str): The name of the class (used in the docstring and the code object name)
+        attrs (tuple): The attribute names, which are also the argument names
+
+    Returns:
+        function: The __init__() function
+    """
+    source = f"def __init__(self, {', '.join(attrs)}):\n" + "".join(f"    self.{attr} = {attr}\n" for attr in attrs)
+    namespace = {}
+    exec(compile(source, f"<{cls_name} init>", "exec"), namespace)
+
+    init = namespace["__init__"]
+    init.__doc__ = f"Initializes the {cls_name} object."
+    init.__qualname__ = f"{cls_name}.__init__"
+    return init
+
+
+def _compile_pickling(cls_name, slots, bypass_setattr=False, reset=(), lazy=()):
+    """Generates __getstate__() and __setstate__() methods that pickle the slots of a class as a plain tuple.
+
+    Unpickling assigns the tuple back in slot order, instead of applying the default state dictionary with one setattr() per slot.
+    All pickled slots must be set by __init__().
+
+    Args:
+        cls_name (str): The name of the class (used in the docstrings and the code object names)
+        slots (tuple): The pickled slots, in the order of the state tuple
+        bypass_setattr (bool, optional): If True, the slots are assigned with object.__setattr__(), for classes that override __setattr__(). Defaults to False.
+        reset (tuple, optional): Slots that are not pickled, but set to None when unpickling (e.g. caches). Defaults to ().
+        lazy (tuple, optional): Private slots of lazily created values (e.g. '_uuid'). They are read through their public property
+            (e.g. 'uuid'), so the value is created before pickling and the copy keeps it. Defaults to ().
+
+    Returns:
+        tuple: The __getstate__() and __setstate__() functions
+    """
+    getters = [slot.lstrip("_") if slot in lazy else slot for slot in slots]
+    source = "def __getstate__(self):\n    return (" + "".join(f"self.{getter}, " for getter in getters) + ")\n\n\n"
+    source += "def __setstate__(self, state):\n"
+    if bypass_setattr:
+        source += "    " + "".join(f"v{index}, " for index in range(len(slots))) + "= state\n"
+        source += "".join(f"    _set(self, {slot!r}, v{index})\n" for index, slot in enumerate(slots))
+        source += "".join(f"    _set(self, {slot!r}, None)\n" for slot in reset)
+    else:
+        source += "    " + "".join(f"self.{slot}, " for slot in slots) + "= state\n"
+        source += "".join(f"    self.{slot} = None\n" for slot in reset)
+    namespace = {"_set": object.__setattr__}
+    exec(compile(source, f"<{cls_name} pickling>", "exec"), namespace)
+
+    getstate = namespace["__getstate__"]
+    getstate.__doc__ = f"Returns the slots of the {cls_name} object as a tuple for pickling."
+    getstate.__qualname__ = f"{cls_name}.__getstate__"
+    setstate = namespace["__setstate__"]
+    setstate.__doc__ = f"Restores the slots of the {cls_name} object from a pickled tuple."
+    setstate.__qualname__ = f"{cls_name}.__setstate__"
+    return getstate, setstate
+
+
+class _CachedJSON:
+    """Base class that memoizes the JSON representation of an object until one of its attributes is set again.
+
+    Subclasses have to set _FIELDS to their field table, from which their to_dict() method is generated.
+    Changes inside mutable attributes (e.g. appending to a list) are not tracked.
+    The UUID of the object is stored as a 128-bit integer and only formatted when it is accessed.
+    """
+
+    __slots__ = ("_json_cache", "_uuid_int")
+    _FIELDS = ()
+    _FRAME_DTYPES = {}  # Column types of to_frame() for attributes that should not stay generic objects
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.to_dict, cls._to_json_dict = _compile_serializers(cls.__name__, cls._FIELDS)
+        # The timestamp of Location and Person is only taken on first access, so it is read through the property when pickling
+        lazy = ("_timestamp",) if "_timestamp" in cls.__slots__ else ()
+        cls.__getstate__, cls.__setstate__ = _compile_pickling(
+            cls.__name__, ("_uuid_int",) + cls.__slots__, bypass_setattr=True, reset=("_json_cache",), lazy=lazy
+        )
+
+    @property
+    def uuid(self) -> str:
+        """Returns the UUID of the object as a string."""
+        # Formatted directly from the integer, without building (and validating) a uuid.UUID object first
+        hex_ = "%032x" % self._uuid_int
+        return f"{hex_[:8]}-{hex_[8:12]}-{hex_[12:16]}-{hex_[16:20]}-{hex_[20:]}"
+
+    @uuid.setter
+    def uuid(self, value):
+        """Sets the UUID of the object. Accepts a UUID, its string or integer form or None for a new random UUID."""
+        if value is None:
+            value = uuid4().int
+        elif isinstance(value, uuid.UUID):
+            value = value.int
+        elif not isinstance(value, int):
+            value = uuid.UUID(str(value)).int
+        object.__setattr__(self, "_uuid_int", value)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_json_cache":
+            object.__setattr__(self, "_json_cache", None)
+
+    def to_json(self, compact=False, expand=False):
+        """Returns the JSON representation of the object.
+
+        Args:
+            compact (bool, optional): If True, the JSON is not indented. Used for nested objects. Defaults to False.
+            expand (bool, optional): If True, referenced objects are included instead of their UUIDs. Defaults to False.
+
+        Returns:
+            str: The JSON representation of the object
+        """
+        cache = getattr(self, "_json_cache", None)
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_json_cache", cache)
+
+        json_str = cache.get((compact, expand))
+        if json_str is None:
+            dict_ = self._to_json_dict(expand)
+            if not compact:
+                json_str = _dumps_indented(dict_)
+            elif orjson is not None:
+                json_str = orjson.dumps(dict_, option=_ORJSON_COMPACT, default=_json_default).decode()
+            else:
+                json_str = json.dumps(dict_, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+            cache[compact, expand] = json_str
+        return json_str
+
+    def __str__(self):
+        """Returns the string representation of the object."""
+        return self.to_json()
+
+    @classmethod
+    def to_frame(cls, objects) -> "pd.DataFrame":
+        """Returns the given objects as a DataFrame with one typed column per attribute, e.g. for vectorized aggregations.
+
+        Args:
+            objects (list): The objects to convert. All of them have to be of this class.
+
+        Returns:
+            pd.DataFrame: The DataFrame with one row per object and an additional 'uuid' column
+        """
+        import pandas as pd  # Only needed for analytics, so it is not imported with the module
+
+        columns = [attr for _, attr, _ in cls._FIELDS if attr != "uuid"] + ["uuid"]
+        frame = pd.DataFrame([[getattr(obj, attr) for attr in columns] for obj in objects], columns=columns)
+        return frame.astype(cls._FRAME_DTYPES)
+
+
+_LOCATION_FIELDS = (
+    ("location_country", "country", None),
+    ("location_city", "city", None),
+    ("location_latitude", "latitude", None),
+    ("location_longitude", "longitude", None),
+    ("location_timezone", "timezone", None),
+    ("location_asn", "asn", None),
+    ("location_asn_corperation", "asn_corperation", None),
+    ("location_org", "org", None),
+    ("location_certainty", "certainty", None),
+    ("location_last_updated", "last_updated", _lazy_str),
+)
+
+
+class Location(_CachedJSON):
     """Location class. This class is used for storing location information.
 
     Attributes:
@@ -47,10 +592,29 @@ class Location:
         uuid (str): The UUID of the location
 
     Methods:
-        __dict__(self): Returns the dictionary representation of the Location object.
+        to_dict(self): Returns the dictionary representation of the Location object.
         __str__(self): Returns the string representation of the Location object.
     """
 
+    _PREFIX = "location_"
+    _FIELDS = _LOCATION_FIELDS
+
+    _FRAME_DTYPES = {"country": "category", "timezone": "category", "asn": "Int64", "certainty": "Int8"}
+
+    __slots__ = (
+        "country",
+        "city",
+        "latitude",
+        "longitude",
+        "timezone",
+        "asn",
+        "asn_corperation",
+        "org",
+        "certainty",
+        "last_updated",
+        "_timestamp",
+    )
+
     def __init__(
         self,
         country: str = None,
@@ -63,7 +627,7 @@ class Location:
         org: str = None,
         certainty: int = None,
         last_updated: datetime = None,
-        uuid: str = str(uuid.uuid4()),
+        uuid: str = None,
     ):
         # Check that at least one of the parameters is not None
         if (
@@ -78,45 +642,45 @@ class Location:
         ):
             pass  # raise ValueError("At least one parameter must be set")
 
-        self.country = country
+        self.country = _intern(country)
         self.city = city
         self.latitude = latitude
         self.longitude = longitude
-        self.timezone = timezone
+        self.timezone = _intern(timezone)
         self.asn = asn
-        self.asn_corperation = asn_corperation
+        self.asn_corperation = _intern(asn_corperation)
         self.org = org
 
         self.certainty = handle_percentage(certainty)
         self.last_updated = last_updated
 
-        if not last_updated:
-            self.timestamp = datetime.datetime.now()  # when the object was created (for cross-context compatibility)
-        else:
-            self.timestamp = last_updated
+        # The creation time is only looked up when it is needed (or shared within a batch_timestamp() block)
+        self.timestamp = last_updated or getattr(_BATCH_TIMESTAMP, "now", None)
 
         self.uuid = uuid
 
-    def __dict__(self):
-        """Returns the dictionary representation of the Location object."""
-        dict_ = {
-            "location_country": self.country,
-            "location_city": self.city,
-            "location_latitude": self.latitude,
-            "location_longitude": self.longitude,
-            "location_timezone": self.timezone,
-            "location_asn": self.asn,
-            "location_asn_corperation": self.asn_corperation,
-            "location_org": self.org,
-            "location_certainty": self.certainty,
-            "location_last_updated": str(self.last_updated),
-        }
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Returns when the object was created (for cross-context compatibility). Outside of batch_timestamp() it is taken on first access."""
+        if self._timestamp is None:
+            object.__setattr__(self, "_timestamp", datetime.datetime.now())
+        return self._timestamp
 
-        return dict_
+    @timestamp.setter
+    def timestamp(self, value):
+        self._timestamp = value
 
-    def __str__(self):
-        """Returns the string representation of the Vulnerability object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+    @classmethod
+    def from_records(cls, records):
+        """Creates Location objects from a DataFrame or a list of dictionaries with 'location_' prefixed keys.
+
+        Args:
+            records (Union[pd.DataFrame, List[dict]]): The records to load
+
+        Returns:
+            List[Location]: The loaded Location objects
+        """
+        return _records_to_objects(cls, records)
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -124,14 +688,18 @@ class Location:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        prefix_len = len(self._PREFIX)
+        failed = []
         for key, value in dict_.items():
             # First we have to remove the 'location_' prefix from the key
+            if key.startswith(self._PREFIX):
+                key = key[prefix_len:]
             try:
-                key = key.replace("location_", "")
                 setattr(self, key, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{key}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
 
     def is_valid(self):
         """Returns whether the Location object is valid or not."""
@@ -147,7 +715,47 @@ class Location:
         return False
 
 
-class Vulnerability:
+_VULNERABILITY_FIELDS = (
+    ("vuln_cve", "cve", None),
+    ("vuln_description", "description", None),
+    ("vuln_tags", "tags", None),
+    ("vuln_created_at", "created_at", _lazy_str),
+    ("vuln_updated_at", "updated_at", _lazy_str),
+    ("vuln_cvss", "cvss", None),
+    ("vuln_cvss_vector", "cvss_vector", None),
+    ("vuln_cvss3", "cvss3", None),
+    ("vuln_cvss3_vector", "cvss3_vector", None),
+    ("vuln_cwe", "cwe", None),
+    ("vuln_references", "references", None),
+    ("vuln_exploit_available", "exploit_available", None),
+    ("vuln_exploit_frameworks", "exploit_frameworks", None),
+    ("vuln_exploit_mitigations", "exploit_mitigations", None),
+    ("vuln_exploitability_ease", "exploitability_ease", None),
+    ("vuln_published_at", "published_at", _lazy_str),
+    ("vuln_last_modified_at", "last_modified_at", _lazy_str),
+    ("vuln_patched_at", "patched_at", _lazy_str),
+    ("vuln_solution", "solution", None),
+    ("vuln_solution_date", "solution_date", _lazy_str),
+    ("vuln_solution_type", "solution_type", None),
+    ("vuln_solution_url", "solution_url", None),
+    ("vuln_solution_advisory", "solution_advisory", None),
+    ("vuln_solution_advisory_url", "solution_advisory_url", None),
+    ("vuln_services_affected", "services_affected", _ref_list),
+    ("vuln_services_vulnerable", "services_vulnerable", _ref_list),
+    ("vuln_attack_vector", "attack_vector", None),
+    ("vuln_attack_complexity", "attack_complexity", None),
+    ("vuln_privileges_required", "privileges_required", None),
+    ("vuln_user_interaction", "user_interaction", None),
+    ("vuln_confidentiality_impact", "confidentiality_impact", None),
+    ("vuln_integrity_impact", "integrity_impact", None),
+    ("vuln_availability_impact", "availability_impact", None),
+    ("vuln_scope", "scope", None),
+    ("vuln_version", "version", None),
+    ("vuln_uuid", "uuid", None),
+)
+
+
+class Vulnerability(_CachedJSON):
     """Vulnerability class. This class is used for storing vulnerability information.
 
     Attributes:
@@ -190,10 +798,65 @@ class Vulnerability:
 
     Methods:
         __init__(self, name: str, description: str = None, tags: List[str] = None, created_at: datetime = None, updated_at: datetime = None, cve: str = None, cvss: float = None, cvss_vector: str = None, cvss3: float = None, cvss3_vector: str = None, cwe: str = None, references: List[str] = None, exploit_available: bool = None, exploit_frameworks: List[str] = None, exploit_mitigations: List[str] = None, exploitability_ease: str = None, published_at: datetime = None, last_modified_at: datetime = None, patched_at: datetime = None, solution: str = None, solution_date: datetime = None, solution_type: str = None, solution_link: str = None, solution_description: str = None, solution_tags: List[str] = None, services_affected: List[Service] = None, services_vulnerable: List[Service] = None, attack_vector: str = None, attack_complexity: str = None, privileges_required: str = None, user_interaction: str = None, confidentiality_impact: str = None, integrity_impact: str = None, availability_impact: str = None, scope: str = None)
-        __dict__(self)
+        to_dict(self)
         __str__(self)
     """
 
+    _PREFIX = "vuln_"
+    _FIELDS = _VULNERABILITY_FIELDS
+
+    _FRAME_DTYPES = {
+        "cvss": "float32",
+        "cvss3": "float32",
+        "exploit_available": "boolean",
+        "attack_vector": "category",
+        "attack_complexity": "category",
+        "privileges_required": "category",
+        "user_interaction": "category",
+        "confidentiality_impact": "category",
+        "integrity_impact": "category",
+        "availability_impact": "category",
+        "scope": "category",
+    }
+
+    __slots__ = (
+        "description",
+        "tags",
+        "created_at",
+        "updated_at",
+        "cve",
+        "cvss",
+        "cvss_vector",
+        "cvss3",
+        "cvss3_vector",
+        "cwe",
+        "references",
+        "exploit_available",
+        "exploit_frameworks",
+        "exploit_mitigations",
+        "exploitability_ease",
+        "published_at",
+        "last_modified_at",
+        "patched_at",
+        "solution",
+        "solution_date",
+        "solution_type",
+        "solution_url",
+        "solution_advisory",
+        "solution_advisory_url",
+        "services_affected",
+        "services_vulnerable",
+        "attack_vector",
+        "attack_complexity",
+        "privileges_required",
+        "user_interaction",
+        "confidentiality_impact",
+        "integrity_impact",
+        "availability_impact",
+        "scope",
+        "version",
+    )
+
     def __init__(
         self,
         cve: str,
@@ -208,8 +871,8 @@ class Vulnerability:
         cwe: str = None,
         references: List[str] = None,
         exploit_available: bool = None,
-        exploit_frameworks: List[str] = [],
-        exploit_mitigations: List[str] = [],
+        exploit_frameworks: List[str] = None,
+        exploit_mitigations: List[str] = None,
         exploitability_ease: str = None,
         published_at: datetime = None,
         last_modified_at: datetime = None,
@@ -220,8 +883,8 @@ class Vulnerability:
         solution_url: str = None,
         solution_advisory: str = None,
         solution_advisory_url: str = None,
-        services_affected: List = [],  # type is Service for each item
-        services_vulnerable: List = [],  # type is Service for each item
+        services_affected: List = None,  # type is Service for each item
+        services_vulnerable: List = None,  # type is Service for each item
         attack_vector: str = None,
         attack_complexity: str = None,
         privileges_required: str = None,
@@ -231,10 +894,11 @@ class Vulnerability:
         availability_impact: str = None,
         scope: str = None,
         version: str = None,
-        uuid: str = str(uuid.uuid4()),
+        uuid: str = None,
+        _trusted: bool = False,
     ):
         self.description = description
-        self.tags = tags
+        self.tags = remove_duplicates_from_list(tags) if tags else tags
         self.created_at = created_at
         self.updated_at = updated_at
         self.cve = cve
@@ -243,10 +907,10 @@ class Vulnerability:
         self.cvss3 = cvss3
         self.cvss3_vector = cvss3_vector
         self.cwe = cwe
-        self.references = references
+        self.references = remove_duplicates_from_list(references) if references else references
         self.exploit_available = exploit_available
-        self.exploit_frameworks = exploit_frameworks
-        self.exploit_mitigations = exploit_mitigations
+        self.exploit_frameworks = remove_duplicates_from_list(exploit_frameworks) if exploit_frameworks is not None else _EMPTY_TUPLE
+        self.exploit_mitigations = remove_duplicates_from_list(exploit_mitigations) if exploit_mitigations is not None else _EMPTY_TUPLE
         self.exploitability_ease = exploitability_ease
         self.published_at = published_at
         self.last_modified_at = last_modified_at
@@ -257,23 +921,21 @@ class Vulnerability:
         self.solution_url = solution_url
         self.solution_advisory = solution_advisory
         self.solution_advisory_url = solution_advisory_url
-        self.services_affected = services_affected
-
-        if services_vulnerable is None:
-            self.services_vulnerable = services_affected
-        else:
-            for service in services_vulnerable:
-                if not isinstance(service, Service):
-                    raise TypeError("services_vulnerable must be a subset of services_affected")
-            self.services_vulnerable = services_vulnerable
 
+        # A missing list of services falls back to the other one. Each list is validated once and gets its own copy.
         if services_affected is None:
-            self.services_affected = services_vulnerable
-        else:
-            for service in services_affected:
-                if not isinstance(service, Service):
-                    raise TypeError("services_affected must be a subset of services_vulnerable")
-            self.services_affected = services_affected
+            services_affected = services_vulnerable
+        elif services_vulnerable is None:
+            services_vulnerable = services_affected
+
+        if not _trusted:
+            if services_affected:
+                _check_services(services_affected, "services_affected must be a subset of services_vulnerable")
+            if services_vulnerable and services_vulnerable is not services_affected:
+                _check_services(services_vulnerable, "services_vulnerable must be a subset of services_affected")
+
+        self.services_affected = list(services_affected) if services_affected is not None else _EMPTY_TUPLE
+        self.services_vulnerable = list(services_vulnerable) if services_vulnerable is not None else _EMPTY_TUPLE
 
         self.attack_vector = attack_vector
         self.attack_complexity = attack_complexity
@@ -286,54 +948,52 @@ class Vulnerability:
         self.version = version
         self.uuid = uuid
 
-    def __dict__(self):
-        dict_ = {
-            "vuln_cve": self.cve,
-            "vuln_description": self.description,
-            "vuln_tags": self.tags,
-            "vuln_created_at": str(self.created_at),
-            "vuln_updated_at": str(self.updated_at),
-            "vuln_cvss": self.cvss,
-            "vuln_cvss_vector": self.cvss_vector,
-            "vuln_cvss3": self.cvss3,
-            "vuln_cvss3_vector": self.cvss3_vector,
-            "vuln_cwe": self.cwe,
-            "vuln_references": self.references,
-            "vuln_exploit_available": self.exploit_available,
-            "vuln_exploit_frameworks": self.exploit_frameworks,
-            "vuln_exploit_mitigations": self.exploit_mitigations,
-            "vuln_exploitability_ease": self.exploitability_ease,
-            "vuln_published_at": str(self.published_at),
-            "vuln_last_modified_at": str(self.last_modified_at),
-            "vuln_patched_at": str(self.patched_at),
-            "vuln_solution": self.solution,
-            "vuln_solution_date": str(self.solution_date),
-            "vuln_solution_type": self.solution_type,
-            "vuln_solution_url": self.solution_url,
-            "vuln_solution_advisory": self.solution_advisory,
-            "vuln_solution_advisory_url": self.solution_advisory_url,
-            "vuln_services_affected": [str(service) for service in self.services_affected],
-            "vuln_services_vulnerable": [str(service) for service in self.services_vulnerable],
-            "vuln_attack_vector": self.attack_vector,
-            "vuln_attack_complexity": self.attack_complexity,
-            "vuln_privileges_required": self.privileges_required,
-            "vuln_user_interaction": self.user_interaction,
-            "vuln_confidentiality_impact": self.confidentiality_impact,
-            "vuln_integrity_impact": self.integrity_impact,
-            "vuln_availability_impact": self.availability_impact,
-            "vuln_scope": self.scope,
-            "vuln_version": self.version,
-            "vuln_uuid": self.uuid,
-        }
+    @classmethod
+    def _from_trusted(cls, **kwargs):
+        """Creates a Vulnerability without validating its arguments. Only for callers that already guarantee valid types and values."""
+        return cls(**kwargs, _trusted=True)
 
-        return dict_
+    @classmethod
+    def from_records(cls, records):
+        """Creates Vulnerability objects from a DataFrame or a list of dictionaries with 'vuln_' prefixed keys.
 
-    def __str__(self):
-        """Returns the string representation of the Vulnerability object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        Args:
+            records (Union[pd.DataFrame, List[dict]]): The records to load
 
+        Returns:
+            List[Vulnerability]: The loaded Vulnerability objects
+        """
+        return _records_to_objects(cls, records)
+
+
+_SERVICE_FIELDS = (
+    ("svc_name", "name", None),
+    ("svc_vendor", "vendor", None),
+    ("svc_description", "description", None),
+    ("svc_tags", "tags", None),
+    ("svc_created_at", "created_at", _lazy_str),
+    ("svc_updated_at", "updated_at", _lazy_str),
+    ("svc_current_vulnerabilities", "current_vulnerabilities", _ref_list),
+    ("svc_fixed_vulnerabilities", "fixed_vulnerabilities", _ref_list),
+    ("svc_installed_version", "installed_version", None),
+    ("svc_latest_version", "latest_version", None),
+    ("svc_outdated", "outdated", None),
+    ("svc_ports", "ports", list),
+    ("svc_protocol", "protocol", None),
+    ("svc_required_availability", "required_availability", str),
+    ("svc_required_confidentiality", "required_confidentiality", str),
+    ("svc_required_integrity", "required_integrity", str),
+    ("svc_colleteral_damage_potential", "colleteral_damage_potential", str),
+    ("svc_impact_score", "impact_score", str),
+    ("svc_risk_score", "risk_score", str),
+    ("svc_risk_score_vector", "risk_score_vector", None),
+    ("svc_child_services", "child_services", _ref_list),
+    ("svc_parent_services", "parent_services", _ref_list),
+    ("svc_uuid", "uuid", str),
+)
 
-class Service:
+
+class Service(_CachedJSON):
     """Service class. This class is used for storing service information.
        ! This class is not a stand-alone context. !
        Use it in a Device context if a device is running a service.
@@ -367,24 +1027,73 @@ class Service:
 
     Methods:
         __init__(): Initializes the Service class
-        __dict__(): Converts the Service class to a dictionary
+        to_dict(): Converts the Service class to a dictionary
         __str__(): Converts the Service class to a string
     """
 
+    _PREFIX = "svc_"
+    _iris_kind = "service"  # Checked instead of isinstance() when validating lists of services
+    _PERCENTAGE_FIELDS = (
+        "required_availability",
+        "required_confidentiality",
+        "required_integrity",
+        "colleteral_damage_potential",
+        "impact_score",
+        "risk_score",
+    )
+    _FIELDS = _SERVICE_FIELDS
+
+    _FRAME_DTYPES = {
+        "vendor": "category",
+        "outdated": "boolean",
+        "protocol": "category",
+        "required_availability": "Int8",
+        "required_confidentiality": "Int8",
+        "required_integrity": "Int8",
+        "colleteral_damage_potential": "Int8",
+        "impact_score": "Int8",
+        "risk_score": "Int8",
+    }
+
+    __slots__ = (
+        "name",
+        "vendor",
+        "description",
+        "tags",
+        "created_at",
+        "updated_at",
+        "current_vulnerabilities",
+        "fixed_vulnerabilities",
+        "installed_version",
+        "latest_version",
+        "outdated",
+        "ports",
+        "protocol",
+        "required_availability",
+        "required_confidentiality",
+        "required_integrity",
+        "colleteral_damage_potential",
+        "impact_score",
+        "risk_score",
+        "risk_score_vector",
+        "child_services",
+        "parent_services",
+    )
+
     def __init__(
         self,
         name: str,
         vendor: str = None,
         description: str = None,
-        tags: List[str] = [],
+        tags: List[str] = None,
         created_at: datetime = None,
         updated_at: datetime = None,
-        current_vulnerabilities: List[Vulnerability] = [],
-        fixed_vulnerabilities: List[Vulnerability] = [],
+        current_vulnerabilities: List[Vulnerability] = None,
+        fixed_vulnerabilities: List[Vulnerability] = None,
         installed_version: str = None,
         latest_version: str = None,
         outdated: bool = None,
-        ports: List[int] = [],
+        ports: List[int] = None,
         protocol: str = None,
         required_availability: int = None,
         required_confidentiality: int = None,
@@ -393,86 +1102,81 @@ class Service:
         impact_score: int = None,
         risk_score: int = None,
         risk_score_vector: str = None,
-        child_services: List = [],  # type is Service for each item
-        parent_services: List = [],  # type is Service for each item
-        uuid: uuid = uuid.uuid4(),
+        child_services: List = None,  # type is Service for each item
+        parent_services: List = None,  # type is Service for each item
+        uuid: uuid.UUID = None,
+        _trusted: bool = False,
     ):
         self.name = name
-        self.vendor = vendor
+        self.vendor = _intern(vendor)
         self.description = description
-        self.tags = tags
+        self.tags = tags if tags is not None else _EMPTY_TUPLE
         self.created_at = created_at
         self.updated_at = updated_at
-        self.current_vulnerabilities = current_vulnerabilities
-        self.fixed_vulnerabilities = fixed_vulnerabilities
+        self.current_vulnerabilities = current_vulnerabilities if current_vulnerabilities is not None else _EMPTY_TUPLE
+        self.fixed_vulnerabilities = fixed_vulnerabilities if fixed_vulnerabilities is not None else _EMPTY_TUPLE
         self.installed_version = installed_version
         self.latest_version = latest_version
         self.outdated = outdated
-        self.ports = ports
-        self.protocol = protocol
-        self.required_availability = handle_percentage(required_availability)
-        self.required_confidentiality = handle_percentage(required_confidentiality)
-        self.required_integrity = handle_percentage(required_integrity)
-        self.colleteral_damage_potential = handle_percentage(colleteral_damage_potential)
-        self.impact_score = handle_percentage(impact_score)
-        self.risk_score = handle_percentage(risk_score)
+        self.ports = _pack_ports(ports)
+        self.protocol = _intern(protocol)
+        self.required_availability = required_availability if _trusted else handle_percentage(required_availability)
+        self.required_confidentiality = required_confidentiality if _trusted else handle_percentage(required_confidentiality)
+        self.required_integrity = required_integrity if _trusted else handle_percentage(required_integrity)
+        self.colleteral_damage_potential = colleteral_damage_potential if _trusted else handle_percentage(colleteral_damage_potential)
+        self.impact_score = impact_score if _trusted else handle_percentage(impact_score)
+        self.risk_score = risk_score if _trusted else handle_percentage(risk_score)
         self.risk_score_vector = risk_score_vector
 
         if child_services is None:
-            self.child_services = []
+            self.child_services = _EMPTY_TUPLE
         else:
-            for service in child_services:
-                if not isinstance(service, Service):
-                    raise TypeError("Child services must be of type Service")
+            if not _trusted:
+                _check_services(child_services, "Child services must be of type Service")
             self.child_services = child_services
 
         if parent_services is None:
-            self.parent_services = []
+            self.parent_services = _EMPTY_TUPLE
         else:
-            for service in parent_services:
-                if not isinstance(service, Service):
-                    raise TypeError("Parent services must be of type Service")
+            if not _trusted:
+                _check_services(parent_services, "Parent services must be of type Service")
             self.parent_services = parent_services
 
         self.uuid = uuid
 
-    def __dict__(self):
-        """Converts the Service class to a dictionary."""
+    @classmethod
+    def _from_trusted(cls, **kwargs):
+        """Creates a Service without validating its arguments. Only for callers that already guarantee valid types and values."""
+        return cls(**kwargs, _trusted=True)
 
-        dict_ = {
-            "svc_name": self.name,
-            "svc_vendor": self.vendor,
-            "svc_description": self.description,
-            "svc_tags": self.tags,
-            "svc_created_at": str(self.created_at),
-            "svc_updated_at": str(self.updated_at),
-            "svc_current_vulnerabilities": [str(vuln) for vuln in self.current_vulnerabilities],
-            "svc_fixed_vulnerabilities": [str(vuln) for vuln in self.fixed_vulnerabilities],
-            "svc_installed_version": self.installed_version,
-            "svc_latest_version": self.latest_version,
-            "svc_outdated": self.outdated,
-            "svc_ports": self.ports,
-            "svc_protocol": self.protocol,
-            "svc_required_availability": str(self.required_availability),
-            "svc_required_confidentiality": str(self.required_confidentiality),
-            "svc_required_integrity": str(self.required_integrity),
-            "svc_colleteral_damage_potential": str(self.colleteral_damage_potential),
-            "svc_impact_score": str(self.impact_score),
-            "svc_risk_score": str(self.risk_score),
-            "svc_risk_score_vector": self.risk_score_vector,
-            "svc_child_services": [str(service) for service in self.child_services],
-            "svc_parent_services": [str(service) for service in self.parent_services],
-            "svc_uuid": str(self.uuid),
-        }
+    @classmethod
+    def from_records(cls, records):
+        """Creates Service objects from a DataFrame or a list of dictionaries with 'svc_' prefixed keys.
 
-        return dict_
+        Args:
+            records (Union[pd.DataFrame, List[dict]]): The records to load
 
-    def __str__(self) -> str:
-        """Returns the Person class as a string."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        Returns:
+            List[Service]: The loaded Service objects
+        """
+        return _records_to_objects(cls, records)
+
+
+_PERSON_FIELDS = (
+    ("user_name", "name", None),
+    ("user_email", "email", None),
+    ("user_phone", "phone", None),
+    ("user_tags", "tags", None),
+    ("user_created_at", "created_at", _lazy_str),
+    ("user_updated_at", "updated_at", _lazy_str),
+    ("user_primary_location", "primary_location", _nested_str),
+    ("user_locations", "locations", _str_list),
+    ("user_roles", "roles", None),
+    ("user_access_to", "access_to", _str_list),
+)
 
 
-class Person:
+class Person(_CachedJSON):
     """Person class. This class is used for storing person information.
 
     Attributes:
@@ -490,64 +1194,79 @@ class Person:
 
     Methods:
         __init__(): Initializes the Person class
-        __dict__(): Converts the Person class to a dictionary
+        to_dict(): Converts the Person class to a dictionary
         __str__(): Converts the Person class to a string
     """
 
+    _PREFIX = "user_"
+    _FIELDS = _PERSON_FIELDS
+
+    __slots__ = (
+        "name",
+        "email",
+        "phone",
+        "tags",
+        "created_at",
+        "updated_at",
+        "primary_location",
+        "locations",
+        "roles",
+        "access_to",
+        "_timestamp",
+    )
+
     def __init__(
         self,
         name: str = None,
         email: str = None,
         phone: str = None,
-        tags: List[str] = [],
+        tags: List[str] = None,
         created_at: datetime = None,
         updated_at: datetime = None,
         primary_location: Location = None,
-        locations: List[Location] = [],
-        roles: List[str] = [],
-        access_to: List = [],  # type is 'Device' for each entry
-        uuid: uuid.UUID = uuid.uuid4(),
+        locations: List[Location] = None,
+        roles: List[str] = None,
+        access_to: List = None,  # type is 'Device' for each entry
+        uuid: uuid.UUID = None,
     ):
         self.name = name
         self.email = email
         self.phone = phone
-        self.tags = tags
+        self.tags = tags if tags is not None else _EMPTY_TUPLE
         self.created_at = created_at
         self.updated_at = updated_at
         self.primary_location = primary_location
-        self.locations = locations
-        self.roles = roles
-        self.access_to = access_to
+        self.locations = locations if locations is not None else _EMPTY_TUPLE
+        self.roles = roles if roles is not None else _EMPTY_TUPLE
+        self.access_to = access_to if access_to is not None else _EMPTY_TUPLE
 
-        if not updated_at:
-            self.timestamp = datetime.datetime.now()  # when the object was created (for cross-context compatibility)
-        else:
-            self.timestamp = updated_at
+        # The creation time is only looked up when it is needed (or shared within a batch_timestamp() block)
+        self.timestamp = updated_at or getattr(_BATCH_TIMESTAMP, "now", None)
 
         self.uuid = uuid
 
-    def __dict__(self):
-        """Converts the Person class to a dictionary.
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Returns when the object was created (for cross-context compatibility). Outside of batch_timestamp() it is taken on first access."""
+        if self._timestamp is None:
+            object.__setattr__(self, "_timestamp", datetime.datetime.now())
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value):
+        self._timestamp = value
+
+    @classmethod
+    def from_records(cls, records):
+        """Creates Person objects from a DataFrame or a list of dictionaries with 'user_' prefixed keys.
+
+        Args:
+            records (Union[pd.DataFrame, List[dict]]): The records to load
 
         Returns:
-            dict: The dictionary representation of the Person class
+            List[Person]: The loaded Person objects
         """
-        return {
-            "user_name": self.name,
-            "user_email": self.email,
-            "user_phone": self.phone,
-            "user_tags": self.tags,
-            "user_created_at": str(self.created_at),
-            "user_updated_at": str(self.updated_at),
-            "user_primary_location": str(self.primary_location),
-            "user_locations": [str(location) for location in self.locations],
-            "user_roles": self.roles,
-            "user_access_to": [str(device) for device in self.access_to],
-        }
-
-    def __str__(self) -> str:
-        """Returns the Person class as a string."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        return _records_to_objects(cls, records)
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -555,14 +1274,18 @@ class Person:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        prefix_len = len(self._PREFIX)
+        failed = []
         for key, value in dict_.items():
             # First we have to remove the 'user_' prefix from the key
+            if key.startswith(self._PREFIX):
+                key = key[prefix_len:]
             try:
-                key = key.replace("user_", "")
                 setattr(self, key, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{key}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
 
 
 class ContextAsset:
@@ -616,17 +1339,67 @@ class ContextAsset:
         protocols (List[str]): A list of protocols of the device
 
     Methods:
-        __init__(self, name: str, local_ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address] = DEFAULT_IP, global_ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address] = DEFAULT_IP, ips: List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]] = [], mac: str = None, vendor: str = None, os: str = None, os_version: str = None, os_family: str = None, os_last_update: datetime = None, in_scope: bool = True, tags: List[str] = None, created_at: datetime = None, updated_at: datetime = None, in_use: bool = True, type: str = None, owner: Person = None, uuid: uuid.UUID = None, aliases: List[str] = None, description: str = None, location: Location = None, notes: str = None, last_seen: datetime = None, first_seen: datetime = None, last_scan: datetime = None, last_update: datetime = None, user: List[Person] = None, group: str = None, auth_types: List[str] = None, auth_stored_in: List[str] = None, stored_credentials: List[str] = None, should_state: str = None, is_state: str = None, is_state_reason: str = None, hypervisor: Device = None, virtualization_type: str = None, virtual_locations: List[str] = None, services: List[Service] = None, vulnerabilities: List[Vulnerability] = None, domains: List[str] = None, network: Union[ipaddress.IPv4Network, ipaddress.IPv6Network] = None, interfaces: List[str] = None, ports: List[int] = None, protocols: List[str] = None)
+        __init__(self, name: str, local_ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address] = DEFAULT_IP, global_ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address] = DEFAULT_IP, ips: List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]] = None, mac: str = None, vendor: str = None, os: str = None, os_version: str = None, os_family: str = None, os_last_update: datetime = None, in_scope: bool = True, tags: List[str] = None, created_at: datetime = None, updated_at: datetime = None, in_use: bool = True, type: str = None, owner: Person = None, uuid: uuid.UUID = None, aliases: List[str] = None, description: str = None, location: Location = None, notes: str = None, last_seen: datetime = None, first_seen: datetime = None, last_scan: datetime = None, last_update: datetime = None, user: List[Person] = None, group: str = None, auth_types: List[str] = None, auth_stored_in: List[str] = None, stored_credentials: List[str] = None, should_state: str = None, is_state: str = None, is_state_reason: str = None, hypervisor: Device = None, virtualization_type: str = None, virtual_locations: List[str] = None, services: List[Service] = None, vulnerabilities: List[Vulnerability] = None, domains: List[str] = None, network: Union[ipaddress.IPv4Network, ipaddress.IPv6Network] = None, interfaces: List[str] = None, ports: List[int] = None, protocols: List[str] = None)
         __str__(self)
-        __dict__(self)
+        to_dict(self)
     """
 
+    __slots__ = (
+        "name",
+        "mac",
+        "vendor",
+        "os",
+        "os_version",
+        "os_family",
+        "os_last_update",
+        "kernel",
+        "in_scope",
+        "tags",
+        "created_at",
+        "updated_at",
+        "in_use",
+        "type",
+        "owner",
+        "uuid",
+        "aliases",
+        "description",
+        "location",
+        "notes",
+        "last_seen",
+        "first_seen",
+        "last_scan",
+        "last_update",
+        "user",
+        "group",
+        "auth_types",
+        "auth_stored_in",
+        "stored_credentials",
+        "should_state",
+        "is_state",
+        "is_state_reason",
+        "hypervisor",
+        "virtualization_type",
+        "virtual_locations",
+        "services",
+        "vulnerabilities",
+        "domains",
+        "interfaces",
+        "ports",
+        "protocols",
+        "_timestamp",
+        "_local_ip",
+        "_global_ip",
+        "_ips",
+        "_network",
+    )
+    __getstate__, __setstate__ = _compile_pickling("ContextAsset", __slots__)
+
     def __init__(
         self,
         name: str = None,
         local_ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address] = DEFAULT_IP,
         global_ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address] = DEFAULT_IP,
-        ips: List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]] = [],
+        ips: List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]] = None,
         mac: str = None,
         vendor: str = None,
         os: str = None,
@@ -650,7 +1423,7 @@ class ContextAsset:
         first_seen: datetime = None,
         last_scan: datetime = None,
         last_update: datetime = None,
-        user: List[Person] = [],
+        user: List[Person] = None,
         group: str = None,
         auth_types: List[str] = None,
         auth_stored_in: List[str] = None,
@@ -660,31 +1433,26 @@ class ContextAsset:
         is_state_reason: str = None,
         hypervisor=None,  # can't state that here, but type has to be 'Device' as well
         virtualization_type: str = None,
-        virtual_locations: List[str] = [],
-        services: List[Service] = [],
-        vulnerabilities: List[Vulnerability] = [],
-        domains: List[str] = [],
+        virtual_locations: List[str] = None,
+        services: List[Service] = None,
+        vulnerabilities: List[Vulnerability] = None,
+        domains: List[str] = None,
         network: Union[ipaddress.IPv4Network, ipaddress.IPv6Network] = None,
-        interfaces: List[str] = [],
-        ports: List[int] = [],
-        protocols: List[str] = [],
+        interfaces: List[str] = None,
+        ports: List[int] = None,
+        protocols: List[str] = None,
     ):
-        mlog = logging_helper.Log("lib.class_helper")
 
         self.name = name
-        self.local_ip = cast_to_ipaddress(local_ip, strict=False)
-        self.global_ip = cast_to_ipaddress(global_ip, strict=False)
-
-        if ips is None:
-            self.ips = []
-        else:
-            self.ips = [cast_to_ipaddress(ip) for ip in ips]
+        self.local_ip = local_ip
+        self.global_ip = global_ip
+        self.ips = ips
 
         self.mac = mac
         self.vendor = vendor
-        self.os = os
-        self.os_version = os_version
-        self.os_family = os_family
+        self.os = _intern(os)
+        self.os_version = _intern(os_version)
+        self.os_family = _intern(os_family)
         self.os_last_update = os_last_update
         self.kernel = kernel
         self.in_scope = in_scope
@@ -692,7 +1460,7 @@ class ContextAsset:
         self.created_at = created_at
         self.updated_at = updated_at
         self.in_use = in_use
-        self.type = type
+        self.type = _intern(type)
         self.owner = owner
         self.uuid = uuid
         self.aliases = aliases
@@ -711,9 +1479,9 @@ class ContextAsset:
         self.first_seen = first_seen
         self.last_scan = last_scan
         self.last_update = last_update
-        self.user = user
-        self.group = group
-        self.auth_types = auth_types
+        self.user = [] if user is None else user
+        self.group = _intern(group)
+        self.auth_types = [_intern(auth_type) for auth_type in auth_types] if auth_types else auth_types
         self.auth_stored_in = auth_stored_in
         self.stored_credentials = stored_credentials
         self.should_state = should_state
@@ -721,7 +1489,7 @@ class ContextAsset:
         self.is_state_reason = is_state_reason
 
         if hypervisor is not None:
-            if type(hypervisor) == ContextAsset:
+            if isinstance(hypervisor, ContextAsset):
                 self.hypervisor = hypervisor
             else:
                 mlog.error("hypervisor has to be of type 'Device'")
@@ -730,40 +1498,140 @@ class ContextAsset:
             self.hypervisor = None
 
         self.virtualization_type = virtualization_type
-        self.virtual_locations = virtual_locations
-        self.services = services
-        self.vulnerabilities = vulnerabilities
-        self.domains = domains
-
-        if network is not None:
-            if type(network) == ipaddress.IPv4Network or type(network) == ipaddress.IPv6Network:
-                self.network = network
-            else:
-                self.network = ipaddress.ip_network(network)
-        else:
-            self.network = None
+        self.virtual_locations = [] if virtual_locations is None else virtual_locations
+        self.services = [] if services is None else services
+        self.vulnerabilities = [] if vulnerabilities is None else vulnerabilities
+        self.domains = [] if domains is None else domains
 
-        self.interfaces = interfaces
-        self.ports = ports
-        self.protocols = protocols
+        self.network = network
+        self.interfaces = [] if interfaces is None else interfaces
+        self.ports = _pack_ports(ports)
+        self.protocols = [_intern(protocol) for protocol in protocols] if protocols else []
 
         # if self.local_ip == DEFAULT_IP and self.global_ip == DEFAULT_IP:
         # mlog.error("No IP address was specified")
         # raise ValueError("No IP address was specified")
 
         if not last_update:
-            self.timestamp = datetime.datetime.now()  # when the object was created (for cross-context compatibility)
+            self._timestamp = time_ns()  # when the object was created (for cross-context compatibility), see 'timestamp'
         else:
             self.timestamp = last_update
 
-    def __dict__(self):
-        """Returns the object as a dict."""
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Returns when the object was created (for cross-context compatibility). It is converted to a datetime on first access."""
+        if type(self._timestamp) is int:
+            self._timestamp = _ns_to_datetime(self._timestamp)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value):
+        self._timestamp = value
+
+    # IPv4 addresses and networks are stored as 32-bit integers and only turned into ipaddress objects when accessed
+    @property
+    def local_ip(self) -> Union[ipaddress.IPv4Address, ipaddress.IPv6Address]:
+        """Returns the local IP address of the device."""
+        return _unpack_ip(self._local_ip)
+
+    @local_ip.setter
+    def local_ip(self, value):
+        self._local_ip = _pack_ip(cast_to_ipaddress(value, strict=False))
+
+    @property
+    def global_ip(self) -> Union[ipaddress.IPv4Address, ipaddress.IPv6Address]:
+        """Returns the global IP address of the device."""
+        return _unpack_ip(self._global_ip)
+
+    @global_ip.setter
+    def global_ip(self, value):
+        self._global_ip = _pack_ip(cast_to_ipaddress(value, strict=False))
+
+    @property
+    def ips(self) -> List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
+        """Returns all IP addresses of the device."""
+        return [_unpack_ip(ip) for ip in self._ips]
+
+    @ips.setter
+    def ips(self, value):
+        self._ips = [] if value is None else _pack_ips(value)
+
+    @property
+    def network(self) -> Union[ipaddress.IPv4Network, ipaddress.IPv6Network]:
+        """Returns the network of the device."""
+        if type(self._network) is tuple:
+            base, mask = self._network
+            return ipaddress.IPv4Network((base, bin(mask).count("1")))
+        return self._network
+
+    @network.setter
+    def network(self, value):
+        if value in ("", "None"):  # As written by to_dict() of earlier versions for devices without a network
+            value = None
+        if value is not None and not isinstance(value, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+            value = ipaddress.ip_network(value)
+        if type(value) is ipaddress.IPv4Network:
+            value = (int(value.network_address), int(value.netmask))
+        self._network = value
+
+    def has_ip(self, ip) -> bool:
+        """Returns whether the given IP address is one of the IP addresses of the device (see 'ips').
+
+        Searches the packed addresses directly, without creating an IPv4Address object for each of them.
+
+        Args:
+            ip (Union[str, ipaddress.IPv4Address, ipaddress.IPv6Address]): The IP address to check
+
+        Returns:
+            bool: True if the device has the IP address, False if not (or if the IP address is invalid)
+        """
+        ip = cast_to_ipaddress(ip, strict=False)
+        if ip is None:
+            return False
+        return _pack_ip(ip) in self._ips
+
+    def in_network(self, ip) -> bool:
+        """Returns whether the given IP address is part of the network of the device.
+
+        Args:
+            ip (Union[str, ipaddress.IPv4Address, ipaddress.IPv6Address]): The IP address to check
+
+        Returns:
+            bool: True if the IP address is part of the network, False if not (or if the device has no network)
+        """
+        ip = cast_to_ipaddress(ip, strict=False)
+        if ip is None or self._network is None:
+            return False
+        if type(self._network) is tuple:
+            if type(ip) is not ipaddress.IPv4Address:
+                return False
+            base, mask = self._network
+            return int(ip) & mask == base
+        return ip in self._network
+
+    def to_dict(self, raw=False):
+        """Returns the object as a dict.
+
+        Args:
+            raw (bool, optional): If True, the owner, location, network and the IP addresses, users, services and
+                vulnerabilities lists hold the objects themselves instead of their string representations. They are then
+                converted by the JSON encoder (default=str), only when actually serialized. Defaults to False.
+        """
+        if raw:
+            owner, location, network = self.owner, self.location, self.network
+            ips, users, services, vulnerabilities = self.ips, list(self.user), list(self.services), list(self.vulnerabilities)
+        else:
+            owner, location, network = _str_or_none(self.owner), _str_or_none(self.location), _str_or_none(self.network)
+            ips = [str(ip) for ip in self.ips]
+            users = [str(user) for user in self.user]
+            services = [str(service) for service in self.services]
+            vulnerabilities = [str(vulnerability) for vulnerability in self.vulnerabilities]
 
         dict_ = {
             "device_name": self.name,
-            "device_local_ip": str(self.local_ip),
-            "device_global_ip": str(self.global_ip),
-            "device_ips": [str(ip) for ip in self.ips],
+            "device_local_ip": _str_or_none(self.local_ip),
+            "device_global_ip": _str_or_none(self.global_ip),
+            "device_ips": ips,
             "device_mac": self.mac,
             "device_vendor": self.vendor,
             "device_os": self.os,
@@ -773,21 +1641,21 @@ class ContextAsset:
             "device_kernel": self.kernel,
             "device_in_scope": self.in_scope,
             "device_tags": self.tags,
-            "device_created_at": str(self.created_at),
-            "device_updated_at": str(self.updated_at),
+            "device_created_at": _str_or_none(self.created_at),
+            "device_updated_at": _str_or_none(self.updated_at),
             "device_in_use": self.in_use,
             "device_type": self.type,
-            "device_owner": str(self.owner),
+            "device_owner": owner,
             "device_uuid": self.uuid,
             "device_aliases": self.aliases,
             "device_description": self.description,
-            "device_location": str(self.location),
+            "device_location": location,
             "device_notes": self.notes,
-            "device_last_seen": str(self.last_seen),
-            "device_first_seen": str(self.first_seen),
-            "device_last_scan": str(self.last_scan),
-            "device_last_update": str(self.last_update),
-            "device_user": [str(user) for user in self.user],
+            "device_last_seen": _str_or_none(self.last_seen),
+            "device_first_seen": _str_or_none(self.first_seen),
+            "device_last_scan": _str_or_none(self.last_scan),
+            "device_last_update": _str_or_none(self.last_update),
+            "device_user": users,
             "device_group": self.group,
             "device_auth_types": self.auth_types,
             "device_auth_stored_in": self.auth_stored_in,
@@ -798,20 +1666,25 @@ class ContextAsset:
             "device_hypervisor": self.hypervisor,
             "device_virtualization_type": self.virtualization_type,
             "device_virtual_locations": self.virtual_locations,
-            "device_services": [str(service) for service in self.services],
-            "device_vulnerabilities": [str(vulnerability) for vulnerability in self.vulnerabilities],
+            "device_services": services,
+            "device_vulnerabilities": vulnerabilities,
             "device_domains": self.domains,
-            "device_network": str(self.network),
+            "device_network": network,
             "device_interfaces": self.interfaces,
-            "device_ports": self.ports,
+            "device_ports": list(self.ports),
             "device_protocols": self.protocols,
         }
 
         return dict_
 
+    def _to_json_dict(self):
+        """Returns the dictionary representation of the object without None values and trivial strings.
+        Nested objects are kept, so that they are serialized as nested JSON by _json_default()."""
+        return _strip_none(type(self), self.to_dict(raw=True))
+
     def __str__(self):
         """Returns the object as a string."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        return _dumps_indented(self._to_json_dict())
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -819,13 +1692,37 @@ class ContextAsset:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        failed = []
         for key, value in dict_.items():
+            attr = _DEVICE_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("device_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
+
+
+_DEVICE_KEY_XLAT = _key_table("device_", ContextAsset.__slots__)
+
+
+_RULE_FIELDS = (
+    ("rule_id", "id", None),
+    ("rule_name", "name", None),
+    ("rule_description", "description", None),
+    ("rule_severity", "severity", None),
+    ("rule_risk_score", "risk_score", None),
+    ("rule_query", "query", None),
+    ("rule_mitre_references", "mitre_references", None),
+    ("rule_known_false_positives", "known_false_positives", None),
+    ("rule_tags", "tags", None),
+    ("rule_raw", "raw", None),
+    ("rule_created_at", "created_at", _lazy_str),
+    ("rule_updated_at", "updated_at", _lazy_str),
+)
 
 
 class Rule:
@@ -850,6 +1747,22 @@ class Rule:
         __str__(self)
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "severity",
+        "risk_score",
+        "tags",
+        "raw",
+        "created_at",
+        "updated_at",
+        "query",
+        "mitre_references",
+        "known_false_positives",
+    )
+    __getstate__, __setstate__ = _compile_pickling("Rule", __slots__)
+
     def __init__(
         self,
         id: str = None,
@@ -865,7 +1778,6 @@ class Rule:
         mitre_references: List[str] = None,
         known_false_positives: str = None,
     ):
-        mlog = logging_helper.Log("lib.class_helper")
 
         if type(id) is not str:
             # mlog.warning("The ID of the rule is not a string: " + str(id) + ". Converting to string.")
@@ -886,28 +1798,11 @@ class Rule:
         self.mitre_references = mitre_references
         self.known_false_positives = known_false_positives
 
-    def __dict__(self):
-        """Returns the dictionary representation of the object."""
-        dict_ = {
-            "rule_id": self.id,
-            "rule_name": self.name,
-            "rule_description": self.description,
-            "rule_severity": self.severity,
-            "rule_risk_score": self.risk_score,
-            "rule_query": self.query,
-            "rule_mitre_references": self.mitre_references,
-            "rule_known_false_positives": self.known_false_positives,
-            "rule_tags": self.tags,
-            "rule_raw": self.raw,
-            "rule_created_at": str(self.created_at),
-            "rule_updated_at": str(self.updated_at),
-        }
-
-        return dict_
+    to_dict, _to_json_dict = _compile_serializers("Rule", _RULE_FIELDS)
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        return _dumps_indented(self._to_json_dict())
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -915,20 +1810,51 @@ class Rule:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        failed = []
         for key, value in dict_.items():
-            # First we have to remove the 'rule_' prefix from the keys
+            attr = _RULE_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("rule_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
 
     # Getter and setter;
 
     # ...
 
 
+_RULE_KEY_XLAT = _key_table("rule_", Rule.__slots__)
+
+
+_CERTIFICATE_FIELDS = (
+    ("cert_timestamp", "timestamp", None),
+    ("cert_related_alert_uuid", "related_alert_uuid", None),
+    ("cert_subject", "subject", None),
+    ("cert_issuer", "issuer", None),
+    ("cert_issuer_common_name", "issuer_common_name", None),
+    ("cert_issuer_organization", "issuer_organization", None),
+    ("cert_issuer_organizational_unit", "issuer_organizational_unit", None),
+    ("cert_serial_number", "serial_number", None),
+    ("cert_subject_common_name", "subject_common_name", None),
+    ("cert_subject_organization", "subject_organization", None),
+    ("cert_subject_organizational_unit", "subject_organizational_unit", None),
+    ("cert_subject_alternative_names", "subject_alternative_names", None),
+    ("cert_valid_from", "valid_from", _lazy_str),
+    ("cert_valid_to", "valid_to", _lazy_str),
+    ("cert_version", "version", None),
+    ("cert_signature_algorithm", "signature_algorithm", None),
+    ("cert_public_key_algorithm", "public_key_algorithm", None),
+    ("cert_public_key_size", "public_key_size", None),
+    ("cert_is_trusted", "is_trusted", None),
+    ("cert_is_self_signed", "is_self_signed", None),
+)
+
+
 class Certificate:
     """Certificate class.
         ! This class is not a stand-alone context. !
@@ -961,6 +1887,31 @@ class Certificate:
         __str__(self)
     """
 
+    __slots__ = (
+        "related_alert_uuid",
+        "issuer",
+        "issuer_common_name",
+        "issuer_organization",
+        "issuer_organizational_unit",
+        "serial_number",
+        "subject",
+        "subject_common_name",
+        "subject_organization",
+        "subject_organizational_unit",
+        "subject_alternative_names",
+        "valid_from",
+        "valid_to",
+        "version",
+        "signature_algorithm",
+        "public_key_algorithm",
+        "public_key_size",
+        "_timestamp",
+        "is_trusted",
+        "is_self_signed",
+        "_cached_json",
+    )
+    __getstate__, __setstate__ = _compile_pickling("Certificate", __slots__)
+
     def __init__(
         self,
         related_alert_uuid: uuid.UUID,
@@ -995,7 +1946,7 @@ class Certificate:
         self.subject_organizational_unit = subject_organizational_unit
         self.subject_alternative_names = subject_alternative_names
 
-        if valid_from != None and valid_to != None:
+        if valid_from is not None and valid_to is not None:
             if valid_from > valid_to:
                 raise ValueError("valid_from must be before valid_to")
 
@@ -1005,43 +1956,34 @@ class Certificate:
         self.signature_algorithm = signature_algorithm
         self.public_key_algorithm = public_key_algorithm
 
-        if public_key_size != None and public_key_size < 0:
+        if public_key_size is not None and public_key_size < 0:
             raise ValueError("public_key_size must be positive")
 
         self.public_key_size = public_key_size
-        self.timestamp = datetime.datetime.now()  # when the object was created (for cross-context compatibility)
+        self._timestamp = time_ns()  # when the object was created (for cross-context compatibility), see 'timestamp'
 
         self.is_trusted = is_trusted
         self.is_self_signed = is_self_signed
+        self._cached_json = None  # Certificates do not change after creation, so __str__() is only encoded once
 
-    def __dict__(self):
-        dict_ = {
-            "cert_timestamp": self.timestamp,
-            "cert_related_alert_uuid": self.related_alert_uuid,
-            "cert_subject": self.subject,
-            "cert_issuer": self.issuer,
-            "cert_issuer_common_name": self.issuer_common_name,
-            "cert_issuer_organization": self.issuer_organization,
-            "cert_issuer_organizational_unit": self.issuer_organizational_unit,
-            "cert_serial_number": self.serial_number,
-            "cert_subject_common_name": self.subject_common_name,
-            "cert_subject_organization": self.subject_organization,
-            "cert_subject_organizational_unit": self.subject_organizational_unit,
-            "cert_subject_alternative_names": self.subject_alternative_names,
-            "cert_valid_from": str(self.valid_from),
-            "cert_valid_to": str(self.valid_to),
-            "cert_version": self.version,
-            "cert_signature_algorithm": self.signature_algorithm,
-            "cert_public_key_algorithm": self.public_key_algorithm,
-            "cert_public_key_size": self.public_key_size,
-            "cert_is_trusted": self.is_trusted,
-            "cert_is_self_signed": self.is_self_signed,
-        }
-        return dict_
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Returns when the object was created (for cross-context compatibility). It is converted to a datetime on first access."""
+        if type(self._timestamp) is int:
+            self._timestamp = _ns_to_datetime(self._timestamp)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value):
+        self._timestamp = value
+
+    to_dict, _to_json_dict = _compile_serializers("Certificate", _CERTIFICATE_FIELDS)
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        if self._cached_json is None:
+            self._cached_json = _dumps_indented(self._to_json_dict())
+        return self._cached_json
 
 
 class ContextFile:
@@ -1092,6 +2034,46 @@ class ContextFile:
         __str__(self): The string representation of the ContextFile class
     """
 
+    __slots__ = (
+        "related_alert_uuid",
+        "timestamp",
+        "action",
+        "name",
+        "original_name",
+        "path",
+        "original_path",
+        "size",
+        "md5",
+        "sha1",
+        "sha256",
+        "type",
+        "extension",
+        "signature",
+        "_uuid",
+        "process_name",
+        "process_id",
+        "process_uuid",
+        "header_bytes",
+        "entropy",
+        "is_encrypted",
+        "is_compressed",
+        "is_archive",
+        "is_executable",
+        "is_readable",
+        "is_writable",
+        "is_hidden",
+        "is_system",
+        "is_temporary",
+        "is_virtual",
+        "is_directory",
+        "is_symlink",
+        "is_special",
+        "is_unknown",
+        "last_modified",
+        "_cached_json",
+    )
+    __getstate__, __setstate__ = _compile_pickling("ContextFile", __slots__, lazy=("_uuid",))
+
     def __init__(
         self,
         related_alert_uuid: uuid.UUID = None,
@@ -1128,7 +2110,7 @@ class ContextFile:
         is_symlink: bool = False,
         is_special: bool = False,
         is_unknown: bool = False,
-        uuid: uuid.UUID = uuid.uuid4(),
+        uuid: uuid.UUID = None,
     ):
         self.related_alert_uuid = related_alert_uuid
         self.timestamp = timestamp
@@ -1150,19 +2132,19 @@ class ContextFile:
         self.sha1 = file_sha1
         self.sha256 = file_sha256
 
-        self.type = file_type
+        self.type = _intern(file_type)
 
         if (
             file_extension and file_extension != "" and file_extension[0] == "." and len(file_extension) > 1
         ):  # ContextFile extension should not start with a dot in the variable
             file_extension = file_extension[1:]
-        self.extension = file_extension
+        self.extension = _intern(file_extension)
 
         self.signature = file_signature
 
-        self.name = process_name
-        self.id = process_id
-        self.uuid = process_uuid
+        self.process_name = process_name
+        self.process_id = process_id
+        self.process_uuid = process_uuid
 
         self.header_bytes = file_header_bytes
         self.entropy = file_entropy
@@ -1184,9 +2166,21 @@ class ContextFile:
 
         self.last_modified = last_modified
         self.timestamp = last_modified  # For cross-context compatibility
-        self.uuid = uuid
+        self.uuid = uuid  # Generated on first access if not given
+        self._cached_json = None  # Set by freeze()
 
-    def __dict__(self):
+    @property
+    def uuid(self) -> uuid.UUID:
+        """Returns the UUID of the file. A random UUID is only generated when it is first needed."""
+        if self._uuid is None:
+            self._uuid = uuid4()
+        return self._uuid
+
+    @uuid.setter
+    def uuid(self, value):
+        self._uuid = value
+
+    def to_dict(self):
         dict_ = {
             "file_related_alert_uuid": self.related_alert_uuid,
             "file_timestamp": self.timestamp,
@@ -1201,12 +2195,12 @@ class ContextFile:
             "file_sha256": self.sha256,
             "file_type": self.type,
             "file_extension": self.extension,
-            "file_signature": str(self.signature),
+            "file_signature": _str_or_none(self.signature),
             "file_header_bytes": self.header_bytes,
-            "file_entropy": str(self.entropy),
-            "file_process_name": self.name,
-            "file_process_id": self.id,
-            "file_process_uuid": self.uuid,
+            "file_entropy": _str_or_none(self.entropy),
+            "file_process_name": self.process_name,
+            "file_process_id": self.process_id,
+            "file_process_uuid": self.process_uuid,
             "file_is_encrypted": self.is_encrypted,
             "file_is_compressed": self.is_compressed,
             "file_is_archive": self.is_archive,
@@ -1227,9 +2221,32 @@ class ContextFile:
         }
         return dict_
 
+    def _to_json_dict(self):
+        """Returns the dictionary representation of the object without None values and trivial strings."""
+        return _strip_none(type(self), self.to_dict())
+
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        if self._cached_json is not None:
+            return self._cached_json
+        return _dumps_indented(self._to_json_dict())
+
+    def to_bytes(self) -> bytes:
+        """Returns the string representation of the object as UTF-8 encoded bytes, e.g. for writing it to a file or socket."""
+        if self._cached_json is not None:
+            return self._cached_json.encode()
+        return _dumps_indented_bytes(self._to_json_dict())
+
+    def freeze(self):
+        """Caches the string representation of the object. Call this once the object is fully populated.
+        Changes made after freeze() are not reflected in __str__() until load_from_dict() is called.
+
+        Returns:
+            The object itself
+        """
+        self._cached_json = None
+        self._cached_json = str(self)
+        return self
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -1237,14 +2254,33 @@ class ContextFile:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        self._cached_json = None
+        failed = []
         for key, value in dict_.items():
-            # First we have to remove the 'file_' prefix from the keys
+            attr = _FILE_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("file_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
+
+
+_FILE_KEY_XLAT = _key_table("file_", ContextFile.__slots__)
+
+
+_DNS_FIELDS = (
+    ("dns_related_alert_uuid", "related_alert_uuid", None),
+    ("dns_type", "type", None),
+    ("dns_query", "query", None),
+    ("dns_has_response", "has_response", None),
+    ("dns_query_response", "query_response", _lazy_str),
+    ("dns_rcode", "rcode", None),
+    ("dns_timestamp", "timestamp", None),
+)
 
 
 class DNSQuery:
@@ -1262,6 +2298,18 @@ class DNSQuery:
         __str__(self)
     """
 
+    __slots__ = (
+        "related_alert_uuid",
+        "type",
+        "query",
+        "has_response",
+        "query_response",
+        "rcode",
+        "timestamp",
+        "_cached_json",
+    )
+    __getstate__, __setstate__ = _compile_pickling("DNSQuery", __slots__)
+
     def __init__(
         self,
         related_alert_uuid: uuid.UUID = None,
@@ -1270,41 +2318,50 @@ class DNSQuery:
         has_response: bool = False,
         query_response: Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str] = None,
         rcode: str = "NOERROR",
-        timestamp=datetime.datetime.now(),
+        timestamp=None,
     ):
+        self._cached_json = None  # Set by freeze()
         self.related_alert_uuid = related_alert_uuid
 
-        if type not in ["A", "AAAA", "CNAME", "MX", "NS", "PTR", "SOA", "SRV", "TXT"]:
+        if type not in _DNS_TYPES:
             pass  # raise ValueError("type must be one of A, AAAA, CNAME, MX, NS, PTR, SOA, SRV, TXT")
 
-        self.type = type
+        self.type = _intern(type)
         self.query = query
 
         self.has_response = has_response
 
-        if has_response and query_response == None:
-            mlog = logging_helper.Log("lib.class_helper")
+        if has_response and query_response is None:
             mlog.warning("DNSQuery __init__: query_response is still DEFAULT_IP while has_response is True.", str(self))
         self.query_response = query_response
 
-        self.rcode = rcode
-        self.timestamp = timestamp
+        self.rcode = _intern(rcode)
+        self.timestamp = timestamp if timestamp is not None else datetime.datetime.now()
 
-    def __dict__(self):
-        dict_ = {
-            "dns_related_alert_uuid": self.related_alert_uuid,
-            "dns_type": self.type,
-            "dns_query": self.query,
-            "dns_has_response": self.has_response,
-            "dns_query_response": str(self.query_response),
-            "dns_rcode": self.rcode,
-            "dns_timestamp": self.timestamp,
-        }
-        return dict_
+    to_dict, _to_json_dict = _compile_serializers("DNSQuery", _DNS_FIELDS)
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        if self._cached_json is not None:
+            return self._cached_json
+        return _dumps_indented(self._to_json_dict())
+
+    def to_bytes(self) -> bytes:
+        """Returns the string representation of the object as UTF-8 encoded bytes, e.g. for writing it to a file or socket."""
+        if self._cached_json is not None:
+            return self._cached_json.encode()
+        return _dumps_indented_bytes(self._to_json_dict())
+
+    def freeze(self):
+        """Caches the string representation of the object. Call this once the object is fully populated.
+        Changes made after freeze() are not reflected in __str__() until load_from_dict() is called.
+
+        Returns:
+            The object itself
+        """
+        self._cached_json = None
+        self._cached_json = str(self)
+        return self
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -1312,14 +2369,22 @@ class DNSQuery:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        self._cached_json = None
+        failed = []
         for key, value in dict_.items():
-            # First we have to remove the 'dns_' prefix from the keys
+            attr = _DNS_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("dns_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
+
+
+_DNS_KEY_XLAT = _key_table("dns_", DNSQuery.__slots__)
 
 
 class HTTP:
@@ -1348,8 +2413,32 @@ class HTTP:
     Methods:
 
         __str__(self)
+        validate(self)
     """
 
+    __slots__ = (
+        "related_alert_uuid",
+        "full_url",
+        "user_agent",
+        "referer",
+        "status_message",
+        "request_body",
+        "response_body",
+        "request_headers",
+        "response_headers",
+        "http_version",
+        "certificate",
+        "file",
+        "timestamp",
+        "method",
+        "type",
+        "host",
+        "status_code",
+        "path",
+        "_cached_json",
+    )
+    __getstate__, __setstate__ = _compile_pickling("HTTP", __slots__)
+
     def __init__(
         self,
         related_alert_uuid: uuid.UUID = None,
@@ -1369,59 +2458,45 @@ class HTTP:
         http_version: str = None,
         certificate: Certificate = None,
         file: ContextFile = None,
-        timestamp: datetime.datetime = datetime.datetime.now(),
+        timestamp: datetime.datetime = None,
     ):
+        self._cached_json = None  # Set by freeze(). First, as the warnings below already call __str__()
         self.related_alert_uuid = related_alert_uuid
-        self.full_url = None
-        self.user_agent = None
-        self.referer = None
-        self.status_message = None
-        self.request_body = None
-        self.response_body = None
-        self.request_headers = None
-        self.response_headers = None
-        self.http_version = None
-        self.certificate = None
-        self.file = None
-        self.timestamp = None
-
-        self.timestamp = timestamp
-        mlog = logging_helper.Log("lib.class_helper")
+        self.timestamp = timestamp if timestamp is not None else datetime.datetime.now()
 
-        if method not in ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH", "Unknown (Encrypted)"]:
+        if method not in _HTTP_METHODS:
             pass  # raise ValueError("method must be one of GET, POST, PUT, DELETE, HEAD, OPTIONS, PATCH")
-        self.method = method
+        self.method = _intern(method)
 
-        if type not in ["HTTP", "HTTPS"]:
+        if type not in _HTTP_TYPES:
             pass  # raise ValueError("type must be one of HTTP, HTTPS")
-        self.type = type
+        self.type = _intern(type)
 
         if host == "":
             pass  # raise ValueError("host must not be empty")
         self.host = host
 
-        try:
-            status_code = int(status_code) if status_code != None else None
-        except:
-            if method != "Unknown (Encrypted)":
-                pass  # raise ValueError("status_code must be an integer")
+        if status_code is not None and not isinstance(status_code, int):
+            try:
+                status_code = int(status_code)
+            except (TypeError, ValueError):
+                if method != "Unknown (Encrypted)":
+                    pass  # raise ValueError("status_code must be an integer")
 
         self.status_code = status_code
 
         self.path = None
-        if path != None and "/" not in path:
+        if path is not None and "/" not in path:
             mlog.warning("HTTP Object __init__: path does not contain any '/'. Path: '" + str(path) + "' Object: " + str(self))
         if path and path[0] != "/":
             self.path = "/" + path
         else:
             self.path = path
 
-        if full_url == None:
-            self.full_url = type.lower() + "://" + host + self.path if self.type != None else None
+        if full_url is None:
+            self.full_url = self._build_url() if self.type is not None else None
         else:
-            if full_url != type.lower() + "://" + host + self.path:
-                mlog.warning("HTTP Object __init__: full_url does not match type, host and/or path. " + str(self))
-            self.full_url = full_url
+            self.full_url = full_url  # Trusted as given, see validate()
 
         self.user_agent = user_agent
         self.referer = referer
@@ -1433,23 +2508,22 @@ class HTTP:
         self.request_headers = request_headers
         self.response_headers = response_headers
 
-        if http_version != None and "." not in http_version:
+        if http_version is not None and "." not in http_version:
             pass  # raise ValueError("http_version must be a valid version number if not None")
         self.http_version = http_version
 
         # Check if certificate is valid
-        if certificate != None:
+        if certificate is not None:
             if type != "HTTPS":
                 pass  # raise ValueError("certificate must be None if type is not HTTPS")
             if host not in certificate.subject and host not in certificate.subject_alternative_names:
-                mlog = logging_helper.Log("lib.class_helper")
                 mlog.warning(
                     "HTTP __init__: Certificate: HTTP.host does not match certificate subject nor subject_alternative_names"
                 )
         self.certificate = certificate
         self.file = file
 
-    def __dict__(self):
+    def to_dict(self):
         try:
             dict_ = {
                 "http_timestamp": self.timestamp,
@@ -1464,12 +2538,12 @@ class HTTP:
                 "http_referer": self.referer,
                 "http_status_message": self.status_message,
                 "http_request_body": self.request_body,
-                "http_response_body": self.response_body if self.response_body != None else "http_",
+                "http_response_body": self.response_body if self.response_body is not None else "http_",
                 "http_request_headers": self.request_headers,
                 "http_response_headers": self.response_headers,
                 "http_version": self.http_version,
-                "http_certificate": str(self.certificate),
-                "http_file": str(self.file),
+                "http_certificate": _str_or_none(self.certificate),
+                "http_file": _str_or_none(self.file),
             }
         except AttributeError:
             dict_ = {
@@ -1481,9 +2555,50 @@ class HTTP:
 
         return dict_
 
+    def _build_url(self) -> str:
+        """Returns the URL made up of the type, host and path of the request."""
+        scheme = _URL_SCHEMES.get(self.type)
+        if scheme is None:
+            scheme = self.type.lower() + "://"
+        return scheme + self.host + self.path
+
+    def validate(self) -> bool:
+        """Checks if the full_url of the request matches its type, host and path. Logs a warning if it does not.
+
+        Returns:
+            bool: True if the full_url matches, False if not
+        """
+        if self.full_url != self._build_url():
+            mlog.warning("HTTP Object validate: full_url does not match type, host and/or path. " + str(self))
+            return False
+        return True
+
+    def _to_json_dict(self):
+        """Returns the dictionary representation of the object without None values and trivial strings."""
+        return _strip_none(type(self), self.to_dict())
+
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        if self._cached_json is not None:
+            return self._cached_json
+        return _dumps_indented(self._to_json_dict())
+
+    def to_bytes(self) -> bytes:
+        """Returns the string representation of the object as UTF-8 encoded bytes, e.g. for writing it to a file or socket."""
+        if self._cached_json is not None:
+            return self._cached_json.encode()
+        return _dumps_indented_bytes(self._to_json_dict())
+
+    def freeze(self):
+        """Caches the string representation of the object. Call this once the object is fully populated.
+        Changes made after freeze() are not reflected in __str__() until load_from_dict() is called.
+
+        Returns:
+            The object itself
+        """
+        self._cached_json = None
+        self._cached_json = str(self)
+        return self
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -1491,14 +2606,62 @@ class HTTP:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        self._cached_json = None
+        failed = []
         for key, value in dict_.items():
-            # First we have to remove the 'http_' prefix from the keys
+            attr = _HTTP_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("http_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
+
+
+_HTTP_KEY_XLAT = _key_table("http_", HTTP.__slots__)
+_HTTP_KEY_XLAT["http_version"] = "http_version"  # The only attribute that already carries the prefix
+
+_FLOW_FIELDS = (
+    ("flow_related_alert_uuid", "related_alert_uuid", None),
+    ("flow_alert relevance", "alert_relevance", None),
+    ("flow_timestamp", "timestamp", _lazy_str),
+    ("flow_data", "data", None),
+    ("flow_integration", "integration", None),
+    ("flow_firewall_action", "firewall_action", None),
+    ("flow_source_ip", "source_ip", _lazy_str),
+    ("flow_source_location", "source_location", _nested_obj),
+    ("flow_source_port", "source_port", None),
+    ("flow_destination_ip", "destination_ip", _lazy_str),
+    ("flow_destination_location", "destination_location", _nested_obj),
+    ("flow_destination_port", "destination_port", None),
+    ("flow_protocol", "protocol", None),
+    ("flow_process_uuid", "process_uuid", _lazy_str),
+    ("flow_process_id", "process_id", None),
+    ("flow_process_name", "process_name", None),
+    ("flow_source_mac", "source_mac", None),
+    ("flow_destination_mac", "destination_mac", None),
+    ("flow_source_hostname", "source_hostname", None),
+    ("flow_destination_hostname", "destination_hostname", None),
+    ("flow_category", "category", None),
+    ("flow_sub_category", "sub_category", None),
+    ("flow_direction", "direction", None),
+    ("flow_id", "id", None),
+    ("flow_bytes_send", "bytes_send", None),
+    ("flow_bytes_received", "bytes_received", None),
+    ("flow_interface", "interface", None),
+    ("flow_network", "network", None),
+    ("flow_network_type", "network_type", None),
+    ("flow_source", "source", None),
+    ("flow_application", "application", None),
+    ("flow_http", "http", _nested_obj),
+    ("flow_dns_query", "dns_query", _nested_obj),
+    ("flow_device", "device", _nested_obj),
+    ("flow_firewall_rule_id", "firewall_rule_id", None),
+    ("flow_uuid", "uuid", _lazy_str),
+)
 
 
 class ContextFlow:
@@ -1543,10 +2706,51 @@ class ContextFlow:
         alert_relevance (int): The relevance of the flow to the alert (0-100)
 
     Methods:
-        __init__(self, timestamp: datetime.datetime, integration: str, source_ip: socket.inet_aton, source_port: int, destination_ip: socket.inet_aton, destination_port: int, protocol: str, application: str, data: str = None, source_mac: socket.mac = None, destination_mac: str = None, source_hostname: str = None, destination_hostname: str = None, category: str = "Generic Flow", sub_category: str = "Generic HTTP(S) Traffic", flow_direction: str = "L2R", flow_id: int = random.randint(1, 1000000000), interface: str = None, network: str = None, network_type: str = None, flow_source: str = None)
+        __init__(self, timestamp: datetime.datetime, integration: str, source_ip: socket.inet_aton, source_port: int, destination_ip: socket.inet_aton, destination_port: int, protocol: str, application: str, data: str = None, source_mac: socket.mac = None, destination_mac: str = None, source_hostname: str = None, destination_hostname: str = None, category: str = "Generic Flow", sub_category: str = "Generic HTTP(S) Traffic", flow_direction: str = "L2R", flow_id: int = None, interface: str = None, network: str = None, network_type: str = None, flow_source: str = None)
         __str__(self)
     """
 
+    __slots__ = (
+        "related_alert_uuid",
+        "timestamp",
+        "data",
+        "bytes_send",
+        "bytes_received",
+        "integration",
+        "source_ip",
+        "source_port",
+        "destination_ip",
+        "destination_port",
+        "protocol",
+        "process_uuid",
+        "process_name",
+        "process_id",
+        "source_mac",
+        "destination_mac",
+        "source_hostname",
+        "destination_hostname",
+        "category",
+        "sub_category",
+        "application",
+        "direction",
+        "id",
+        "interface",
+        "network",
+        "network_type",
+        "source",
+        "source_location",
+        "destination_location",
+        "http",
+        "dns_query",
+        "device",
+        "firewall_action",
+        "firewall_rule_id",
+        "uuid",
+        "alert_relevance",
+        "_cached_json",
+    )
+    __getstate__, __setstate__ = _compile_pickling("ContextFlow", __slots__)
+
     def __init__(
         self,
         related_alert_uuid: uuid.UUID = None,
@@ -1570,7 +2774,7 @@ class ContextFlow:
         category: str = "Generic Flow",
         sub_category: str = "Generic HTTP(S) Traffic",
         flow_direction: str = None,
-        flow_id: int = random.randint(1, 1000000000),
+        flow_id: int = None,
         interface: str = None,
         network: str = None,
         network_type: str = None,
@@ -1583,12 +2787,14 @@ class ContextFlow:
         device: ContextAsset = None,
         firewall_action: str = "Unknown",
         firewall_rule_id: int = None,
-        uuid: uuid.UUID = uuid.uuid4(),
+        uuid: uuid.UUID = None,
         alert_relevance: int = 50,
     ):
         source_ip = cast_to_ipaddress(source_ip, False)
         destination_ip = cast_to_ipaddress(destination_ip, False)
 
+        if flow_id is None:
+            flow_id = _FLOW_ID_RNG.randrange(1, 1000000001)  # Random per flow, not once at import time
         if flow_id < 1 or flow_id > 1000000000:
             pass  # raise ValueError("flow_id must be between 1 and 1000000000")
 
@@ -1597,15 +2803,15 @@ class ContextFlow:
         self.timestamp = timestamp
         self.data = data
 
-        if bytes_send is not None and (type(bytes_send) != int or bytes_send < 0):
+        if bytes_send is not None and (not isinstance(bytes_send, int) or bytes_send < 0):
             pass  # raise ValueError("bytes_send must be an integer greater than 0")
         self.bytes_send = bytes_send
 
-        if bytes_received is not None and (type(bytes_received) != int or bytes_received < 0):
+        if bytes_received is not None and (not isinstance(bytes_received, int) or bytes_received < 0):
             pass  # raise ValueError("bytes_received must be an integer greater than 0")
         self.bytes_received = bytes_received
 
-        self.integration = integration
+        self.integration = _intern(integration)
 
         self.source_ip = source_ip
         self.source_port = source_port
@@ -1613,7 +2819,7 @@ class ContextFlow:
         self.destination_ip = destination_ip
         self.destination_port = destination_port
 
-        self.protocol = protocol
+        self.protocol = _intern(protocol)
 
         self.process_uuid = process_uuid
         self.process_name = process_name
@@ -1625,30 +2831,23 @@ class ContextFlow:
         self.source_hostname = source_hostname
         self.destination_hostname = destination_hostname
 
-        self.category = category
-        self.sub_category = sub_category
-        self.application = application
+        self.category = _intern(category)
+        self.sub_category = _intern(sub_category)
+        self.application = _intern(application)
 
-        if flow_direction not in ["L2R", "R2L", "L2L", "R2R", None]:
+        if flow_direction not in _FLOW_DIRECTIONS:
             pass  # raise ValueError("flow_direction must be either L2R, L2L, R2L, R2R or None")
-        if flow_direction == None and source_ip and destination_ip:
-            if source_ip.is_private and destination_ip.is_private:
-                self.direction = "L2L"
-            elif source_ip.is_private and not destination_ip.is_private:
-                self.direction = "L2R"
-            elif not source_ip.is_private and destination_ip.is_private:
-                self.direction = "R2L"
-            elif not source_ip.is_private and not destination_ip.is_private:
-                self.direction = "R2R"
-        else:
+        if flow_direction is not None or not (source_ip and destination_ip):
             self.direction = flow_direction
+        else:
+            self.direction = _FLOW_DIRECTION_BY_PRIVACY[(source_ip.is_private, destination_ip.is_private)]
 
         self.id = flow_id
 
         self.interface = interface
         self.network = network
-        self.network_type = network_type
-        self.source = flow_source
+        self.network_type = _intern(network_type)
+        self.source = _intern(flow_source)
 
         # Check if location objects are valid if given
         if source_location:
@@ -1683,68 +2882,47 @@ class ContextFlow:
                 raise TypeError("device must be of type ContextDevice")
         self.device = device
 
-        self.firewall_action = firewall_action
+        self.firewall_action = _intern(firewall_action)
         if firewall_action == "blocked":
             self.firewall_action = "Deny"
 
         if (bytes_received is not None and bytes_received == 0) or (bytes_send is not None and bytes_send == 0):
             self.firewall_action = "Deny / Failed Connection"
 
-        if self.firewall_action not in ["Permit", "Deny", "Deny / Failed Connection", "Reject", "Unknown"]:
+        if self.firewall_action not in _FW_ACTIONS:
             pass  # raise ValueError("firewall_action must be either Permit, Deny, Reject or Unknown")
 
         self.firewall_rule_id = firewall_rule_id
 
-        self.uuid = uuid
+        self.uuid = uuid if uuid is not None else uuid4()
         self.alert_relevance = handle_percentage(alert_relevance)
+        self._cached_json = None  # Set by freeze()
 
-    def __dict__(self):
-        # Have to overwrite the __dict__ method because of the ipaddress objects
-
-        dict_ = {
-            "flow_related_alert_uuid": self.related_alert_uuid,
-            "flow_alert relevance": self.alert_relevance,
-            "flow_timestamp": str(self.timestamp),
-            "flow_data": self.data,
-            "flow_integration": self.integration,
-            "flow_firewall_action": self.firewall_action,
-            "flow_source_ip": str(self.source_ip),
-            "flow_source_location": str(self.source_location),
-            "flow_source_port": self.source_port,
-            "flow_destination_ip": str(self.destination_ip),
-            "flow_destination_location": str(self.destination_location),
-            "flow_destination_port": self.destination_port,
-            "flow_protocol": self.protocol,
-            "flow_process_uuid": str(self.process_uuid),
-            "flow_process_id": self.process_id,
-            "flow_process_name": self.process_name,
-            "flow_source_mac": self.source_mac,
-            "flow_destination_mac": self.destination_mac,
-            "flow_source_hostname": self.source_hostname,
-            "flow_destination_hostname": self.destination_hostname,
-            "flow_category": self.category,
-            "flow_sub_category": self.sub_category,
-            "flow_direction": self.direction,
-            "flow_id": self.id,
-            "flow_bytes_send": self.bytes_send,
-            "flow_bytes_received": self.bytes_received,
-            "flow_interface": self.interface,
-            "flow_network": self.network,
-            "flow_network_type": self.network_type,
-            "flow_source": self.source,
-            "flow_application": self.application,
-            "flow_http": str(self.http),
-            "flow_dns_query": str(self.dns_query),
-            "flow_device": str(self.device),
-            "flow_firewall_rule_id": self.firewall_rule_id,
-            "flow_uuid": str(self.uuid),
-        }
-
-        return dict_
+    # Generated from _FLOW_FIELDS (the ipaddress objects are written with str())
+    to_dict, _to_json_dict = _compile_serializers("ContextFlow", _FLOW_FIELDS)
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        if self._cached_json is not None:
+            return self._cached_json
+        return _dumps_indented(self._to_json_dict())
+
+    def to_bytes(self) -> bytes:
+        """Returns the string representation of the object as UTF-8 encoded bytes, e.g. for writing it to a file or socket."""
+        if self._cached_json is not None:
+            return self._cached_json.encode()
+        return _dumps_indented_bytes(self._to_json_dict())
+
+    def freeze(self):
+        """Caches the string representation of the object. Call this once the object is fully populated.
+        Changes made after freeze() are not reflected in __str__() until load_from_dict() is called.
+
+        Returns:
+            The object itself
+        """
+        self._cached_json = None
+        self._cached_json = str(self)
+        return self
 
     # Getter and setter;
 
@@ -1754,14 +2932,79 @@ class ContextFlow:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        self._cached_json = None
+        failed = []
         for key, value in dict_.items():
-            # First we have to remove the 'flow_' prefix from the keys
+            attr = _FLOW_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("flow_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
+
+
+_FLOW_KEY_XLAT = {key: attr for key, attr, _ in _FLOW_FIELDS}
+
+_PROCESS_FIELDS = (
+    ("process_timestamp", "timestamp", None),
+    ("process_related_alert_uuid", "related_alert_uuid", None),
+    ("process_alert_relevance", "alert_relevance", None),
+    ("process_name", "name", None),
+    ("process_id", "id", None),
+    ("parent_process_name", "parent_process_name", None),
+    ("parent_process_id", "parent_process_id", None),
+    ("process_path", "path", None),
+    ("process_md5", "md5", None),
+    ("process_sha1", "sha1", None),
+    ("process_sha256", "sha256", None),
+    ("process_command_line", "command_line", None),
+    ("process_username", "username", None),
+    ("process_integrity_level", "integrity_level", None),
+    ("process_is_elevated_token", "is_elevated_token", None),
+    ("process_token_elevation_type", "token_elevation_type", None),
+    ("process_token_elevation_type_full", "token_elevation_type_full", None),
+    ("process_token_integrity_level", "token_integrity_level", None),
+    ("process_token_integrity_level_full", "token_integrity_level_full", None),
+    ("process_privileges", "privileges", None),
+    ("process_owner", "owner", None),
+    ("process_group_id", "group_id", None),
+    ("process_group_name", "group_name", None),
+    ("process_logon_guid", "logon_guid", None),
+    ("process_logon_id", "logon_id", None),
+    ("process_logon_type", "logon_type", None),
+    ("process_logon_type_full", "logon_type_full", None),
+    ("process_logon_time", "logon_time", _lazy_str),
+    ("process_start_time", "start_time", _lazy_str),
+    ("process_parent_start_time", "parent_start_time", _lazy_str),
+    ("process_current_directory", "current_directory", None),
+    ("process_image_file_device", "image_file_device", None),
+    ("process_image_file_directory", "image_file_directory", None),
+    ("process_image_file_name", "image_file_name", None),
+    ("process_image_file_path", "image_file_path", None),
+    ("process_dns", "dns", None),
+    ("process_signature", "signature", _nested_obj),
+    ("process_http", "http", _nested_obj),
+    ("process_flow", "flow", _nested_obj),
+    ("process_parent", "parent", _nested_obj),
+    ("process_children", "children", _nested_obj),
+    ("process_environment_variables", "environment_variables", None),
+    ("process_arguments", "arguments", None),
+    ("parent_process_arguments", "parent_process_arguments", None),
+    ("process_modules", "modules", None),
+    ("process_thread", "thread", None),
+    ("process_created_files", "created_files", _nested_obj),
+    ("process_deleted_files", "deleted_files", _nested_obj),
+    ("process_modified_files", "modified_files", _nested_obj),
+    ("process_created_registry_keys", "created_registry_keys", None),
+    ("process_deleted_registry_keys", "deleted_registry_keys", None),
+    ("process_modified_registry_keys", "modified_registry_keys", None),
+    ("process_is_complete", "is_complete", None),
+    ("process_uuid", "uuid", None),
+)
 
 
 class ContextProcess:
@@ -1824,6 +3067,66 @@ class ContextProcess:
         __str__(self)
     """
 
+    __slots__ = (
+        "uuid",
+        "timestamp",
+        "related_alert_uuid",
+        "name",
+        "id",
+        "parent_process_name",
+        "parent_process_id",
+        "path",
+        "md5",
+        "sha1",
+        "sha256",
+        "command_line",
+        "username",
+        "integrity_level",
+        "is_elevated_token",
+        "token_elevation_type",
+        "token_elevation_type_full",
+        "token_integrity_level",
+        "token_integrity_level_full",
+        "privileges",
+        "owner",
+        "group_id",
+        "group_name",
+        "logon_guid",
+        "logon_id",
+        "logon_type",
+        "logon_type_full",
+        "logon_time",
+        "start_time",
+        "parent_start_time",
+        "current_directory",
+        "image_file_device",
+        "image_file_directory",
+        "image_file_name",
+        "image_file_path",
+        "dns",
+        "signature",
+        "http",
+        "flow",
+        "parent",
+        "children",
+        "environment_variables",
+        "arguments",
+        "parent_process_arguments",
+        "modules",
+        "thread",
+        "created_files",
+        "deleted_files",
+        "modified_files",
+        "created_registry_keys",
+        "deleted_registry_keys",
+        "modified_registry_keys",
+        "is_complete",
+        "alert_relevance",
+        "io_bytes",
+        "io_text",
+    )
+    __getstate__, __setstate__ = _compile_pickling("ContextProcess", __slots__)
+
     # TODO: 1) Change that DNSQuery, HTTP and Certificate are directly inside a ContextFlow object, as they depend on each other [DONE]
     #        1b) Remove them as explicit contexts in Alert and CaseFile [DONE]
     #       2) Make that contexts only refere to itself by UUID [DONE]
@@ -1841,7 +3144,7 @@ class ContextProcess:
         process_id: int = -1,
         parent_process_name: str = "N/A",
         parent_process_id: int = 0,
-        parent_process_arguments: List[str] = [],
+        parent_process_arguments: List[str] = None,
         process_path: str = "",
         process_md5: str = "",
         process_sha1: str = "",
@@ -1875,58 +3178,37 @@ class ContextProcess:
         process_http: HTTP = None,
         process_flow: ContextFlow = None,
         process_parent: str = None,  # str UUID
-        process_children: list = [],  # list of str UUIDs
-        process_environment_variables: List[str] = [],
-        process_arguments: List[str] = [],
-        process_modules: List[str] = [],
+        process_children: list = None,  # list of str UUIDs
+        process_environment_variables: List[str] = None,
+        process_arguments: List[str] = None,
+        process_modules: List[str] = None,
         process_thread: str = None,
-        created_files: List[ContextFile] = [],
-        deleted_files: List[ContextFile] = [],
-        modified_files: List[ContextFile] = [],
-        created_registry_keys: List[str] = [],
-        deleted_registry_keys: List[str] = [],
-        modified_registry_keys: List[str] = [],
+        created_files: List[ContextFile] = None,
+        deleted_files: List[ContextFile] = None,
+        modified_files: List[ContextFile] = None,
+        created_registry_keys: List[str] = None,
+        deleted_registry_keys: List[str] = None,
+        modified_registry_keys: List[str] = None,
         process_io_bytes: int = 0,
         process_io_text: str = "",
         is_complete: bool = False,
         alert_relevance: int = 50,
     ):
-        mlog = logging_helper.Log("lib.class_helper")
 
-        self.uuid = str(process_uuid)
-        if process_uuid == None or process_uuid == "":
-            pass  # raise ValueError("uuid cannot be empty")
+        self.uuid = _str_or_none(process_uuid)
         if len(str(process_uuid)) < 36:
-            mlog = logging_helper.Log("lib.class_helper")
             mlog.warning("Process Object __init__: given uuid seems too short")
 
         self.timestamp = timestamp
         self.related_alert_uuid = related_alert_uuid
 
         self.name = process_name
-
-        if process_id < -1:
-            pass  # raise ValueError("process_id cannot be negative (except -1 for 'unknown')")
         self.id = process_id
-
         self.parent_process_name = parent_process_name
-
-        if parent_process_id != None and parent_process_id < 0:
-            pass  # raise ValueError("parent_process_id cannot be negative")
         self.parent_process_id = parent_process_id
-
         self.path = process_path
-
-        if process_md5 != None and process_md5 != "" and len(process_md5) != 32:
-            pass  # raise ValueError("process_md5 must be 32 characters")
         self.md5 = process_md5
-
-        if process_sha1 != None and process_sha1 != "" and len(process_sha1) != 40:
-            pass  # raise ValueError("process_sha1 must be 40 characters")
         self.sha1 = process_sha1
-
-        if process_sha256 != None and process_sha256 != "" and len(process_sha256) != 64:
-            pass  # raise ValueError("process_sha256 must be 64 characters")
         self.sha256 = process_sha256
 
         self.command_line = process_command_line
@@ -1939,11 +3221,7 @@ class ContextProcess:
         self.token_integrity_level_full = process_token_integrity_level_full
         self.privileges = process_privileges
         self.owner = process_owner
-
-        if process_group_id != None and process_group_id < 0:
-            pass  # raise ValueError("process_group_id cannot be negative")
         self.group_id = process_group_id
-
         self.group_name = process_group_name
         self.logon_guid = process_logon_guid
         self.logon_id = process_logon_id
@@ -1969,124 +3247,61 @@ class ContextProcess:
             )
         self.parent = process_parent
 
-        for child in process_children:
-            if not isinstance(child, str):
-                raise TypeError(
-                    "Process Object __init__: all process_children must be of type str to hold the UUID of that child process. Got: "
-                    + str(type(child))
-                    + "for "
-                    + str(child)
-                )
+        if process_children is None:
+            process_children = []
+        if not all(isinstance(child, str) for child in process_children):
+            # Only look for the offending child when there is one, for the error message
+            child = next(child for child in process_children if not isinstance(child, str))
+            raise TypeError(
+                "Process Object __init__: all process_children must be of type str to hold the UUID of that child process. Got: "
+                + str(type(child))
+                + "for "
+                + str(child)
+            )
         self.children = process_children
 
-        self.environment_variables = process_environment_variables
-        self.arguments = process_arguments
-        self.parent_process_arguments = parent_process_arguments
-        self.modules = process_modules
+        self.environment_variables = [] if process_environment_variables is None else process_environment_variables
+        self.arguments = [] if process_arguments is None else process_arguments
+        self.parent_process_arguments = [] if parent_process_arguments is None else parent_process_arguments
+        self.modules = [] if process_modules is None else process_modules
         self.thread = process_thread
 
-        self.created_files = created_files
-        self.deleted_files = deleted_files
-        self.modified_files = modified_files
+        self.created_files = [] if created_files is None else created_files
+        self.deleted_files = [] if deleted_files is None else deleted_files
+        self.modified_files = [] if modified_files is None else modified_files
 
-        self.created_registry_keys = created_registry_keys
-        self.deleted_registry_keys = deleted_registry_keys
-        self.modified_registry_keys = modified_registry_keys
+        self.created_registry_keys = [] if created_registry_keys is None else created_registry_keys
+        self.deleted_registry_keys = [] if deleted_registry_keys is None else deleted_registry_keys
+        self.modified_registry_keys = [] if modified_registry_keys is None else modified_registry_keys
 
-        if is_complete and process_name == None:
-            pass  # raise ValueError("process_name cannot be None if is_complete is True")
-        if is_complete and process_id == None:
-            pass  # raise ValueError("process_id cannot be None if is_complete is True")
-        if is_complete and process_path == None:
+        if is_complete and process_path is None:
             mlog.warning("Process Object __init__: process_path should not be None if is_complete is True")
-        if is_complete and process_md5 == None and process_sha256 == None:
+        if is_complete and process_md5 is None and process_sha256 is None:
             mlog.warning("Process Object __init__: process_md5 or process_sha256 should not be None if is_complete is True")
-        if (
-            is_complete and process_command_line == None and False
-        ):  # deactivated, as this happens often, even if the rest is complete
-            mlog.warning("Process Object __init__: process_command_line should not be None if is_complete is True")
         self.is_complete = is_complete
 
         self.alert_relevance = handle_percentage(alert_relevance)
 
-        if process_io_text and len(process_io_text) > 0 and process_io_bytes > 0:
-            process_io_bytes = len(process_io_text.encode("utf-8"))
+        if process_io_text and not process_io_bytes:
+            process_io_bytes = _utf8_len(process_io_text)  # Only computed when the caller did not provide it
 
         if process_io_bytes and process_io_bytes > THRESHOLD_PROCESS_IO_BYTES:
             mlog.warning(
-                "Process Object __init__: process_io_bytes is above threshold of "
-                + str(THRESHOLD_PROCESS_IO_BYTES)
-                + " bytes. Got: "
-                + str(process_io_bytes)
+                f"Process Object __init__: process_io_bytes is above threshold of {THRESHOLD_PROCESS_IO_BYTES} bytes. Got: {process_io_bytes}"
             )
             process_io_bytes = THRESHOLD_PROCESS_IO_BYTES
-            process_io_text = process_io_text[:THRESHOLD_PROCESS_IO_BYTES]
+            if process_io_text:
+                process_io_text = _truncate_utf8(process_io_text, THRESHOLD_PROCESS_IO_BYTES)  # The threshold is in bytes, not characters
 
         self.io_bytes = process_io_bytes
         self.io_text = process_io_text
 
-    def __dict__(self):
-        _dict = {
-            "process_timestamp": self.timestamp,
-            "process_related_alert_uuid": self.related_alert_uuid,
-            "process_alert_relevance": self.alert_relevance,
-            "process_name": self.name,
-            "process_id": self.id,
-            "parent_process_name": self.parent_process_name,
-            "parent_process_id": self.parent_process_id,
-            "process_path": self.path,
-            "process_md5": self.md5,
-            "process_sha1": self.sha1,
-            "process_sha256": self.sha256,
-            "process_command_line": self.command_line,
-            "process_username": self.username,
-            "process_integrity_level": self.integrity_level,
-            "process_is_elevated_token": self.is_elevated_token,
-            "process_token_elevation_type": self.token_elevation_type,
-            "process_token_elevation_type_full": self.token_elevation_type_full,
-            "process_token_integrity_level": self.token_integrity_level,
-            "process_token_integrity_level_full": self.token_integrity_level_full,
-            "process_privileges": self.privileges,
-            "process_owner": self.owner,
-            "process_group_id": self.group_id,
-            "process_group_name": self.group_name,
-            "process_logon_guid": self.logon_guid,
-            "process_logon_id": self.logon_id,
-            "process_logon_type": self.logon_type,
-            "process_logon_type_full": self.logon_type_full,
-            "process_logon_time": str(self.logon_time),
-            "process_start_time": str(self.start_time),
-            "process_parent_start_time": str(self.parent_start_time),
-            "process_current_directory": self.current_directory,
-            "process_image_file_device": self.image_file_device,
-            "process_image_file_directory": self.image_file_directory,
-            "process_image_file_name": self.image_file_name,
-            "process_image_file_path": self.image_file_path,
-            "process_dns": self.dns,
-            "process_signature": str(self.signature),
-            "process_http": str(self.http),
-            "process_flow": str(self.flow),
-            "process_parent": str(self.parent),
-            "process_children": str(self.children),
-            "process_environment_variables": self.environment_variables,
-            "process_arguments": self.arguments,
-            "parent_process_arguments": self.parent_process_arguments,
-            "process_modules": self.modules,
-            "process_thread": self.thread,
-            "process_created_files": str(self.created_files),
-            "process_deleted_files": str(self.deleted_files),
-            "process_modified_files": str(self.modified_files),
-            "process_created_registry_keys": self.created_registry_keys,
-            "process_deleted_registry_keys": self.deleted_registry_keys,
-            "process_modified_registry_keys": self.modified_registry_keys,
-            "process_is_complete": self.is_complete,
-            "process_uuid": self.uuid,
-        }
-        return _dict
+    # Generated from _PROCESS_FIELDS
+    to_dict, _to_json_dict = _compile_serializers("ContextProcess", _PROCESS_FIELDS)
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(del_none_from_dict(self.__dict__())), indent=4, sort_keys=False, default=str)
+        return _dumps_indented(self._to_json_dict())
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -2094,14 +3309,40 @@ class ContextProcess:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        failed = []
         for key, value in dict_.items():
-            # First we have to remove the 'process_' prefix from the keys
+            attr = _PROCESS_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("process_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
+
+
+_PROCESS_KEY_XLAT = {key: attr for key, attr, _ in _PROCESS_FIELDS}
+
+
+_LOG_FIELDS = (
+    ("log_related_alert_uuid", "related_alert_uuid", _lazy_str),
+    ("log_alert_relevance", "alert_relevance", None),
+    ("log_timestamp", "timestamp", _lazy_str),
+    ("log_message", "message", None),
+    ("log_source_name", "source_name", None),
+    ("log_source_ip", "source_ip", _lazy_str),
+    ("log_source_device", "source_device", str),
+    ("log_flow", "flow", None),
+    ("log_protocol", "protocol", None),
+    ("log_type", "type", None),
+    ("log_severity", "severity", None),
+    ("log_facility", "facility", None),
+    ("log_tags", "tags", None),
+    ("log_custom_fields", "custom_fields", None),
+    ("log_uuid", "uuid", _lazy_str),
+)
 
 
 class ContextLog:
@@ -2131,6 +3372,9 @@ class ContextLog:
 
     """
 
+    __slots__ = tuple(attr for _, attr, _ in _LOG_FIELDS)
+    __getstate__, __setstate__ = _compile_pickling("ContextLog", __slots__)
+
     def __init__(
         self,
         related_alert_uuid: uuid.UUID = None,
@@ -2146,7 +3390,7 @@ class ContextLog:
         log_facility: str = "",
         log_tags: List[str] = None,
         log_custom_fields: dict = None,
-        uuid: uuid.UUID = uuid.uuid4(),
+        uuid: uuid.UUID = None,
         alert_relevance: int = 50,
     ):
         self.related_alert_uuid = related_alert_uuid
@@ -2155,8 +3399,7 @@ class ContextLog:
         self.source_name = log_source_name
 
         # Check log source IP if set
-        if log_source_ip != DEFAULT_IP:
-            self.source_ip = cast_to_ipaddress(log_source_ip)
+        self.source_ip = cast_to_ipaddress(log_source_ip) if log_source_ip != DEFAULT_IP else None
 
         # Check log source device if set
         if log_source_device is not None:
@@ -2164,43 +3407,46 @@ class ContextLog:
                 raise TypeError(f"Expected type Device for log_source_device, got {type(log_source_device)}")
         self.source_device = log_source_device
 
-        # Check if either log_source_device or log_source_ip is set
-        if log_source_device is None and log_source_ip == DEFAULT_IP:
-            pass  # raise ValueError("Either log_source_device or log_source_ip must be set.")
-
         self.flow = log_flow
         self.protocol = log_protocol
         self.type = log_type
         self.severity = log_severity
         self.facility = log_facility
         self.tags = log_tags
+
+        # Intern the enum-like values, so that the comparisons in the playbooks can be done by identity
+        if isinstance(log_custom_fields, dict):
+            for key in INTERNED_CUSTOM_FIELDS:
+                value = log_custom_fields.get(key)
+                if type(value) is str:
+                    log_custom_fields[key] = sys.intern(value)
         self.custom_fields = log_custom_fields
-        self.uuid = uuid
+        self.uuid = uuid if uuid is not None else uuid4()
         self.alert_relevance = handle_percentage(alert_relevance)
 
-    def __dict__(self):
-        dict_ = {
-            "log_related_alert_uuid": str(self.related_alert_uuid),
-            "log_alert_relevance": self.alert_relevance,
-            "log_timestamp": str(self.timestamp),
-            "log_message": self.message,
-            "log_source_name": self.source_name,
-            "log_source_ip": str(self.source_ip),
-            "log_source_device": str(self.source_device),
-            "log_flow": self.flow,
-            "log_protocol": self.protocol,
-            "log_type": self.type,
-            "log_severity": self.severity,
-            "log_facility": self.facility,
-            "log_tags": self.tags,
-            "log_custom_fields": self.custom_fields,
-            "log_uuid": str(self.uuid),
-        }
-        return dict_
+    to_dict, _to_json_dict = _compile_serializers("ContextLog", _LOG_FIELDS)
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        return _dumps_indented(_strip_none(type(self), self.to_dict()))
+
+    @classmethod
+    def dump_batch(cls, logs, out) -> int:
+        """Writes the given logs as newline delimited JSON (NDJSON), e.g. for a bulk insert into a search index.
+
+        Every log is serialized directly from its _to_json_dict() (without None values), and the whole batch is written at once.
+
+        Args:
+            logs (list): The ContextLog objects
+            out: A binary file-like object, e.g. io.BytesIO or a file opened with 'wb'
+
+        Returns:
+            int: The number of bytes written
+        """
+        dumps = _dumps_compact_bytes
+        lines = [dumps(log._to_json_dict()) for log in logs]
+        lines.append(b"")  # Every line is terminated by a newline, as expected by bulk APIs
+        return out.write(b"\n".join(lines))
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -2208,14 +3454,36 @@ class ContextLog:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        failed = []
         for key, value in dict_.items():
-            # First we have to remove the 'log_' prefix from the keys
+            attr = _LOG_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("log_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
+
+
+_LOG_KEY_XLAT = {key: attr for key, attr, _ in _LOG_FIELDS}
+
+_REGISTRY_FIELDS = (
+    ("registry_related_alert_uuid", "related_alert_uuid", _lazy_str),
+    ("registry_timestamp", "timestamp", _lazy_str),
+    ("registry_action", "action", None),
+    ("registry_key", "key", None),
+    ("registry_value", "value", None),
+    ("registry_data", "data", None),
+    ("registry_data_type", "data_type", None),
+    ("registry_hive", "hive", None),
+    ("registry_path", "path", None),
+    ("registry_process_name", "process_name", None),
+    ("registry_process_id", "process_id", None),
+    ("registry_process_uuid", "process_uuid", None),
+)
 
 
 class ContextRegistry:
@@ -2231,6 +3499,9 @@ class ContextRegistry:
         registry_path (str): The registry path
     """
 
+    __slots__ = tuple(attr for _, attr, _ in _REGISTRY_FIELDS)
+    __getstate__, __setstate__ = _compile_pickling("ContextRegistry", __slots__)
+
     def __init__(
         self,
         related_alert_uuid: uuid.UUID = None,
@@ -2259,26 +3530,11 @@ class ContextRegistry:
         self.process_id = process_id
         self.process_uuid = process_uuid
 
-    def __dict__(self):
-        dict_ = {
-            "registry_related_alert_uuid": str(self.related_alert_uuid),
-            "registry_timestamp": str(self.timestamp),
-            "registry_action": self.action,
-            "registry_key": self.key,
-            "registry_value": self.value,
-            "registry_data": self.data,
-            "registry_data_type": self.data_type,
-            "registry_hive": self.hive,
-            "registry_path": self.path,
-            "registry_process_name": self.process_name,
-            "registry_process_id": self.process_id,
-            "registry_process_uuid": self.process_uuid,
-        }
-        return dict_
+    to_dict, _to_json_dict = _compile_serializers("ContextRegistry", _REGISTRY_FIELDS)
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        return _dumps_indented(self._to_json_dict())
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -2286,14 +3542,38 @@ class ContextRegistry:
         Args:
             dict_ (dict): The dictionary to load the object from
         """
+        failed = []
         for key, value in dict_.items():
-            # First we have to remove the 'registry_' prefix from the keys
+            attr = _REGISTRY_KEY_XLAT.get(key)
+            if attr is None:
+                mlog.debug(f"load_from_dict() - Skipping unknown attribute '{key}'.")
+                continue
             try:
-                key = key.replace("registry_", "")
-                setattr(self, key, value)
+                setattr(self, attr, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                failed.append(f"'{attr}': {e!r}")
+        if failed:  # Logged once for the whole dict
+            mlog.error(f"load_from_dict() - Error while loading {len(failed)} attribute(s) from dict: " + ", ".join(failed))
+
+
+_REGISTRY_KEY_XLAT = {key: attr for key, attr, _ in _REGISTRY_FIELDS}
+
+_TI_FIELDS = (
+    ("ti_time_requested", "time_requested", _lazy_str),
+    ("ti_engine", "engine", None),
+    ("ti_is_related_indicator", "is_related_indicator", None),
+    ("ti_related_indicator_name", "related_indicator_name", None),
+    ("ti_is_known", "is_known", None),
+    ("ti_is_hit", "is_hit", None),
+    ("ti_hit_type", "hit_type", None),
+    ("ti_threat_name", "threat_name", None),
+    ("ti_confidence", "confidence", None),
+    ("ti_engine_version", "engine_version", None),
+    ("ti_engine_update", "engine_update", _lazy_str),
+    ("ti_alert_last_seen", "alert_last_seen", _lazy_str),
+    ("ti_alert_last_update", "alert_last_update", _lazy_str),
+    ("ti_method", "method", None),
+)
 
 
 class ThreatIntel:
@@ -2315,6 +3595,9 @@ class ThreatIntel:
         related_indicator_name (str): The name of the related indicator (if is_related_indicator is True)
     """
 
+    __slots__ = tuple(attr for _, attr, _ in _TI_FIELDS)
+    __getstate__, __setstate__ = _compile_pickling("ThreatIntel", __slots__)
+
     def __init__(
         self,
         time_requested: datetime.datetime = None,
@@ -2333,23 +3616,9 @@ class ThreatIntel:
         related_indicator_name: str = "",
     ):
         self.time_requested = time_requested
-
-        if not is_known and is_hit:
-            pass  # raise ValueError("is_hit must be False if is_known is False")
-        if not is_known and hit_type != "":
-            pass  # raise ValueError("hit_type must be empty if is_known is False")
-        if not is_known and threat_name != "":
-            pass  # raise ValueError("threat_name must be empty if is_known is False")
-        if not is_known and confidence != "":
-            pass  # raise ValueError("confidence must be empty if is_known is False")
         self.is_known = is_known
-
-        hit_type = hit_type.lower()
-        if is_hit and hit_type not in ["malicious", "suspicious", "unknown"]:
-            pass  # raise ValueError("hit_type must be one of malicious, suspicious or unknown if is_hit is True")
         self.is_hit = is_hit
-
-        self.hit_type = hit_type
+        self.hit_type = hit_type.lower() if hit_type else hit_type
         self.threat_name = threat_name
         self.confidence = confidence
         self.engine = engine
@@ -2361,28 +3630,72 @@ class ThreatIntel:
         self.is_related_indicator = is_related_indicator
         self.related_indicator_name = related_indicator_name
 
-    def __dict__(self):
-        _dict = {
-            "ti_time_requested": str(self.time_requested),
-            "ti_engine": self.engine,
-            "ti_is_related_indicator": self.is_related_indicator,
-            "ti_related_indicator_name": self.related_indicator_name,
-            "ti_is_known": self.is_known,
-            "ti_is_hit": self.is_hit,
-            "ti_hit_type": self.hit_type,
-            "ti_threat_name": self.threat_name,
-            "ti_confidence": self.confidence,
-            "ti_engine_version": self.engine_version,
-            "ti_engine_update": str(self.engine_update),
-            "ti_alert_last_seen": str(self.alert_last_seen),
-            "ti_alert_last_update": str(self.alert_last_update),
-            "ti_method": self.method,
-        }
-        return _dict
+    to_dict, _to_json_dict = _compile_serializers("ThreatIntel", _TI_FIELDS)
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        return _dumps_indented(self._to_json_dict())
+
+
+# All Whois attributes are written with the 'whois_' prefix
+_WHOIS_FIELDS = tuple(
+    ("whois_" + attr, attr, None)
+    for attr in (
+        "domain_name",
+        "registry_domain_id",
+        "registrar_whois_server",
+        "registrar_url",
+        "updated_date",
+        "creation_date",
+        "registry_expiry_date",
+        "registrar",
+        "registrar_abuse_contact_email",
+        "registrar_abuse_contact_phone",
+        "domain_status",
+        "registry_registrant_id",
+        "registrant_name",
+        "registrant_organization",
+        "registrant_street",
+        "registrant_city",
+        "registrant_state_province",
+        "registrant_postal_code",
+        "registrant_country",
+        "registrant_phone",
+        "registrant_phone_ext",
+        "registrant_fax",
+        "registrant_fax_ext",
+        "registrant_email",
+        "registry_admin_id",
+        "admin_name",
+        "admin_organization",
+        "admin_street",
+        "admin_city",
+        "admin_state_province",
+        "admin_postal_code",
+        "admin_country",
+        "admin_phone",
+        "admin_phone_ext",
+        "admin_fax",
+        "admin_fax_ext",
+        "admin_email",
+        "registry_tech_id",
+        "tech_name",
+        "tech_organization",
+        "tech_street",
+        "tech_city",
+        "tech_state_province",
+        "tech_postal_code",
+        "tech_country",
+        "tech_phone",
+        "tech_phone_ext",
+        "tech_fax",
+        "tech_fax_ext",
+        "tech_email",
+        "name_server1",
+        "name_server2",
+        "dnssec",
+    )
+)
 
 
 class Whois:
@@ -2450,178 +3763,17 @@ class Whois:
         Name_Server:
         DNSSEC:"""
 
-    def __init__(
-        self,
-        domain_name,
-        registry_domain_id,
-        registrar_whois_server,
-        registrar_url,
-        updated_date,
-        creation_date,
-        registry_expiry_date,
-        registrar,
-        registrar_abuse_contact_email,
-        registrar_abuse_contact_phone,
-        domain_status,
-        registry_registrant_id,
-        registrant_name,
-        registrant_organization,
-        registrant_street,
-        registrant_city,
-        registrant_state_province,
-        registrant_postal_code,
-        registrant_country,
-        registrant_phone,
-        registrant_phone_ext,
-        registrant_fax,
-        registrant_fax_ext,
-        registrant_email,
-        registry_admin_id,
-        admin_name,
-        admin_organization,
-        admin_street,
-        admin_city,
-        admin_state_province,
-        admin_postal_code,
-        admin_country,
-        admin_phone,
-        admin_phone_ext,
-        admin_fax,
-        admin_fax_ext,
-        admin_email,
-        registry_tech_id,
-        tech_name,
-        tech_organization,
-        tech_street,
-        tech_city,
-        tech_state_province,
-        tech_postal_code,
-        tech_country,
-        tech_phone,
-        tech_phone_ext,
-        tech_fax,
-        tech_fax_ext,
-        tech_email,
-        name_server1,
-        name_server2,
-        dnssec,
-    ):
-        self.domain_name = domain_name
-        self.registry_domain_id = registry_domain_id
-        self.registrar_whois_server = registrar_whois_server
-        self.registrar_url = registrar_url
-        self.updated_date = updated_date
-        self.creation_date = creation_date
-        self.registry_expiry_date = registry_expiry_date
-        self.registrar = registrar
-        self.registrar_abuse_contact_email = registrar_abuse_contact_email
-        self.registrar_abuse_contact_phone = registrar_abuse_contact_phone
-        self.domain_status = domain_status
-        self.registry_registrant_id = registry_registrant_id
-        self.registrant_name = registrant_name
-        self.registrant_organization = registrant_organization
-        self.registrant_street = registrant_street
-        self.registrant_city = registrant_city
-        self.registrant_state_province = registrant_state_province
-        self.registrant_postal_code = registrant_postal_code
-        self.registrant_country = registrant_country
-        self.registrant_phone = registrant_phone
-        self.registrant_phone_ext = registrant_phone_ext
-        self.registrant_fax = registrant_fax
-        self.registrant_fax_ext = registrant_fax_ext
-        self.registrant_email = registrant_email
-        self.registry_admin_id = registry_admin_id
-        self.admin_name = admin_name
-        self.admin_organization = admin_organization
-        self.admin_street = admin_street
-        self.admin_city = admin_city
-        self.admin_state_province = admin_state_province
-        self.admin_postal_code = admin_postal_code
-        self.admin_country = admin_country
-        self.admin_phone = admin_phone
-        self.admin_phone_ext = admin_phone_ext
-        self.admin_fax = admin_fax
-        self.admin_fax_ext = admin_fax_ext
-        self.admin_email = admin_email
-        self.registry_tech_id = registry_tech_id
-        self.tech_name = tech_name
-        self.tech_organization = tech_organization
-        self.tech_street = tech_street
-        self.tech_city = tech_city
-        self.tech_state_province = tech_state_province
-        self.tech_postal_code = tech_postal_code
-        self.tech_country = tech_country
-        self.tech_phone = tech_phone
-        self.tech_phone_ext = tech_phone_ext
-        self.tech_fax = tech_fax
-        self.tech_fax_ext = tech_fax_ext
-        self.tech_email = tech_email
-        self.name_server1 = name_server1
-        self.name_server2 = name_server2
-        self.dnssec = dnssec
-
-    def __dict__(self):
-        """Returns the object as a dictionary."""
-        return {
-            "whois_domain_name": self.domain_name,
-            "whois_registry_domain_id": self.registry_domain_id,
-            "whois_registrar_whois_server": self.registrar_whois_server,
-            "whois_registrar_url": self.registrar_url,
-            "whois_updated_date": self.updated_date,
-            "whois_creation_date": self.creation_date,
-            "whois_registry_expiry_date": self.registry_expiry_date,
-            "whois_registrar": self.registrar,
-            "whois_registrar_abuse_contact_email": self.registrar_abuse_contact_email,
-            "whois_registrar_abuse_contact_phone": self.registrar_abuse_contact_phone,
-            "whois_domain_status": self.domain_status,
-            "whois_registry_registrant_id": self.registry_registrant_id,
-            "whois_registrant_name": self.registrant_name,
-            "whois_registrant_organization": self.registrant_organization,
-            "whois_registrant_street": self.registrant_street,
-            "whois_registrant_city": self.registrant_city,
-            "whois_registrant_state_province": self.registrant_state_province,
-            "whois_registrant_postal_code": self.registrant_postal_code,
-            "whois_registrant_country": self.registrant_country,
-            "whois_registrant_phone": self.registrant_phone,
-            "whois_registrant_phone_ext": self.registrant_phone_ext,
-            "whois_registrant_fax": self.registrant_fax,
-            "whois_registrant_fax_ext": self.registrant_fax_ext,
-            "whois_registrant_email": self.registrant_email,
-            "whois_registry_admin_id": self.registry_admin_id,
-            "whois_admin_name": self.admin_name,
-            "whois_admin_organization": self.admin_organization,
-            "whois_admin_street": self.admin_street,
-            "whois_admin_city": self.admin_city,
-            "whois_admin_state_province": self.admin_state_province,
-            "whois_admin_postal_code": self.admin_postal_code,
-            "whois_admin_country": self.admin_country,
-            "whois_admin_phone": self.admin_phone,
-            "whois_admin_phone_ext": self.admin_phone_ext,
-            "whois_admin_fax": self.admin_fax,
-            "whois_admin_fax_ext": self.admin_fax_ext,
-            "whois_admin_email": self.admin_email,
-            "whois_registry_tech_id": self.registry_tech_id,
-            "whois_tech_name": self.tech_name,
-            "whois_tech_organization": self.tech_organization,
-            "whois_tech_street": self.tech_street,
-            "whois_tech_city": self.tech_city,
-            "whois_tech_state_province": self.tech_state_province,
-            "whois_tech_postal_code": self.tech_postal_code,
-            "whois_tech_country": self.tech_country,
-            "whois_tech_phone": self.tech_phone,
-            "whois_tech_phone_ext": self.tech_phone_ext,
-            "whois_tech_fax": self.tech_fax,
-            "whois_tech_fax_ext": self.tech_fax_ext,
-            "whois_tech_email": self.tech_email,
-            "whois_name_server1": self.name_server1,
-            "whois_name_server2": self.name_server2,
-            "whois_dnssec": self.dnssec,
-        }
+    __slots__ = tuple(attr for _, attr, _ in _WHOIS_FIELDS)
 
+    # Generated from _WHOIS_FIELDS, every attribute is a required argument of the same name
+    __init__ = _compile_init("Whois", __slots__)
+    __getstate__, __setstate__ = _compile_pickling("Whois", __slots__)
 
-def __str__(self):
-    """Returns the string representation of the object."""
-    return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+    to_dict, _to_json_dict = _compile_serializers("Whois", _WHOIS_FIELDS)
+
+    def __str__(self):
+        """Returns the string representation of the object."""
+        return _dumps_indented(self._to_json_dict())
 
 
 class ContextThreatIntel:
@@ -2675,21 +3827,21 @@ class ContextThreatIntel:
         score_known: int = None,
         score_unknown: int = None,
         related_alert_uuid: uuid.UUID = None,
-        uuid: uuid.UUID = uuid.uuid4(),
+        uuid: uuid.UUID = None,
         alert_relevance: int = 50,
-        tags: List[str] = [],
+        tags: List[str] = None,
         last_analyzed: datetime.datetime = None,
         AS_owner: str = None,
         AS_number: str = None,
         AS_IP_Range: str = None,
         related_cert: Certificate = None,
         whois: Whois = None,
-        related_domains: List[ThreatIntel] = [],
-        related_files: List[ThreatIntel] = [],
-        related_ips: List[ThreatIntel] = [],
-        related_urls: List[ThreatIntel] = [],
-        categories: List[List[str]] = [],
-        links: List[str] = [],
+        related_domains: List[ThreatIntel] = None,
+        related_files: List[ThreatIntel] = None,
+        related_ips: List[ThreatIntel] = None,
+        related_urls: List[ThreatIntel] = None,
+        categories: List[List[str]] = None,
+        links: List[str] = None,
     ):
         if type not in [ipaddress.IPv4Address, ipaddress.IPv6Address, HTTP, DNSQuery, ContextFile, ContextProcess]:
             pass  # raise ValueError("type must be one of IPv4Address, IPv6Address, HTTP, DNSQuery, ContextFile or ContextProcess")
@@ -2703,7 +3855,23 @@ class ContextThreatIntel:
         self.timestamp = timestamp
         self.threat_intel_alerts = threat_intel_alerts
 
-        if score_hit is not None and score_total is not None and score_hit_sus is not None and score_hit_mal is not None:
+        explicit_scores = score_hit is not None and score_total is not None and score_hit_sus is not None and score_hit_mal is not None
+
+        # Count the hits and the engines that know the indicator in a single pass over the threat intel alerts (only if needed)
+        hit = sus = mal = known = 0
+        if threat_intel_alerts and (not explicit_scores or score_known is None):
+            for alert in threat_intel_alerts:
+                if alert.is_known:
+                    known += 1
+                if alert.is_hit:
+                    hit += 1
+                    hit_type = alert.hit_type
+                    if hit_type == "suspicious":
+                        sus += 1
+                    elif hit_type == "malicious":
+                        mal += 1
+
+        if explicit_scores:
             if score_total < 0:
                 pass  # raise ValueError("score_total must be greater or equal to 0 if not None")
             if score_hit < 0:
@@ -2713,24 +3881,11 @@ class ContextThreatIntel:
             self.score_hit = score_hit
             self.score_total = score_total
         else:
-            # Calculate implicit score using threat_intel_alerts
+            # Calculate implicit score using threat_intel_alerts (given sus/mal scores are applied below)
             self.score_total = len(threat_intel_alerts) if threat_intel_alerts else 0
-            self.score_hit = 0
-            if score_hit_sus is None:
-                calc_sus = True
-                self.score_hit_sus = 0
-            if score_hit_mal is None:
-                calc_mal = True
-                self.score_hit_mal = 0
-
-            if threat_intel_alerts:
-                for alert in threat_intel_alerts:
-                    if alert.is_hit:
-                        self.score_hit += 1
-                        if alert.hit_type == "suspicious" and calc_sus:
-                            self.score_hit_sus = self.score_hit_sus + 1
-                        if alert.hit_type == "malicious" and calc_mal:
-                            self.score_hit_mal = self.score_hit_mal + 1
+            self.score_hit = hit
+            self.score_hit_sus = sus
+            self.score_hit_mal = mal
 
         if score_hit_sus is not None:
             if score_hit_sus < 0:
@@ -2753,24 +3908,19 @@ class ContextThreatIntel:
                 pass  # raise ValueError("score_known must be smaller or equal to score_total if not None")
             self.score_known = score_known
         else:
-            self.score_known = 0
-            if threat_intel_alerts:
-                for alert in threat_intel_alerts:
-                    if alert.is_known:
-                        self.score_known += 1
+            self.score_known = known
 
         if score_unknown is not None:
             if score_unknown < 0:
                 pass  # raise ValueError("score_unknown must be greater or equal to 0 if not None")
             if score_unknown > self.score_total:
                 pass  # raise ValueError("score_unknown must be smaller or equal to score_total if not None")
-            if score_unknown != None and score_known != None:
+            if score_unknown is not None and score_known is not None:
                 if score_unknown != self.score_total - self.score_known:
                     pass  # raise ValueError("score_unknown must be equal to score_total - score_known if not None")
             self.score_unknown = score_unknown
         else:
-            if self.score_known == None or self.score_total == None:  # Should not happen, as set above
-                mlog = logging_helper.Log("lib.class_helper")
+            if self.score_known is None or self.score_total is None:  # Should not happen, as set above
                 mlog.error(
                     "Class ThreatIntel __init__: implicit calculation of score_unknown: score_unknown is not set and score_known or score_total is None. score_unknown cannot be calculated. You shouldn't see this message. Please case this issue."
                 )
@@ -2781,19 +3931,19 @@ class ContextThreatIntel:
                 self.score_unknown = self.score_total - self.score_known
 
         self.related_alert_uuid = related_alert_uuid
-        self.uuid = uuid
+        self.uuid = uuid if uuid is not None else uuid4()
         self.alert_relevance = handle_percentage(alert_relevance)
-        self.tags = tags
+        self.tags = [] if tags is None else tags
         self.last_analyzed = last_analyzed
         self.AS_owner = AS_owner
         self.AS_number = AS_number
         self.AS_IP_Range = AS_IP_Range
         self.related_cert = related_cert
         self.whois = whois
-        self.related_ips = related_ips
-        self.related_domains = related_domains
-        self.related_files = related_files
-        self.related_urls = related_urls
+        self.related_ips = [] if related_ips is None else related_ips
+        self.related_domains = [] if related_domains is None else related_domains
+        self.related_files = [] if related_files is None else related_files
+        self.related_urls = [] if related_urls is None else related_urls
 
         self.categories = []
         if categories:
@@ -2802,9 +3952,9 @@ class ContextThreatIntel:
             else:
                 pass  # raise ValueError("categories must be a list of two elements (engine and category)")
 
-        self.links = links
+        self.links = [] if links is None else links
 
-    def __dict__(self):
+    def to_dict(self):
         """Returns the object as a dictionary."""
         dict_ = {
             "ti_type": self.type,
@@ -2837,8 +3987,7 @@ class ContextThreatIntel:
 
     def __str__(self):
         """Returns the string representation of the object."""
-        clean_dict = del_none_from_dict(self.__dict__())
-        return json.dumps(clean_dict, indent=4, sort_keys=False, default=str)
+        return _dumps_indented(del_none_from_dict(self.to_dict()))
 
     def load_from_dict(self, dict_: dict):
         """Loads the object from a dictionary.
@@ -2849,11 +3998,10 @@ class ContextThreatIntel:
         for key, value in dict_.items():
             # First we have to remove the 'ti_' prefix from the keys
             try:
-                key = key.replace("ti_", "")
+                key = key.removeprefix("ti_")
                 setattr(self, key, value)
             except Exception as e:
-                mlog = logging_helper.Log("lib.class_helper")
-                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {traceback.format_exc()}")
+                mlog.error(f"load_from_dict() - Error while loading rule attribute '{key}' from dict: {e!r}")
 
 
 class Alert:
@@ -2916,11 +4064,11 @@ class Alert:
         registry: ContextRegistry = None,
         log_source: str = None,
         url: str = None,
-        uuid: uuid.UUID = uuid.uuid4(),
-        highlighted_fields: List[str] = [],
+        uuid: uuid.UUID = None,
+        highlighted_fields: List[str] = None,
         state: str = "new",
     ):
-        self.vendor_id = vendor_id
+        self.vendor_id = sys.intern(vendor_id) if type(vendor_id) is str else vendor_id
         self.name = name
         self.description = description
 
@@ -2946,13 +4094,13 @@ class Alert:
             "other": [],
         }
 
-        if host_ip != None:
+        if host_ip is not None:
             host_ip = cast_to_ipaddress(host_ip)
             self.indicators["ip"].append(host_ip)
         self.host_ip = host_ip
 
         # Context for every type of context with checks
-        if log != None:
+        if log is not None:
             if not isinstance(log, ContextLog):
                 raise TypeError("log must be of type ContextLog")
             if log.log_flow:
@@ -2960,7 +4108,7 @@ class Alert:
                 self.indicators["ip"].append(log.log_flow.destination_ip)
         self.log = log
 
-        if process != None:
+        if process is not None:
             if not isinstance(process, ContextProcess):
                 raise TypeError("process must be of type ContextProcess")
             if process.flow:
@@ -2974,39 +4122,39 @@ class Alert:
                 self.indicators["hash"].append(process.sha256)
         self.process = process
 
-        if flow != None:
+        if flow is not None:
             if not isinstance(flow, ContextFlow):
                 raise TypeError("flow must be of type ContextFlow")
             self.indicators["ip"].append(flow.source_ip)
             self.indicators["ip"].append(flow.destination_ip)
         self.flow = flow
 
-        if threat_intel != None:
+        if threat_intel is not None:
             if not isinstance(threat_intel, ContextThreatIntel):
                 raise TypeError("threat_intel must be of type ContextThreatIntel")
         self.threat_intel = threat_intel
 
-        if location != None:
+        if location is not None:
             if not isinstance(location, Location):
                 raise TypeError("location must be of type Location")
             if location.country:
                 self.indicators["countries"].append(location.country)
         self.location = location
 
-        if device != None:
+        if device is not None:
             if not isinstance(device, ContextAsset):
                 raise TypeError("device must be of type Device")
         self.device = device
 
-        if user != None:
+        if user is not None:
             if not isinstance(user, Person):
                 raise TypeError("user must be of type Person")
         self.user = user
 
-        if file == None and flow != None and dict_get(flow, "http.file") != None:
+        if file is None and flow is not None and dict_get(flow, "http.file") is not None:
             file = flow.http.file
 
-        if file != None:
+        if file is not None:
             if not isinstance(file, ContextFile):
                 raise TypeError("file must be of type ContextFile")
             self.indicators["other"].append(file.name)
@@ -3019,21 +4167,21 @@ class Alert:
         self.file = file
 
         http_request = None
-        if flow != None and flow.http:
+        if flow is not None and flow.http:
             http_request = flow.http
         self.http_request = http_request
 
         dns_request = None
-        if flow != None and flow.dns_query:
+        if flow is not None and flow.dns_query:
             dns_request = flow.dns_query
         self.dns_request = dns_request
 
         certificate = None
-        if flow != None and flow.http != None and flow.http.certificate:
+        if flow is not None and flow.http is not None and flow.http.certificate:
             certificate = flow.http.certificate
         self.certificate = certificate
 
-        if http_request != None:
+        if http_request is not None:
             if not isinstance(http_request, HTTP):
                 raise TypeError("http_request must be of type HTTP")
             self.indicators["domain"].append(http_request.host)
@@ -3050,14 +4198,14 @@ class Alert:
                     self.indicators["hash"].append(http_request.file.sha256)
         self.http_request = http_request
 
-        if dns_request != None:
+        if dns_request is not None:
             if not isinstance(dns_request, DNSQuery):
                 raise TypeError("dns_request must be of type DNSQuery")
             self.indicators["domain"].append(dns_request.query)
             if dns_request.query_response and cast_to_ipaddress(dns_request.query_response):
                 self.indicators["ip"].append(dns_request.query_response)
 
-        if certificate != None:
+        if certificate is not None:
             if not isinstance(certificate, Certificate):
                 raise TypeError("certificate must be of type Certificate")
             self.indicators["domain"].append(certificate.subject)
@@ -3065,7 +4213,7 @@ class Alert:
                 for san in certificate.subject_alternative_names:
                     self.indicators["domain"].append(san)
 
-        if registry != None:
+        if registry is not None:
             if not isinstance(registry, ContextRegistry):
                 raise TypeError("registry must be of type ContextRegistry")
             self.indicators["registry"].append(registry.key)
@@ -3073,26 +4221,42 @@ class Alert:
         self.log_source = log_source
         self.url = url
 
-        self.uuid = uuid
+        self.uuid = uuid if uuid is not None else uuid4()
         self.iris_case = None
 
         # Remove '*.' from domain indicators and replace with empty
         for domain in self.indicators["domain"]:
             if domain.startswith("*."):
-                mlog = logging_helper.Log("lib.class_helper")
                 mlog.debug(f"Removing '*.' from domain indicator: {domain}")
                 self.indicators["domain"].remove(domain)
                 self.indicators["domain"].append(domain[2:])
 
-        self.highlighted_fields = highlighted_fields
+        self.highlighted_fields = [] if highlighted_fields is None else highlighted_fields
         self.state = state
 
         # Remove duplicates
         remove_duplicates_from_dict(self.indicators)
 
-    def load_from_iris(self, iris_alert_id):
-        # Get alert from IRIS
-        iris_alert = iris_helper.get_alert_by_id(iris_alert_id)
+    @staticmethod
+    def bulk_load_from_iris(session, alert_ids):
+        """Fetches the given alerts from IRIS with a single request.
+
+        Args:
+            session (ClientSession): The IRIS session to use
+            alert_ids (list): The IDs of the alerts
+
+        Returns:
+            dict: The raw IRIS alert dicts keyed by their alert ID
+        """
+        iris_alerts = iris_helper.get_alerts_by_ids(alert_ids, session=session)
+        if iris_alerts is None:
+            raise ValueError(f"Could not bulk load alerts {alert_ids} from IRIS.")
+        return iris_alerts
+
+    def load_from_iris(self, iris_alert_id, iris_alert=None):
+        # Get alert from IRIS (unless it was already prefetched)
+        if iris_alert is None:
+            iris_alert = iris_helper.get_alert_by_id(iris_alert_id)
         if iris_alert is None:
             raise ValueError(f"Alert with ID '{iris_alert_id}' not found in IRIS.")
         context = iris_alert["alert_context"]
@@ -3184,7 +4348,7 @@ class Alert:
 
         self.uuid = iris_alert_id
         self.host_name: str = host_name
-        self.vendor_id = vendor_id
+        self.vendor_id = sys.intern(vendor_id) if type(vendor_id) is str else vendor_id
         self.name = name
         self.description = description
 
@@ -3234,7 +4398,7 @@ class Alert:
         self.host_ip = host_ip
 
         # Context for every type of context with checks
-        if log != None:
+        if log is not None:
             if not isinstance(log, ContextLog):
                 raise TypeError("log must be of type ContextLog")
             if log.flow:
@@ -3242,7 +4406,7 @@ class Alert:
                 self.indicators["ip"].append(log.flow.destination_ip)
         self.log = log
 
-        if process != None:
+        if process is not None:
             if not isinstance(process, ContextProcess):
                 raise TypeError("process must be of type ContextProcess")
             if process.flow:
@@ -3256,39 +4420,39 @@ class Alert:
                 self.indicators["hash"].append(process.sha256)
         self.process = process
 
-        if flow != None:
+        if flow is not None:
             if not isinstance(flow, ContextFlow):
                 raise TypeError("flow must be of type ContextFlow")
             self.indicators["ip"].append(flow.source_ip)
             self.indicators["ip"].append(flow.destination_ip)
         self.flow = flow
 
-        if threat_intel != None:
+        if threat_intel is not None:
             if not isinstance(threat_intel, ContextThreatIntel):
                 raise TypeError("threat_intel must be of type ContextThreatIntel")
         self.threat_intel = threat_intel
 
-        if location != None:
+        if location is not None:
             if not isinstance(location, Location):
                 raise TypeError("location must be of type Location")
             if location.country:
                 self.indicators["countries"].append(location.country)
         self.location = location
 
-        if self.device != None:
+        if self.device is not None:
             if not isinstance(self.device, ContextAsset):
                 raise TypeError("device must be of type Device")
             self.host_name = self.device.name
 
-        if user != None:
+        if user is not None:
             if not isinstance(user, Person):
                 raise TypeError("user must be of type Person")
         self.user = user
 
-        if file == None and flow != None and dict_get(flow, "http.file") != None:
+        if file is None and flow is not None and dict_get(flow, "http.file") is not None:
             file = flow.http.file
 
-        if file != None:
+        if file is not None:
             if not isinstance(file, ContextFile):
                 raise TypeError("file must be of type ContextFile")
             self.indicators["other"].append(file.name)
@@ -3301,21 +4465,21 @@ class Alert:
         self.file = file
 
         http_request = None
-        if flow != None and flow.http:
+        if flow is not None and flow.http:
             http_request = flow.http
         self.http_request = http_request
 
         dns_request = None
-        if flow != None and flow.dns_query:
+        if flow is not None and flow.dns_query:
             dns_request = flow.dns_query
         self.dns_request = dns_request
 
         certificate = None
-        if flow != None and flow.http != None and flow.http.certificate:
+        if flow is not None and flow.http is not None and flow.http.certificate:
             certificate = flow.http.certificate
         self.certificate = certificate
 
-        if http_request != None:
+        if http_request is not None:
             if not isinstance(http_request, HTTP):
                 raise TypeError("http_request must be of type HTTP")
             self.indicators["domain"].append(http_request.host)
@@ -3332,14 +4496,14 @@ class Alert:
                     self.indicators["hash"].append(http_request.file.sha256)
         self.http_request = http_request
 
-        if dns_request != None:
+        if dns_request is not None:
             if not isinstance(dns_request, DNSQuery):
                 raise TypeError("dns_request must be of type DNSQuery")
             self.indicators["domain"].append(dns_request.query)
             if dns_request.query_response and cast_to_ipaddress(dns_request.query_response):
                 self.indicators["ip"].append(dns_request.query_response)
 
-        if certificate != None:
+        if certificate is not None:
             if not isinstance(certificate, Certificate):
                 raise TypeError("certificate must be of type Certificate")
             self.indicators["domain"].append(certificate.subject)
@@ -3347,7 +4511,7 @@ class Alert:
                 for san in certificate.subject_alternative_names:
                     self.indicators["domain"].append(san)
 
-        if registry != None:
+        if registry is not None:
             if not isinstance(registry, ContextRegistry):
                 raise TypeError("registry must be of type ContextRegistry")
             self.indicators["registry"].append(registry.key)
@@ -3359,7 +4523,6 @@ class Alert:
         # Remove '*.' from domain indicators and replace with empty
         for domain in self.indicators["domain"]:
             if domain.startswith("*."):
-                mlog = logging_helper.Log("lib.class_helper")
                 mlog.debug(f"Removing '*.' from domain indicator: {domain}")
                 self.indicators["domain"].remove(domain)
                 self.indicators["domain"].append(domain[2:])
@@ -3367,7 +4530,7 @@ class Alert:
         # Remove duplicates
         remove_duplicates_from_dict(self.indicators)
 
-    def __dict__(self):
+    def to_dict(self):
         """Returns the dictionary representation of the object."""
         dict_ = {
             "id": self.vendor_id,
@@ -3399,8 +4562,7 @@ class Alert:
 
     def __str__(self):
         """Returns the string representation of the object."""
-        s = json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
-        return s.replace("\n", "<br>")
+        return _dumps_indented(del_none_from_dict(self.to_dict())).replace("\n", "<br>")
 
     def get_host(self):
         """Returns the host of the alert."""
@@ -3467,7 +4629,6 @@ class Alert:
         """
         from lib.generic_helper import get_from_cache
 
-        mlog = logging_helper.Log("lib.class_helper")
         alert = self
 
         wl_ips = get_from_cache("global_whitelist_ips", "LIST")
@@ -3664,13 +4825,13 @@ class AuditLog:
         stage: int,
         title: str,
         description: str = "",
-        start_time: datetime = datetime.datetime.now(),
+        start_time: datetime = None,
         is_iris_case_related: bool = False,
         result_had_warnings: bool = False,
         result_had_errors: bool = False,
         result_request_retry: bool = False,
         result_message: str = "",
-        result_data: dict = {},
+        result_data: dict = None,
         result_in_iris_case: bool = False,
         result_time: datetime = None,
         playbook_done: bool = False,
@@ -3681,14 +4842,14 @@ class AuditLog:
         self.stage: int = stage
         self.title = title
         self.description = description
-        self.start_time: datetime = start_time
+        self.start_time: datetime = start_time if start_time is not None else datetime.datetime.now()
         self.related_iris_case_number: str = ""
         self.result_was_successful: bool = result_was_successful
         self.result_had_warnings: bool = result_had_warnings
         self.result_had_errors: bool = result_had_errors
         self.result_request_retry: bool = result_request_retry
         self.result_message: str = result_message
-        self.result_data: dict = result_data
+        self.result_data: dict = {} if result_data is None else result_data
         self.result_in_iris_case = result_in_iris_case
         self.result_time: datetime = result_time if result_time is not None else datetime.datetime.now()
         self.result_exception: str = result_exception
@@ -3741,7 +4902,7 @@ class AuditLog:
         self.stage_done = True
         return self
 
-    def __dict__(self):
+    def to_dict(self):
         """Returns the dictionary representation of the object.
         It will only return the result_* attributes if the stage is done to enhance readability.
         """
@@ -3782,7 +4943,7 @@ class AuditLog:
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        return _dumps_indented(del_none_from_dict(self.to_dict()))
 
 
 class CaseFile:
@@ -3856,6 +5017,10 @@ class CaseFile:
         self.context_registries: List[ContextRegistry] = []
         self.notes = {}
 
+        # Updates for the iris-case that are sent at once by flush_iris_updates()
+        self._pending_iris_title = None
+        self._pending_iris_notes = []
+
         self.uuid = case_id
         self.indicators = {
             "ip": [],
@@ -3875,7 +5040,7 @@ class CaseFile:
         self.audit_trail[0].result_message = "Initializing CaseFile was successful."
         self.audit_trail[0].result_data = "CaseFile was initialized successfully."
 
-    def __dict__(self):
+    def to_dict(self):
         """Returns the object as a dictionary."""
         dict_ = {
             "alerts": self.alerts,
@@ -3902,7 +5067,7 @@ class CaseFile:
 
     def __str__(self):
         """Returns the string representation of the object."""
-        return json.dumps(del_none_from_dict(self.__dict__()), indent=4, sort_keys=False, default=str)
+        return _dumps_indented(del_none_from_dict(self.to_dict()))
 
     # Getter and setter;
 
@@ -3934,7 +5099,6 @@ class CaseFile:
             TypeError: If the context object is not of a valid type
         """
         if context is None:
-            mlog = logging_helper.Log(__name__)
             mlog.warning("CaseFile: add_context() - Context is None, skipping.")
             return
 
@@ -4044,7 +5208,6 @@ class CaseFile:
         # Remove '*.' from domain indicators and replace with empty
         for domain in self.indicators["domain"]:
             if domain.startswith("*"):
-                mlog = logging_helper.Log("lib.class_helper")
                 mlog.debug("Removing '*.' from domain indicator: " + domain)
                 self.indicators["domain"].remove(domain)
                 self.indicators["domain"].append(domain[2:])
@@ -4053,6 +5216,32 @@ class CaseFile:
         remove_duplicates_from_dict(self.indicators)
         return
 
+    def get_suricata_index(self) -> Iterator[tuple]:
+        """Yields the Suricata alert fields of every context log that contains a Suricata alert.
+           The logs are read lazily on every call, so changes to the logs (or their custom fields) are always reflected
+           and callers that stop early (e.g. any()) do not read the remaining logs.
+
+        Yields:
+            tuple: One (sid, signature, severity, category, action, updated, custom_fields) tuple per Suricata log
+        """
+        for log in self.context_logs:
+            custom_fields = log.custom_fields
+            if not custom_fields:
+                continue
+            # Flat keys, so plain dict.get() is enough (no nested path lookup needed)
+            signature = custom_fields.get("Alert - Signature")
+            if signature is None:
+                continue
+            yield (
+                custom_fields.get("Alert - SID", "Unknown"),
+                signature,
+                custom_fields.get("Alert - Severity"),
+                custom_fields.get("Alert - Category"),
+                custom_fields.get("Alert - Action"),
+                custom_fields.get("Alert - Updated"),
+                custom_fields,
+            )
+
     def get_context_by_uuid(
         self, uuid: str, filterType: type = None
     ) -> Union[ContextLog, ContextProcess, ContextFlow, ContextThreatIntel, Location, ContextAsset, Person, ContextFile]:
@@ -4246,7 +5435,6 @@ class CaseFile:
         Returns:
             bool: True if successful, False if not
         """
-        mlog = logging_helper.Log("lib.class_helper")
         if group_title is None:
             raise ValueError("group_title must be set.")
 
@@ -4278,5 +5466,64 @@ class CaseFile:
             return suc
 
         except Exception as e:
+            import traceback  # Only needed on this error path
+
             mlog.error(f"Couldn't send note to iris case {str(self.uuid)}.  Error: " + traceback.format_exc())
             return False
+
+    def queue_note(self, title, content, group_title=None):
+        """Queues a note for the case in iris. The note is sent with the next flush_iris_updates() call.
+
+        Args:
+            title (str): The title of the note
+            content (str): The content of the note
+            group_title (str, optional): The title of the group to add the note to. Defaults to "IRIS-SOAR Audit".
+        """
+        if group_title is None:
+            group_title = "IRIS-SOAR Audit"
+        self._pending_iris_notes.append((title, content, group_title))
+
+    def queue_title_update(self, title):
+        """Queues a new title for the case in iris. The title is sent with the next flush_iris_updates() call.
+
+        Args:
+            title (str): The new title of the case
+        """
+        self._pending_iris_title = title
+
+    def flush_iris_updates(self):
+        """Sends all queued notes and the queued title update to the case in iris at once.
+
+        Returns:
+            bool: True if successful (or nothing was queued), False if not
+        """
+        if self._pending_iris_title is None and len(self._pending_iris_notes) == 0:
+            return True
+
+        try:
+            notes = []
+            for title, content, group_title in self._pending_iris_notes:
+                group_id = (
+                    self.notes[group_title][0]["id"] if group_title in self.notes and len(self.notes[group_title]) > 0 else None
+                )
+                notes.append((title, content, group_id, group_title))
+
+            group_ids, suc = iris_helper.update_case(self.uuid, self._pending_iris_title, notes)
+
+            for title, content, group_id, group_title in notes:
+                if group_title in group_ids:
+                    self.notes[group_title] = [] if group_title not in self.notes else self.notes[group_title]
+                    self.notes[group_title].append({"title": title, "content": content, "id": group_ids[group_title]})
+            mlog.debug(
+                f"flush_iris_updates() - sent {len(notes)} notes and title update '{self._pending_iris_title}' to case {str(self.uuid)}. Success: {suc}"
+            )
+
+            self._pending_iris_title = None
+            self._pending_iris_notes = []
+            return suc
+
+        except Exception as e:
+            import traceback  # Only needed on this error path
+
+            mlog.error(f"Couldn't send queued updates to iris case {str(self.uuid)}.  Error: " + traceback.format_exc())
+            return False
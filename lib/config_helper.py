@@ -4,10 +4,12 @@
 # It will also provide an explicit function to check if the config file is valid and a helper fumction for setup questions.
 
 import os
+import copy
 import yaml
 import sys
 import re
 import getpass
+from functools import lru_cache
 
 LOG_LEVEL = "CRITICAL"  # The log level of this config loader. This is not set by the config to prevent sending no message at all if the config file, which stores the log_lvel istself is not valid.
 FILE_PATH = "configs/config.yml"
@@ -24,18 +26,27 @@ class Config:
         A config object
     """
 
-    # Get the logger
+    # The last loaded config is only re-parsed if the config file changed on disk. Every instance gets its own copy of it,
+    # so that callers which change their config (e.g. tests or setup_integration()) do not change it for later instances.
+    _cached_cfg = None
+    _cached_stat = None
 
     def __init__(self):
-        import lib.logging_helper as logging_helper
-
-        mlog = logging_helper.Log("lib.config_helper", log_level=LOG_LEVEL)
-
         # Check if the config file exists
         if not os.path.isfile(FILE_PATH):
             print("[CRITICAL] The config file does not exist.")
             raise TypeError("The config file does not exist.")
 
+        stat = os.stat(FILE_PATH)
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+        if Config._cached_cfg is not None and Config._cached_stat == file_stat:
+            self.cfg = copy.deepcopy(Config._cached_cfg)
+            return None
+
+        import lib.logging_helper as logging_helper
+
+        mlog = logging_helper.Log("lib.config_helper", log_level=LOG_LEVEL)
+
         # Load the config file
         with open(FILE_PATH, "r") as ymlfile:
             self.cfg = yaml.safe_load(ymlfile)
@@ -70,9 +81,27 @@ class Config:
             mlog.critical("The config file is not valid. Please check the config file and try again.")
             raise TypeError("The config file is not valid.")
         else:
+            Config._cached_cfg = copy.deepcopy(self.cfg)
+            Config._cached_stat = file_stat
+            get_log_levels.cache_clear()
+            logging_helper.get_log.cache_clear()  # The loggers are created with the log levels of the previous config
             return None
 
 
+@lru_cache(maxsize=None)
+def get_log_levels(integration_name):
+    """The get_log_levels() function returns the configured log levels of an integration. The result is cached until the config file changes.
+
+    Args:
+        integration_name (str): The name of the integration in the config (e.g. "ibm_qradar")
+
+    Returns:
+        tuple: The log level for the log file and the log level for stdout
+    """
+    logging_cfg = Config().cfg["integrations"][integration_name]["logging"]
+    return logging_cfg["log_level_file"], logging_cfg["log_level_stdout"]
+
+
 def replace_env_vars(cfg, mlog):
     try:
         for key, value in cfg.items():
@@ -8,18 +8,22 @@ import lib.config_helper as config_helper
 
 import json
 from functools import reduce
-import pandas as pd
 import base64
 import datetime
 import ipaddress
 from typing import Union, List
 import re
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
-from collections import deque
+from collections import deque, OrderedDict
+import threading
 from uuid import UUID
 
 
 THRESHOLD_MAX_CONTEXTS = 1000  # The maximum number of contexts for each type that can be added to a alert case
+RENDER_CACHE_SIZE = 512  # The maximum number of tables rendered by format_results() that are cached
+
+_RENDER_CACHE = OrderedDict()  # (JSON of the events, format, group_by, transform) -> rendered table
+_RENDER_CACHE_LOCK = threading.Lock()
 
 mlog = logging_helper.Log("lib.generic_helper")
 
@@ -218,6 +222,22 @@ def format_results(events, format, group_by="uuid", transform=False):
     if type(events) is not list:
         events = [events]
 
+    key = None
+    if format in ("html", "markdown"):
+        # Rendering the table is the expensive part and the same events are often rendered again on the next worker run.
+        # The key is the JSON (str()) of the events, which only depends on their content, so a hit also skips preparing them below.
+        key = (
+            tuple(str(event[0] if type(event) is list else event) for event in events if event is not None and type(event) is not int),
+            format,
+            group_by,
+            transform,
+        )
+        with _RENDER_CACHE_LOCK:
+            table = _RENDER_CACHE.get(key)
+            if table is not None:
+                _RENDER_CACHE.move_to_end(key)
+                return table
+
     dict_events = []
 
     # Removing fields that are unnecessary for the table view
@@ -228,7 +248,7 @@ def format_results(events, format, group_by="uuid", transform=False):
             event = event[0]
             mlog.warning("format_results() - 'Event' is a list, taking first item")
 
-        event = event.__dict__()
+        event = event.to_dict()
         if "uuid" in event:
             del event["uuid"]
         if "process_parent" in event:
@@ -406,33 +426,51 @@ def format_results(events, format, group_by="uuid", transform=False):
     if len(dict_events) == 1:
         dict_events = dict_events[0]
 
-    # events = [del_none_from_dict(event.__dict__()) for event in events]
+    # events = [del_none_from_dict(event.to_dict()) for event in events]
 
-    if format in ("html", "markdown"):
-        if type(dict_events) is list and len(dict_events) > 0:
-            data = pd.DataFrame(data=dict_events)
-            if group_by != "":
-                data = data.groupby([group_by]).agg(lambda x: x.tolist())
-            data.dropna(axis=1, how="all", inplace=True)
-        else:
-            data = pd.DataFrame.from_dict(dict_events, orient="index")
-            data = data.T
-
-        # TODO: Add color support
-
-        if transform:
-            data = data.T
-
-        if format == "html":
-            tmp = data.to_html(index=False, classes=None, bold_rows=True)
-            return tmp.replace(' class="dataframe"', "")
-
-        elif format == "markdown":
-            return data.to_markdown(index="false")
+    if key is not None:
+        table = _render_table(dict_events, format, group_by, transform)
+        with _RENDER_CACHE_LOCK:
+            _RENDER_CACHE[key] = table
+            if len(_RENDER_CACHE) > RENDER_CACHE_SIZE:
+                _RENDER_CACHE.popitem(last=False)
+        return table
     elif format == "json":
         return json.dumps(events, ensure_ascii=False, sort_keys=False)
 
 
+def _render_table(dict_events, format, group_by, transform):
+    """Renders the events of format_results() as HTML or Markdown table."""
+    import pandas as pd  # Only needed for the table formats, so it is not imported with the module
+
+    if type(dict_events) is list and len(dict_events) > 0:
+        data = pd.DataFrame(data=dict_events)
+        if group_by != "":
+            data = data.groupby([group_by]).agg(lambda x: x.tolist())
+        data.dropna(axis=1, how="all", inplace=True)
+    else:
+        data = pd.DataFrame.from_dict(dict_events, orient="index")
+        data = data.T
+
+    # TODO: Add color support
+
+    if transform:
+        data = data.T
+
+    if format == "html":
+        tmp = data.to_html(index=False, classes=None, bold_rows=True)
+        return tmp.replace(' class="dataframe"', "")
+
+    elif format == "markdown":
+        return data.to_markdown(index="false")
+
+
+def clear_format_results_cache():
+    """Clears the cache of tables rendered by format_results()."""
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE.clear()
+
+
 def get_unique(data):
     """Get unique values from a list"""
     return list(set(data))
@@ -479,6 +517,8 @@ def handle_percentage(percentage):
         TypeError: If the percentage value is not an integer
         ValueError: If the percentage value is higher than 100 or lower than 0
     """
+    if type(percentage) is int and 0 <= percentage <= 100:
+        return percentage  # Common case (e.g. the default alert relevance of 50), checked with a single chained comparison
     if percentage is None:
         return None
     if type(percentage) != int:
@@ -490,6 +530,34 @@ def handle_percentage(percentage):
     return percentage
 
 
+def handle_percentages(percentages):
+    """Handles a whole column of percentage values at once. This is the vectorized version of handle_percentage() for bulk loads.
+
+    Args:
+        percentages (list): The percentage values. None values are allowed.
+
+    Returns:
+        list: The percentage values
+
+    Raises:
+        TypeError: If any percentage value is not an integer
+        ValueError: If any percentage value is higher than 100 or lower than 0
+    """
+    import numpy as np  # Only needed for bulk loads, so it is not imported with the module
+
+    percentages = list(percentages)
+    values = np.array([percentage for percentage in percentages if percentage is not None])
+    if values.size == 0:
+        return percentages
+    if values.dtype.kind not in "iu":
+        raise TypeError("Percentage value must be an integer")
+    if (values > 100).any():
+        raise ValueError("Percentage value cannot be higher than 100")
+    if (values < 0).any():
+        raise ValueError("Percentage value cannot be lower than 0")
+    return percentages
+
+
 def add_to_timeline(context_list, context, timestamp: datetime):
     """Adds a context to a context list, respecting the timeline.
 
@@ -502,7 +570,7 @@ def add_to_timeline(context_list, context, timestamp: datetime):
         None
     """
     if type(context) == list and len(context) >= THRESHOLD_MAX_CONTEXTS:
-        mlog = logging_helper.Log("lib.class_helper")
+        mlog = logging_helper.get_log("lib.class_helper")
         mlog.debug(
             "add_to_timeline() - [OVERFLOW PROTECTION] Maximum number of contexts reached. No more contexts will be added to the context list of context type '"
             + str(type(context_list[0]))
@@ -522,6 +590,25 @@ def add_to_timeline(context_list, context, timestamp: datetime):
                 break
 
 
+def remove_duplicates_from_list(values):
+    """Removes duplicate values from a list, keeping the order of their first appearance.
+
+    Args:
+        values (list): The list to remove the duplicates from
+
+    Returns:
+        list: The list without duplicates
+    """
+    try:
+        return list(dict.fromkeys(values))
+    except TypeError:  # Unhashable values (e.g. dicts) have to be compared one by one
+        unique_values = []
+        for value in values:
+            if value not in unique_values:
+                unique_values.append(value)
+        return unique_values
+
+
 def remove_duplicates_from_dict(d):
     """Removes duplicate values from a dictionary.
 
@@ -535,7 +622,7 @@ def remove_duplicates_from_dict(d):
         return None
     for key, value in list(d.items()):
         if type(value) is list:
-            d[key] = list(dict.fromkeys(value))
+            d[key] = remove_duplicates_from_list(value)
         elif isinstance(value, dict):
             remove_duplicates_from_dict(value)
     return d  # For convenience
@@ -224,6 +224,65 @@ def add_note_to_case(case_id, title, message, group_id=None, group_title=None):
     return group_id, True
 
 
+def update_case(case_id, title=None, notes=None):
+    """Applies a title update and any number of notes to a case using a single session.
+
+    Args:
+        case_id (int): The ID of the case
+        title (str, optional): The new title of the case. Defaults to None.
+        notes (list, optional): A list of (title, content, group_id, group_title) tuples. Defaults to None.
+
+    Returns:
+        dict, bool: The group IDs of the used note groups (keyed by group title) and True if all updates were successful
+    """
+    session = ClientSession(
+        apikey=config["api_key"],
+        host=config["url"],
+        ssl_verify=False,
+    )
+
+    # Get the Case from IRIS
+    case = Case(session=session)
+
+    # Fetch the case from its ID.
+    if not case.case_id_exists(cid=case_id):
+        mlog.error(f"Case ID {str(case_id)} not found !")
+        return {}, False
+
+    # Attribute the cid to the case instance
+    case.set_cid(cid=case_id)
+    success = True
+
+    if title is not None:
+        response = case.update_case(case_id=case_id, case_name=title)
+        if not response.is_success():
+            mlog.error(f"Could not update title of case: {response.log_error()}")
+            success = False
+
+    group_ids = {}
+    for note_title, message, group_id, group_title in notes or []:
+        if group_id is None and group_title is None:
+            group_title = "IRIS-SOAR Audit"
+
+        # Notes of the same group share one group, which is only created once
+        group_id = group_id or group_ids.get(group_title)
+        if not group_id:
+            response_group = case.add_notes_group(group_title, cid=case_id)
+            if not response_group.is_success():
+                mlog.error(f"Could not create group for case: {response_group.log_error()}")
+                success = False
+                continue
+            group_id = response_group.get_data()["group_id"]
+        group_ids[group_title] = group_id
+
+        response = case.add_note(note_title, message, group_id, cid=case_id)
+        if not response.is_success():
+            mlog.error(f"Could not add note to case: {case.log_error()}")
+            success = False
+
+    return group_ids, success
+
+
 def get_alert_by_id(alert_id):
     # Initiate a session with our API key and host. Session stays the same during all the script run.
     session = ClientSession(
@@ -243,4 +302,35 @@ def get_alert_by_id(alert_id):
         return current_alert.get_data()
 
 
+def get_alerts_by_ids(alert_ids, session=None):
+    """Returns the alerts for the given IDs, fetched with a single filter request.
+
+    Args:
+        alert_ids (list): The IDs of the alerts
+        session (ClientSession, optional): An existing session to reuse. Defaults to None.
+
+    Returns:
+        dict: A dict of alert dicts keyed by their alert ID or None if an error occured
+    """
+    if not alert_ids:
+        return {}
+
+    if session is None:
+        session = ClientSession(
+            apikey=config["api_key"],
+            host=config["url"],
+            ssl_verify=False,
+        )
+
+    alert = Alert(session=session)
+    response = alert.filter_alerts(alert_ids=",".join(str(alert_id) for alert_id in alert_ids), per_page=len(alert_ids))
+    if not response.is_success():
+        mlog.error(f"Could not get alerts from IRIS: {response.log_error()}")
+        return None
+
+    alerts = response.get_data_field("alerts") or []
+    mlog.debug(f"Got {len(alerts)} alerts from IRIS in one request.")
+    return {iris_alert["alert_id"]: iris_alert for iris_alert in alerts}
+
+
 # get_alert_by_id(4)
@@ -5,8 +5,12 @@
 import sys
 import logging
 import os
+import threading
+import functools
 
 TEST_CALL = True  # Stays True if the script is called by the test script
+AUDIT_LOG_LOCK = threading.Lock()  # Guards the read-modify-write of the audit log file (cases can be handled in parallel)
+LOG_SETUP_LOCK = threading.Lock()  # Guards the handler setup of the named loggers, which are shared by all threads
 
 
 class Log:
@@ -55,9 +59,9 @@ class Log:
                 if log_level_stdout == "none" and log_level == "none":
                     log_level_stdout = settings["logging"]["log_level_stdout"]
 
-            if self.logger.hasHandlers():  # Remove duplicate handlers
-                self.logger.handlers.clear()
-
+            # The new handlers replace the old ones at once (instead of clearing and refilling the shared list),
+            # so threads that log at the same time never see a partial handler list
+            handlers = []
             if "none" not in log_level_file:
                 if settings["logging"]["split_files_by_module"]:
                     path = "logs/" + module_name + ".log"
@@ -69,7 +73,7 @@ class Log:
                 handlerFile = logging.FileHandler(path)
                 handlerFile.setLevel(log_level_file.upper())
                 handlerFile.setFormatter(formatter)
-                self.logger.addHandler(handlerFile)
+                handlers.append(handlerFile)
 
             if ("none" not in log_level_stdout) or ("none" not in log_level):
                 handlerStream = logging.StreamHandler()
@@ -79,7 +83,13 @@ class Log:
                     handlerStream.setLevel(log_level.upper())
 
                 handlerStream.setFormatter(formatter)
-                self.logger.addHandler(handlerStream)
+                handlers.append(handlerStream)
+
+            with LOG_SETUP_LOCK:
+                old_handlers = self.logger.handlers
+                self.logger.handlers = handlers
+            for handler in old_handlers:  # Remove duplicate handlers (and do not leak their open files)
+                handler.close()
         except Exception as e:
             print(f"[CRITICAL] The logger object for {module_name} could not be initialized.")
             raise (e)
@@ -94,6 +104,21 @@ class Log:
         for handler in self.logger.handlers:
             handler.setLevel(level.upper())
 
+    def is_enabled_for(self, level):
+        """Checks if a message of the given level would be emitted by any handler (e.g. to skip building expensive debug messages).
+
+        Args:
+            level (str or int): The level (e.g. "DEBUG" or logging.DEBUG)
+
+        Returns:
+            bool: True if at least one handler would emit the message, False if not
+        """
+        if isinstance(level, str):
+            level = logging.getLevelName(level.upper())
+        if not self.logger.isEnabledFor(level):
+            return False
+        return any(handler.level <= level for handler in self.logger.handlers)
+
     def debug(self, message):
         """Logs a debug message.
 
@@ -150,6 +175,19 @@ class Log:
         self.logger.critical(message)
 
 
+@functools.lru_cache(maxsize=None)
+def get_log(module_name, log_level="none", log_level_file="none", log_level_stdout="INFO"):
+    """Returns the Log() object for the given module name and log levels. It is only created once per combination of arguments.
+
+    Args:
+        module_name (str): The name of the module
+
+    Returns:
+        Log: The (shared) Log() object
+    """
+    return Log(module_name, log_level, log_level_file, log_level_stdout)
+
+
 def update_audit_log(alert_uuid, new_action, logger=None):
     """Updates the audit log file with the given audit_log.
        If an audit log with the same playbook and stage already exists, it will be overwritten.
@@ -165,52 +203,53 @@ def update_audit_log(alert_uuid, new_action, logger=None):
     import json
 
     path = "logs/audit.log"
-    mlog = Log("logging_helper")
-
-    # Load the audit log
-    try:
-        with open(path, "r") as f:
-            audit_log_file = json.load(f)
-    except FileNotFoundError:
-        mlog.warning(f"Could not find audit log file at {path}. Creating a new one.")
-        audit_log_file = {}
-    except Exception as e:
-        if e is not FileNotFoundError:
-            mlog.critical(f"Could not load audit log file at {path}. Error: {e}")
-            return
-
-    # Get the audit log for given alert_uuid
-    try:
-        al_alert = audit_log_file[str(alert_uuid)]
-        mlog.debug(f"Found audit log for alert_uuid {alert_uuid}: {al_alert}")
-    except KeyError:
-        mlog.info(f"Could not find audit log for alert_uuid {alert_uuid}. Creating a new one.")
-        al_alert = []
-
-    # Update the audit log but check if playbook and stage already exists
-    is_update = False
-    if al_alert != []:
-        for element in al_alert:
-            element_dict = json.loads(element)
-            if element_dict["playbook"] == new_action.playbook and element_dict["stage"] == new_action.stage:
-                mlog.debug(
-                    f"Found existing audit log for playbook {new_action.playbook} and stage {new_action.stage}. Overwriting it."
-                )
-                is_update = True
-                al_alert.remove(element)
-                break
-
-    # Add the new audit log
-    str_new_action = str(new_action)
-    al_alert.append(str_new_action)
-    audit_log_file[str(alert_uuid)] = al_alert
-
-    # Save the audit log
-    try:
-        with open(path, "w") as f:
-            json.dump(audit_log_file, f, indent=4)
-    except Exception as e:
-        mlog.critical(f"Could not save audit log file at {path}. Error: {e}")
+    mlog = get_log("logging_helper")
+
+    with AUDIT_LOG_LOCK:
+        # Load the audit log
+        try:
+            with open(path, "r") as f:
+                audit_log_file = json.load(f)
+        except FileNotFoundError:
+            mlog.warning(f"Could not find audit log file at {path}. Creating a new one.")
+            audit_log_file = {}
+        except Exception as e:
+            if e is not FileNotFoundError:
+                mlog.critical(f"Could not load audit log file at {path}. Error: {e}")
+                return
+
+        # Get the audit log for given alert_uuid
+        try:
+            al_alert = audit_log_file[str(alert_uuid)]
+            mlog.debug(f"Found audit log for alert_uuid {alert_uuid}: {al_alert}")
+        except KeyError:
+            mlog.info(f"Could not find audit log for alert_uuid {alert_uuid}. Creating a new one.")
+            al_alert = []
+
+        # Update the audit log but check if playbook and stage already exists
+        is_update = False
+        if al_alert != []:
+            for element in al_alert:
+                element_dict = json.loads(element)
+                if element_dict["playbook"] == new_action.playbook and element_dict["stage"] == new_action.stage:
+                    mlog.debug(
+                        f"Found existing audit log for playbook {new_action.playbook} and stage {new_action.stage}. Overwriting it."
+                    )
+                    is_update = True
+                    al_alert.remove(element)
+                    break
+
+        # Add the new audit log
+        str_new_action = str(new_action)
+        al_alert.append(str_new_action)
+        audit_log_file[str(alert_uuid)] = al_alert
+
+        # Save the audit log
+        try:
+            with open(path, "w") as f:
+                json.dump(audit_log_file, f, indent=4)
+        except Exception as e:
+            mlog.critical(f"Could not save audit log file at {path}. Error: {e}")
 
     if logger is not None:
         if type(logger) is Log:
@@ -232,3 +271,4 @@ def update_audit_log(alert_uuid, new_action, logger=None):
 
 if __name__ == "__main__":
     pass
+
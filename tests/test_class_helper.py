@@ -0,0 +1,900 @@
+# IRIS-SOAR
+# Created by: Martin Offermann
+# This test module is used to test the lib/class_helper.py module.
+# It will test if the context classes serialize, pickle and copy as expected.
+
+import copy
+import datetime
+import inspect
+import io
+import ipaddress
+import json
+import pickle
+import uuid
+
+import pytest
+
+import lib.class_helper as class_helper
+from lib.generic_helper import del_none_from_dict
+
+PICKLE_PROTOCOLS = (0, 2, 5)
+TIMESTAMP = datetime.datetime(2023, 1, 2, 3, 4, 5)
+UUID = uuid.UUID(int=1)
+
+# Arguments of the baseline Whois constructor, in order (all required, without defaults)
+WHOIS_ARGUMENTS = (
+    "domain_name", "registry_domain_id", "registrar_whois_server", "registrar_url", "updated_date", "creation_date",
+    "registry_expiry_date", "registrar", "registrar_abuse_contact_email", "registrar_abuse_contact_phone", "domain_status",
+    "registry_registrant_id", "registrant_name", "registrant_organization", "registrant_street", "registrant_city",
+    "registrant_state_province", "registrant_postal_code", "registrant_country", "registrant_phone", "registrant_phone_ext",
+    "registrant_fax", "registrant_fax_ext", "registrant_email", "registry_admin_id", "admin_name", "admin_organization",
+    "admin_street", "admin_city", "admin_state_province", "admin_postal_code", "admin_country", "admin_phone", "admin_phone_ext",
+    "admin_fax", "admin_fax_ext", "admin_email", "registry_tech_id", "tech_name", "tech_organization", "tech_street", "tech_city",
+    "tech_state_province", "tech_postal_code", "tech_country", "tech_phone", "tech_phone_ext", "tech_fax", "tech_fax_ext",
+    "tech_email", "name_server1", "name_server2", "dnssec",
+)
+
+# to_dict() keys of the baseline implementation (before the serializers were generated from field tables), in order
+BASELINE_KEYS = {
+    "Location": (
+        "location_country", "location_city", "location_latitude", "location_longitude", "location_timezone", "location_asn",
+        "location_asn_corperation", "location_org", "location_certainty", "location_last_updated",
+    ),
+    "Vulnerability": (
+        "vuln_cve", "vuln_description", "vuln_tags", "vuln_created_at", "vuln_updated_at", "vuln_cvss", "vuln_cvss_vector",
+        "vuln_cvss3", "vuln_cvss3_vector", "vuln_cwe", "vuln_references", "vuln_exploit_available", "vuln_exploit_frameworks",
+        "vuln_exploit_mitigations", "vuln_exploitability_ease", "vuln_published_at", "vuln_last_modified_at", "vuln_patched_at",
+        "vuln_solution", "vuln_solution_date", "vuln_solution_type", "vuln_solution_url", "vuln_solution_advisory",
+        "vuln_solution_advisory_url", "vuln_services_affected", "vuln_services_vulnerable", "vuln_attack_vector",
+        "vuln_attack_complexity", "vuln_privileges_required", "vuln_user_interaction", "vuln_confidentiality_impact",
+        "vuln_integrity_impact", "vuln_availability_impact", "vuln_scope", "vuln_version", "vuln_uuid",
+    ),
+    "Service": (
+        "svc_name", "svc_vendor", "svc_description", "svc_tags", "svc_created_at", "svc_updated_at",
+        "svc_current_vulnerabilities", "svc_fixed_vulnerabilities", "svc_installed_version", "svc_latest_version", "svc_outdated",
+        "svc_ports", "svc_protocol", "svc_required_availability", "svc_required_confidentiality", "svc_required_integrity",
+        "svc_colleteral_damage_potential", "svc_impact_score", "svc_risk_score", "svc_risk_score_vector", "svc_child_services",
+        "svc_parent_services", "svc_uuid",
+    ),
+    "Person": (
+        "user_name", "user_email", "user_phone", "user_tags", "user_created_at", "user_updated_at", "user_primary_location",
+        "user_locations", "user_roles", "user_access_to",
+    ),
+    "ContextAsset": (
+        "device_name", "device_local_ip", "device_global_ip", "device_ips", "device_mac", "device_vendor", "device_os",
+        "device_os_version", "device_os_family", "device_os_last_update", "device_kernel", "device_in_scope", "device_tags",
+        "device_created_at", "device_updated_at", "device_in_use", "device_type", "device_owner", "device_uuid", "device_aliases",
+        "device_description", "device_location", "device_notes", "device_last_seen", "device_first_seen", "device_last_scan",
+        "device_last_update", "device_user", "device_group", "device_auth_types", "device_auth_stored_in",
+        "device_stored_credentials", "device_should_state", "device_is_state", "device_is_state_reason", "device_hypervisor",
+        "device_virtualization_type", "device_virtual_locations", "device_services", "device_vulnerabilities", "device_domains",
+        "device_network", "device_interfaces", "device_ports", "device_protocols",
+    ),
+    "Rule": (
+        "rule_id", "rule_name", "rule_description", "rule_severity", "rule_risk_score", "rule_query", "rule_mitre_references",
+        "rule_known_false_positives", "rule_tags", "rule_raw", "rule_created_at", "rule_updated_at",
+    ),
+    "Certificate": (
+        "cert_timestamp", "cert_related_alert_uuid", "cert_subject", "cert_issuer", "cert_issuer_common_name",
+        "cert_issuer_organization", "cert_issuer_organizational_unit", "cert_serial_number", "cert_subject_common_name",
+        "cert_subject_organization", "cert_subject_organizational_unit", "cert_subject_alternative_names", "cert_valid_from",
+        "cert_valid_to", "cert_version", "cert_signature_algorithm", "cert_public_key_algorithm", "cert_public_key_size",
+        "cert_is_trusted", "cert_is_self_signed",
+    ),
+    "ContextFile": (
+        "file_related_alert_uuid", "file_timestamp", "file_action", "file_name", "file_original_name", "file_path",
+        "file_original_path", "file_size", "file_md5", "file_sha1", "file_sha256", "file_type", "file_extension",
+        "file_signature", "file_header_bytes", "file_entropy", "file_process_name", "file_process_id", "file_process_uuid",
+        "file_is_encrypted", "file_is_compressed", "file_is_archive", "file_is_executable", "file_is_readable",
+        "file_is_writable", "file_is_hidden", "file_is_system", "file_is_temporary", "file_is_virtual", "file_is_directory",
+        "file_is_symlink", "file_is_special", "file_is_unknown", "file_last_modified", "file_uuid",
+    ),
+    "DNSQuery": (
+        "dns_related_alert_uuid", "dns_type", "dns_query", "dns_has_response", "dns_query_response", "dns_rcode", "dns_timestamp",
+    ),
+    "HTTP": (
+        "http_timestamp", "http_related_alert_uuid", "http_method", "http_type", "http_host", "http_status_code", "http_path",
+        "http_full_url", "http_user_agent", "http_referer", "http_status_message", "http_request_body", "http_response_body",
+        "http_request_headers", "http_response_headers", "http_version", "http_certificate", "http_file",
+    ),
+    "ContextFlow": (
+        "flow_related_alert_uuid", "flow_alert relevance", "flow_timestamp", "flow_data", "flow_integration",
+        "flow_firewall_action", "flow_source_ip", "flow_source_location", "flow_source_port", "flow_destination_ip",
+        "flow_destination_location", "flow_destination_port", "flow_protocol", "flow_process_uuid", "flow_process_id",
+        "flow_process_name", "flow_source_mac", "flow_destination_mac", "flow_source_hostname", "flow_destination_hostname",
+        "flow_category", "flow_sub_category", "flow_direction", "flow_id", "flow_bytes_send", "flow_bytes_received",
+        "flow_interface", "flow_network", "flow_network_type", "flow_source", "flow_application", "flow_http", "flow_dns_query",
+        "flow_device", "flow_firewall_rule_id", "flow_uuid",
+    ),
+    "ContextProcess": (
+        "process_timestamp", "process_related_alert_uuid", "process_alert_relevance", "process_name", "process_id",
+        "parent_process_name", "parent_process_id", "process_path", "process_md5", "process_sha1", "process_sha256",
+        "process_command_line", "process_username", "process_integrity_level", "process_is_elevated_token",
+        "process_token_elevation_type", "process_token_elevation_type_full", "process_token_integrity_level",
+        "process_token_integrity_level_full", "process_privileges", "process_owner", "process_group_id", "process_group_name",
+        "process_logon_guid", "process_logon_id", "process_logon_type", "process_logon_type_full", "process_logon_time",
+        "process_start_time", "process_parent_start_time", "process_current_directory", "process_image_file_device",
+        "process_image_file_directory", "process_image_file_name", "process_image_file_path", "process_dns", "process_signature",
+        "process_http", "process_flow", "process_parent", "process_children", "process_environment_variables",
+        "process_arguments", "parent_process_arguments", "process_modules", "process_thread", "process_created_files",
+        "process_deleted_files", "process_modified_files", "process_created_registry_keys", "process_deleted_registry_keys",
+        "process_modified_registry_keys", "process_is_complete", "process_uuid",
+    ),
+    "ContextLog": (
+        "log_related_alert_uuid", "log_alert_relevance", "log_timestamp", "log_message", "log_source_name", "log_source_ip",
+        "log_source_device", "log_flow", "log_protocol", "log_type", "log_severity", "log_facility", "log_tags",
+        "log_custom_fields", "log_uuid",
+    ),
+    "ContextRegistry": (
+        "registry_related_alert_uuid", "registry_timestamp", "registry_action", "registry_key", "registry_value", "registry_data",
+        "registry_data_type", "registry_hive", "registry_path", "registry_process_name", "registry_process_id",
+        "registry_process_uuid",
+    ),
+    "ThreatIntel": (
+        "ti_time_requested", "ti_engine", "ti_is_related_indicator", "ti_related_indicator_name", "ti_is_known", "ti_is_hit",
+        "ti_hit_type", "ti_threat_name", "ti_confidence", "ti_engine_version", "ti_engine_update", "ti_alert_last_seen",
+        "ti_alert_last_update", "ti_method",
+    ),
+    "Whois": tuple("whois_" + arg for arg in WHOIS_ARGUMENTS),
+}
+
+
+def sample_objects():
+    """Returns one populated object of every class that has __slots__.
+
+    Args:
+        None
+
+    Returns:
+        list: The sample objects
+    """
+    return [
+        class_helper.Location("DE", city="Berlin", last_updated=TIMESTAMP, uuid=UUID),
+        class_helper.Vulnerability("CVE-2023-0001", created_at=TIMESTAMP, uuid=UUID),
+        class_helper.Service("ssh", created_at=TIMESTAMP, uuid=UUID),
+        class_helper.Person(name="Alice", created_at=TIMESTAMP, uuid=UUID),
+        class_helper.ContextAsset(name="host1", local_ip="10.0.0.1", uuid=UUID),
+        class_helper.Rule("123", "Some Rule", 0),
+        class_helper.Certificate(UUID, "CN=a", "CN=b"),
+        class_helper.ContextFile(file_name="a.exe", file_path="C:\\a.exe"),
+        class_helper.DNSQuery(UUID, query="example.com"),
+        class_helper.HTTP(method="GET", type="HTTP", host="example.com", path="/"),
+        class_helper.ContextFlow(
+            UUID,
+            TIMESTAMP,
+            "Suricata",
+            ipaddress.ip_address("10.0.0.1"),
+            1234,
+            ipaddress.ip_address("8.8.8.8"),
+            80,
+            "TCP",
+            flow_id=1,
+        ),
+        class_helper.ContextProcess(UUID, process_name="a.exe", process_start_time=TIMESTAMP, process_io_text="äöü"),
+        class_helper.ContextLog(timestamp=TIMESTAMP, log_message="Some log", log_custom_fields={"a": 1}),
+        class_helper.ContextRegistry(UUID, TIMESTAMP, "set", "key", "value"),
+        class_helper.ThreatIntel(time_requested=TIMESTAMP, engine="engine", is_known=True, is_hit=True, hit_type="Malicious"),
+        class_helper.Whois(**{arg: arg for arg in WHOIS_ARGUMENTS}),
+    ]
+
+
+@pytest.mark.parametrize("protocol", PICKLE_PROTOCOLS)
+def test_pickle_round_trip(protocol):
+    """Tests that every slotted class keeps its state through pickle.
+
+    Args:
+        protocol (int): The pickle protocol
+
+    Returns:
+        None
+    """
+    for obj in sample_objects():
+        restored = pickle.loads(pickle.dumps(obj, protocol))
+        assert type(restored) is type(obj)
+        assert restored.to_dict() == obj.to_dict(), f"{type(obj).__name__} changed through pickle protocol {protocol}"
+        assert str(restored) == str(obj), f"{type(obj).__name__} renders differently after pickle protocol {protocol}"
+
+
+def test_copy_round_trip():
+    """Tests that copy.copy() and copy.deepcopy() keep the state of every slotted class.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    for obj in sample_objects():
+        assert copy.copy(obj).to_dict() == obj.to_dict(), f"{type(obj).__name__} changed through copy.copy()"
+        assert copy.deepcopy(obj).to_dict() == obj.to_dict(), f"{type(obj).__name__} changed through copy.deepcopy()"
+
+
+@pytest.mark.parametrize("protocol", PICKLE_PROTOCOLS)
+def test_pickle_keeps_lazy_values(protocol):
+    """Tests that lazily created values (the ContextFile UUID, the Location/Person timestamp) are kept by pickle,
+    even if they were not accessed before pickling.
+
+    Args:
+        protocol (int): The pickle protocol
+
+    Returns:
+        None
+    """
+    file = class_helper.ContextFile(file_name="x")
+    restored = pickle.loads(pickle.dumps(file, protocol))
+    assert restored.to_dict()["file_uuid"] == file.to_dict()["file_uuid"], "ContextFile got a new UUID through pickle"
+    assert copy.copy(file).uuid == file.uuid, "ContextFile got a new UUID through copy.copy()"
+
+    for obj in (class_helper.Location("DE"), class_helper.Person(name="Alice")):
+        restored = pickle.loads(pickle.dumps(obj, protocol))
+        assert restored.timestamp == obj.timestamp, f"{type(obj).__name__} got a new timestamp through pickle"
+        assert restored.uuid == obj.uuid
+
+
+def test_pickle_resets_json_cache():
+    """Tests that the cached JSON of the _CachedJSON classes is not pickled, but rebuilt after unpickling.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    location = class_helper.Location("DE", uuid=UUID)
+    json_str = location.to_json()
+    restored = pickle.loads(pickle.dumps(location))
+    assert restored._json_cache is None
+    assert restored.to_json() == json_str
+
+    restored.city = "Berlin"
+    assert "Berlin" in restored.to_json(), "Setting an attribute after unpickling must invalidate the cache"
+
+
+def test_to_dict_keys_match_baseline():
+    """Tests that the generated to_dict() of every class returns the same keys in the same order as the baseline implementation.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    for obj in sample_objects():
+        name = type(obj).__name__
+        assert tuple(obj.to_dict()) == BASELINE_KEYS[name], f"The to_dict() keys of {name} differ from the baseline"
+
+
+def test_to_dict_keeps_none():
+    """Tests that unset fields of every class are None in to_dict() (instead of the string 'None').
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    for obj in sample_objects() + [class_helper.ContextProcess(process_name="a.exe")]:
+        for key, value in obj.to_dict().items():
+            assert value != "None", f"{type(obj).__name__}.to_dict()['{key}'] is the string 'None'"
+
+    flow = class_helper.ContextFlow(UUID, TIMESTAMP, "Suricata", ipaddress.ip_address("10.0.0.1"), 1, ipaddress.ip_address("8.8.8.8"), 80, "TCP")
+    assert flow.to_dict()["flow_http"] is None
+    assert flow.to_dict()["flow_source_ip"] == "10.0.0.1"
+    process = class_helper.ContextProcess(UUID, process_name="a.exe")
+    assert process.to_dict()["process_parent"] is None
+    device = class_helper.ContextAsset(name="host1", local_ip="10.0.0.1", uuid=UUID)
+    assert device.to_dict()["device_owner"] is None
+    assert device.to_dict()["device_local_ip"] == "10.0.0.1"
+    http = class_helper.HTTP(method="GET", type="HTTP", host="example.com", path="/")
+    assert http.to_dict()["http_certificate"] is None
+
+
+def test_str_keys_match_baseline():
+    """Tests that str() of every class is a JSON object with the baseline keys (in order), leaving out empty values.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    for obj in sample_objects():
+        name = type(obj).__name__
+        str_dict = json.loads(str(obj))
+        baseline_keys = [key for key in BASELINE_KEYS[name] if key in str_dict]
+        assert list(str_dict) == baseline_keys, f"str() of {name} has other keys (or another order) than the baseline"
+        assert None not in str_dict.values(), f"str() of {name} contains null values"
+        assert "" not in str_dict.values(), f"str() of {name} contains empty strings"
+
+
+def test_str_nests_context_objects():
+    """Tests that str() writes nested context objects as JSON objects, while to_dict() keeps their string form.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    http = class_helper.HTTP(method="GET", type="HTTP", host="example.com", path="/")
+    dns_query = class_helper.DNSQuery(UUID, query="example.com")
+    device = class_helper.ContextAsset(name="host1", local_ip="10.0.0.1", uuid=UUID)
+    flow = class_helper.ContextFlow(
+        UUID,
+        TIMESTAMP,
+        "Suricata",
+        ipaddress.ip_address("10.0.0.1"),
+        1234,
+        ipaddress.ip_address("8.8.8.8"),
+        80,
+        "TCP",
+        flow_id=1,
+        http=http,
+        dns_query=dns_query,
+        device=device,
+    )
+
+    str_dict = json.loads(str(flow))
+    for key, nested in (("flow_http", http), ("flow_dns_query", dns_query), ("flow_device", device)):
+        assert isinstance(str_dict[key], dict), f"str() of ContextFlow writes {key} as an escaped string"
+        assert str_dict[key] == json.loads(str(nested))
+        assert flow.to_dict()[key] == str(nested)
+
+    process = class_helper.ContextProcess(UUID, process_name="a.exe", process_flow=flow)
+    assert json.loads(str(process))["process_flow"]["flow_http"]["http_method"] == "GET"
+
+
+@pytest.mark.parametrize("use_orjson", (True, False))
+def test_json_path_keeps_raw_values(monkeypatch, use_orjson):
+    """Tests that _to_json_dict() keeps datetimes, IP addresses and UUIDs, and that they are rendered like str() renders them.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to switch to the json module fallback
+        use_orjson (bool): If False, the JSON is serialized without orjson
+
+    Returns:
+        None
+    """
+    if not use_orjson:
+        monkeypatch.setattr(class_helper, "orjson", None)
+    flow = class_helper.ContextFlow(
+        UUID, TIMESTAMP, "Suricata", ipaddress.ip_address("10.0.0.1"), 1234, ipaddress.ip_address("8.8.8.8"), 80, "TCP", flow_id=1
+    )
+
+    json_dict = flow._to_json_dict()
+    assert json_dict["flow_timestamp"] is TIMESTAMP
+    assert json_dict["flow_source_ip"] == ipaddress.ip_address("10.0.0.1")
+    assert isinstance(json_dict["flow_uuid"], uuid.UUID)
+
+    to_dict = flow.to_dict()
+    assert to_dict["flow_timestamp"] == "2023-01-02 03:04:05"
+    assert to_dict["flow_source_ip"] == "10.0.0.1"
+    assert to_dict["flow_uuid"] == str(flow.uuid)
+
+    str_dict = json.loads(str(flow))
+    for key in ("flow_timestamp", "flow_source_ip", "flow_uuid"):
+        assert str_dict[key] == to_dict[key]
+
+    location = class_helper.Location("DE", last_updated=TIMESTAMP, uuid=UUID)
+    assert json.loads(location.to_json(compact=True))["location_last_updated"] == "2023-01-02 03:04:05"
+    assert json.loads(str(location))["location_last_updated"] == "2023-01-02 03:04:05"
+
+
+def test_whois_signature():
+    """Tests that the generated Whois constructor has the arguments of the baseline constructor and assigns them.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parameters = list(inspect.signature(class_helper.Whois.__init__).parameters.values())
+    assert parameters[0].name == "self"
+    assert tuple(parameter.name for parameter in parameters[1:]) == WHOIS_ARGUMENTS
+    for parameter in parameters[1:]:
+        assert parameter.default is inspect.Parameter.empty, f"Whois argument '{parameter.name}' has a default"
+        assert parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+
+    whois = class_helper.Whois(*WHOIS_ARGUMENTS)
+    for arg in WHOIS_ARGUMENTS:
+        assert getattr(whois, arg) == arg
+    with pytest.raises(TypeError):
+        class_helper.Whois(*WHOIS_ARGUMENTS[:-1])
+
+
+def test_strip_none_matches_del_none_from_dict():
+    """Tests that the generated None filters clean the to_dict() result of every class like del_none_from_dict() does.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    for obj in sample_objects():
+        name = type(obj).__name__
+        stripped = class_helper._strip_none(type(obj), copy.deepcopy(obj.to_dict()))
+        assert stripped == del_none_from_dict(copy.deepcopy(obj.to_dict())), f"None filter of {name} differs"
+
+
+def test_strip_none_falls_back_on_other_keys():
+    """Tests that _strip_none() falls back to del_none_from_dict() if a dictionary has other keys than on first use.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    class Dummy:
+        pass
+
+    try:
+        assert class_helper._strip_none(Dummy, {"a": 1, "b": None, "c": ""}) == {"a": 1}
+        assert Dummy in class_helper._NONE_FILTERS
+
+        # Missing keys raise a KeyError in the cached filter
+        assert class_helper._strip_none(Dummy, {"d": 2, "e": None}) == {"d": 2}
+        # Additional keys must not be dropped silently
+        assert class_helper._strip_none(Dummy, {"a": 1, "b": None, "c": "", "f": 3}) == {"a": 1, "f": 3}
+        # The cached filter is still used for the original keys
+        assert class_helper._strip_none(Dummy, {"a": None, "b": 2, "c": "N/A"}) == {"b": 2}
+    finally:
+        class_helper._NONE_FILTERS.pop(Dummy, None)
+
+
+@pytest.mark.parametrize("text", ("abcdef", "aäöü", "a€€€", "a😀😀", "äb€c😀d"))
+def test_utf8_len(text):
+    """Tests that _utf8_len() returns the UTF-8 encoded length of ASCII and multibyte strings.
+
+    Args:
+        text (str): The text to measure
+
+    Returns:
+        None
+    """
+    assert class_helper._utf8_len(text) == len(text.encode("utf-8"))
+
+
+@pytest.mark.parametrize("text", ("abcdef", "aäöü", "a€€€", "a😀😀", "äb€c😀d"))
+def test_truncate_utf8_at_multibyte_boundaries(text):
+    """Tests that _truncate_utf8() never exceeds max_bytes and never splits a character, for every possible cut.
+
+    Args:
+        text (str): The text to truncate (ASCII, or with 2, 3 and 4 byte characters)
+
+    Returns:
+        None
+    """
+    encoded = text.encode("utf-8")
+    for max_bytes in range(len(encoded) + 2):
+        truncated = class_helper._truncate_utf8(text, max_bytes)
+        truncated_bytes = truncated.encode("utf-8")
+        assert len(truncated_bytes) <= max_bytes
+        assert text.startswith(truncated)
+        # Only the character that was cut may be dropped
+        if len(truncated) < len(text):
+            assert len(truncated_bytes) + len(text[len(truncated)].encode("utf-8")) > max_bytes
+
+
+def test_strip_none_does_not_serialize_nested_objects(monkeypatch):
+    """Tests that the None filter keeps nested context objects without calling their __str__().
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to count the __str__() calls
+
+    Returns:
+        None
+    """
+    calls = []
+    original_str = class_helper.Location.__str__
+
+    def counting_str(self):
+        calls.append(self)
+        return original_str(self)
+
+    monkeypatch.setattr(class_helper.Location, "__str__", counting_str)
+    location = class_helper.Location("DE", uuid=UUID)
+    device = class_helper.ContextAsset(name="host1", local_ip="10.0.0.1", location=location, uuid=UUID)
+
+    stripped = class_helper._strip_none(class_helper.ContextAsset, device.to_dict(raw=True))
+    assert stripped["device_location"] is location
+    assert calls == []
+
+
+def test_str_serializes_nested_objects_once(monkeypatch):
+    """Tests that str() serializes every nested context object exactly once, also through a nested ContextAsset.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to count the serialization calls
+
+    Returns:
+        None
+    """
+    calls = {"str": 0, "json": 0}
+    original_str = class_helper.Location.__str__
+    original_to_json_dict = class_helper.Location._to_json_dict
+
+    def counting_str(self):
+        calls["str"] += 1
+        return original_str(self)
+
+    def counting_to_json_dict(self, expand=False):
+        calls["json"] += 1
+        return original_to_json_dict(self, expand)
+
+    monkeypatch.setattr(class_helper.Location, "__str__", counting_str)
+    monkeypatch.setattr(class_helper.Location, "_to_json_dict", counting_to_json_dict)
+    location = class_helper.Location("DE", city="Berlin", uuid=UUID)
+    device = class_helper.ContextAsset(name="host1", local_ip="10.0.0.1", location=location, uuid=UUID)
+
+    assert json.loads(str(device))["device_location"]["location_city"] == "Berlin"
+    assert calls == {"str": 0, "json": 1}
+
+    calls.update(str=0, json=0)
+    flow = class_helper.ContextFlow(
+        UUID, TIMESTAMP, "Suricata", ipaddress.ip_address("10.0.0.1"), 1234, ipaddress.ip_address("8.8.8.8"), 80, "TCP", device=device
+    )
+    assert json.loads(str(flow))["flow_device"]["device_location"]["location_city"] == "Berlin"
+    assert calls == {"str": 0, "json": 1}
+
+
+def test_vulnerability_keeps_empty_lists():
+    """Tests that explicitly passed empty lists stay (appendable) lists, while missing ones share the empty default.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    vulnerability = class_helper.Vulnerability(
+        "CVE-2023-0001", exploit_frameworks=[], exploit_mitigations=[], services_affected=[], services_vulnerable=[]
+    )
+    for attr in ("exploit_frameworks", "exploit_mitigations", "services_affected", "services_vulnerable"):
+        value = getattr(vulnerability, attr)
+        assert value == [] and type(value) is list, f"Vulnerability.{attr} is not a list"
+    vulnerability.exploit_frameworks.append("Metasploit")
+    assert vulnerability.to_dict()["vuln_exploit_frameworks"] == ["Metasploit"]
+
+    vulnerability = class_helper.Vulnerability("CVE-2023-0001")
+    assert vulnerability.exploit_frameworks == ()
+    assert vulnerability.services_affected == ()
+
+
+@pytest.mark.parametrize("cls, prefix", (("Location", "location_"), ("Person", "user_")))
+def test_load_from_dict_logs_failing_setters(monkeypatch, cls, prefix):
+    """Tests that load_from_dict() loads the valid attributes and logs the failing ones once, instead of raising.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to collect the logged errors
+        cls (str): The name of the class to test
+        prefix (str): The key prefix of the class
+
+    Returns:
+        None
+    """
+    errors = []
+    monkeypatch.setattr(class_helper.mlog, "error", errors.append)
+    obj = class_helper.Location("DE") if cls == "Location" else class_helper.Person(name="Alice")
+
+    attr = "city" if cls == "Location" else "email"
+    obj.load_from_dict({prefix + "uuid": "not a uuid", prefix + attr: "value", prefix + "unknown": 1})
+    assert getattr(obj, attr) == "value"
+    assert len(errors) == 1
+    assert "2 attribute(s)" in errors[0] and "'uuid'" in errors[0] and "'unknown'" in errors[0]
+
+
+@pytest.mark.parametrize("use_orjson", (True, False))
+def test_json_output_format(monkeypatch, use_orjson):
+    """Tests that str() and the compact serialization have the same format with and without orjson.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to switch to the json module fallback
+        use_orjson (bool): If False, the JSON is serialized without orjson
+
+    Returns:
+        None
+    """
+    if not use_orjson:
+        monkeypatch.setattr(class_helper, "orjson", None)
+    dict_ = {"name": "äöü", "timestamp": TIMESTAMP, "nested": {"a": 1}}
+
+    assert class_helper._dumps_indented(dict_) == (
+        '{\n  "name": "äöü",\n  "timestamp": "2023-01-02 03:04:05",\n  "nested": {\n    "a": 1\n  }\n}'
+    )
+    assert class_helper._dumps_indented_bytes(dict_) == class_helper._dumps_indented(dict_).encode()
+    assert class_helper._dumps_compact_bytes(dict_) == '{"name":"äöü","timestamp":"2023-01-02 03:04:05","nested":{"a":1}}'.encode()
+
+
+def test_bulk_load_from_iris(monkeypatch):
+    """Tests that Alert.bulk_load_from_iris() returns the alerts of the bulk request and raises if the request failed.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace iris_helper.get_alerts_by_ids()
+
+    Returns:
+        None
+    """
+    session = object()
+    requests = []
+
+    def get_alerts_by_ids(alert_ids, session=None):
+        requests.append((alert_ids, session))
+        return {alert_id: {"alert_id": alert_id} for alert_id in alert_ids}
+
+    monkeypatch.setattr(class_helper.iris_helper, "get_alerts_by_ids", get_alerts_by_ids)
+    assert class_helper.Alert.bulk_load_from_iris(session, [3, 5]) == {3: {"alert_id": 3}, 5: {"alert_id": 5}}
+    assert requests == [([3, 5], session)]
+
+    monkeypatch.setattr(class_helper.iris_helper, "get_alerts_by_ids", lambda alert_ids, session=None: None)
+    with pytest.raises(ValueError):
+        class_helper.Alert.bulk_load_from_iris(session, [3, 5])
+
+
+def test_load_from_iris_uses_prefetched_alert(monkeypatch):
+    """Tests that Alert.load_from_iris() only requests the alert itself if it was not prefetched by the bulk request.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace iris_helper.get_alert_by_id()
+
+    Returns:
+        None
+    """
+    requested = []
+
+    def get_alert_by_id(alert_id):
+        requested.append(alert_id)
+        return None
+
+    class PrefetchedAlert(dict):
+        """Stops load_from_iris() at the first access, as only the source of the alert is tested here."""
+
+        def __getitem__(self, key):
+            raise LookupError("prefetched alert was read")
+
+    monkeypatch.setattr(class_helper.iris_helper, "get_alert_by_id", get_alert_by_id)
+
+    with pytest.raises(LookupError, match="prefetched alert was read"):
+        class_helper.Alert().load_from_iris(3, iris_alert=PrefetchedAlert())
+    assert requested == []
+
+    # Fallback: the alert is requested on its own
+    with pytest.raises(ValueError, match="not found"):
+        class_helper.Alert().load_from_iris(3)
+    assert requested == [3]
+
+
+def test_flush_iris_updates(monkeypatch):
+    """Tests that CaseFile.flush_iris_updates() sends the queued notes and title with one iris_helper.update_case() call.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace iris_helper.update_case()
+
+    Returns:
+        None
+    """
+    calls = []
+
+    def update_case(case_id, title=None, notes=None):
+        calls.append((case_id, title, notes))
+        return {"Group": 11, "IRIS-SOAR Audit": 12}, True
+
+    monkeypatch.setattr(class_helper.iris_helper, "update_case", update_case)
+    case_file = class_helper.CaseFile([], 7)
+
+    # Nothing queued, nothing sent
+    assert case_file.flush_iris_updates() is True
+    assert calls == []
+
+    case_file.notes["Existing"] = [{"title": "Old", "content": "Old", "id": 9}]
+    case_file.queue_note("Note 1", "Content 1", "Group")
+    case_file.queue_note("Note 2", "Content 2")
+    case_file.queue_note("Note 3", "Content 3", "Existing")
+    case_file.queue_title_update("New title")
+    assert case_file.flush_iris_updates() is True
+
+    assert calls == [
+        (
+            7,
+            "New title",
+            [("Note 1", "Content 1", None, "Group"), ("Note 2", "Content 2", None, "IRIS-SOAR Audit"), ("Note 3", "Content 3", 9, "Existing")],
+        )
+    ]
+    assert case_file.notes["Group"] == [{"title": "Note 1", "content": "Content 1", "id": 11}]
+    assert case_file.notes["IRIS-SOAR Audit"] == [{"title": "Note 2", "content": "Content 2", "id": 12}]
+
+    # The queue is empty after a flush
+    assert case_file.flush_iris_updates() is True
+    assert len(calls) == 1
+
+
+def test_flush_iris_updates_failed(monkeypatch):
+    """Tests that CaseFile.flush_iris_updates() returns False if sending the updates failed.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace iris_helper.update_case()
+
+    Returns:
+        None
+    """
+
+    def update_case(case_id, title=None, notes=None):
+        raise ConnectionError("IRIS is not reachable")
+
+    monkeypatch.setattr(class_helper.iris_helper, "update_case", update_case)
+    case_file = class_helper.CaseFile([], 7)
+    case_file.queue_note("Note 1", "Content 1")
+
+    assert case_file.flush_iris_updates() is False
+    assert case_file._pending_iris_notes == [("Note 1", "Content 1", "IRIS-SOAR Audit")]
+
+
+def test_from_records():
+    """Tests that from_records() creates objects from prefixed dictionaries or a DataFrame, with None for missing values.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    pd = pytest.importorskip("pandas")
+
+    locations = class_helper.Location.from_records(
+        [{"location_country": "DE", "location_city": "Berlin", "unknown": 1}, {"location_country": "FR"}]
+    )
+    assert [(location.country, location.city) for location in locations] == [("DE", "Berlin"), ("FR", None)]
+    # All objects of one bulk load share the creation timestamp
+    assert locations[0].timestamp == locations[1].timestamp
+
+    services = class_helper.Service.from_records(
+        pd.DataFrame([{"svc_name": "ssh", "svc_risk_score": 90}, {"svc_name": "http", "svc_risk_score": None}])
+    )
+    assert [(service.name, service.risk_score) for service in services] == [("ssh", 90), ("http", None)]
+
+    persons = class_helper.Person.from_records([{"user_name": "Alice", "user_email": "alice@example.com"}])
+    assert persons[0].name == "Alice" and persons[0].email == "alice@example.com"
+
+    vulnerabilities = class_helper.Vulnerability.from_records([{"vuln_cve": "CVE-2023-0001", "vuln_cvss": 9.8}])
+    assert vulnerabilities[0].cve == "CVE-2023-0001" and vulnerabilities[0].cvss == 9.8
+
+
+@pytest.mark.parametrize("risk_score, error", ((101, ValueError), (-1, ValueError), (50.5, TypeError)))
+def test_from_records_validates_percentages(risk_score, error):
+    """Tests that from_records() validates the percentage columns like the constructor does.
+
+    Args:
+        risk_score: The invalid percentage value
+        error (type): The expected exception
+
+    Returns:
+        None
+    """
+    pytest.importorskip("pandas")
+
+    with pytest.raises(error):
+        class_helper.Service.from_records([{"svc_name": "ssh", "svc_risk_score": 50}, {"svc_name": "http", "svc_risk_score": risk_score}])
+
+
+@pytest.mark.parametrize(
+    "ips",
+    (
+        ["10.0.0.1", "10.0.0.2"],
+        [ipaddress.ip_address("10.0.0.1"), "10.0.0.2"],
+        ["10.0.0.1", "fe80::1", ipaddress.ip_address("10.0.0.2")],
+    ),
+)
+def test_has_ip(ips):
+    """Tests that ContextAsset.has_ip() finds the packed IPv4 and IPv6 addresses of the device.
+
+    Args:
+        ips (list): The IP addresses of the device (IPv4 only or mixed)
+
+    Returns:
+        None
+    """
+    device = class_helper.ContextAsset(name="host1", local_ip="10.0.0.1", ips=ips, uuid=UUID)
+
+    assert device.has_ip("10.0.0.1")
+    assert device.has_ip(ipaddress.ip_address("10.0.0.2"))
+    assert not device.has_ip("10.0.0.3")
+    assert not device.has_ip("not an ip")
+    assert device.has_ip("fe80::1") == ("fe80::1" in ips)
+    assert [str(ip) for ip in device.ips] == [str(ip) for ip in ips]
+
+
+def test_in_network():
+    """Tests that ContextAsset.in_network() checks IPv4 and IPv6 addresses against the network of the device.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    device = class_helper.ContextAsset(name="host1", local_ip="10.0.0.1", network="10.0.0.0/24", uuid=UUID)
+    assert device.in_network("10.0.0.200")
+    assert device.in_network(ipaddress.ip_address("10.0.0.1"))
+    assert not device.in_network("10.0.1.1")
+    assert not device.in_network("fe80::1")
+    assert not device.in_network("not an ip")
+    assert device.network == ipaddress.ip_network("10.0.0.0/24")
+
+    device.network = "fe80::/64"
+    assert device.in_network("fe80::1")
+    assert not device.in_network("10.0.0.1")
+
+    # Without a network (also as written by to_dict() of earlier versions) no address is part of it
+    device.network = "None"
+    assert device.network is None
+    assert not device.in_network("10.0.0.1")
+
+
+@pytest.mark.parametrize(
+    "source_ip, destination_ip, direction",
+    (
+        ("10.0.0.1", "192.168.0.1", "L2L"),
+        ("10.0.0.1", "8.8.8.8", "L2R"),
+        ("8.8.8.8", "10.0.0.1", "R2L"),
+        ("8.8.8.8", "1.1.1.1", "R2R"),
+        ("fe80::1", "2001:4860:4860::8888", "L2R"),
+    ),
+)
+def test_flow_direction(source_ip, destination_ip, direction):
+    """Tests that ContextFlow derives the flow direction from the privacy of its IP addresses, unless it is given.
+
+    Args:
+        source_ip (str): The source IP address of the flow
+        destination_ip (str): The destination IP address of the flow
+        direction (str): The expected flow direction
+
+    Returns:
+        None
+    """
+    source_ip, destination_ip = ipaddress.ip_address(source_ip), ipaddress.ip_address(destination_ip)
+    flow = class_helper.ContextFlow(UUID, TIMESTAMP, "Suricata", source_ip, 1234, destination_ip, 80, "TCP")
+    assert flow.direction == direction
+
+    # A given direction is kept as it is
+    flow = class_helper.ContextFlow(UUID, TIMESTAMP, "Suricata", source_ip, 1234, destination_ip, 80, "TCP", flow_direction="R2R")
+    assert flow.direction == "R2R"
+
+
+@pytest.mark.parametrize("use_orjson", (True, False))
+def test_dump_batch(monkeypatch, use_orjson):
+    """Tests that ContextLog.dump_batch() writes one compact JSON line per log, with the same content as str().
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to switch to the json module fallback
+        use_orjson (bool): If False, the JSON is serialized without orjson
+
+    Returns:
+        None
+    """
+    if not use_orjson:
+        monkeypatch.setattr(class_helper, "orjson", None)
+    logs = [
+        class_helper.ContextLog(timestamp=TIMESTAMP, log_message="Some log", log_custom_fields={"a": 1}),
+        class_helper.ContextLog(timestamp=TIMESTAMP, log_message="Läuft", log_custom_fields={}),
+    ]
+
+    out = io.BytesIO()
+    written = class_helper.ContextLog.dump_batch(logs, out)
+    data = out.getvalue()
+
+    assert written == len(data)
+    assert data.endswith(b"\n")
+    lines = data.split(b"\n")[:-1]
+    assert len(lines) == len(logs)
+    for line, log in zip(lines, logs):
+        assert b"\n" not in line and b"  " not in line
+        assert json.loads(line) == json.loads(str(log))
+    assert "Läuft".encode() in lines[1]
+
+    # An empty batch writes nothing
+    out = io.BytesIO()
+    assert class_helper.ContextLog.dump_batch([], out) == 0
+    assert out.getvalue() == b""
@@ -0,0 +1,98 @@
+# IRIS-SOAR
+# Created by: Martin Offermann
+# This test module is used to test the lib/generic_helper.py module.
+# It will test if the tables rendered by format_results() are cached by the content of the events.
+
+import pytest
+
+import lib.class_helper as class_helper
+import lib.generic_helper as generic_helper
+
+pytest.importorskip("pandas")
+
+
+@pytest.fixture(autouse=True)
+def clear_render_cache():
+    """Clears the cache of format_results() before and after every test.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    generic_helper.clear_format_results_cache()
+    yield
+    generic_helper.clear_format_results_cache()
+
+
+def sample_rules():
+    """Returns a new list of sample rules with the same content on every call.
+
+    Args:
+        None
+
+    Returns:
+        list: The sample rules
+    """
+    return [class_helper.Rule("1", "Rule A", 1), class_helper.Rule("2", "Rule B", 2)]
+
+
+def test_format_results_hits_cache_for_equal_content(monkeypatch):
+    """Tests that equal events (also if they are other objects) are only rendered once.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to count the rendered tables
+
+    Returns:
+        None
+    """
+    rendered = []
+    original_render_table = generic_helper._render_table
+
+    def counting_render_table(*args):
+        rendered.append(args)
+        return original_render_table(*args)
+
+    monkeypatch.setattr(generic_helper, "_render_table", counting_render_table)
+
+    table = generic_helper.format_results(sample_rules(), "html", "")
+    assert "Rule A" in table
+    assert generic_helper.format_results(sample_rules(), "html", "") == table
+    assert len(rendered) == 1
+
+    # Other arguments are rendered on their own
+    generic_helper.format_results(sample_rules(), "html", "", transform=True)
+    assert len(rendered) == 2
+
+
+def test_format_results_misses_cache_for_changed_content():
+    """Tests that a changed event is rendered again instead of returning the cached table.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    rules = sample_rules()
+    table = generic_helper.format_results(rules, "html", "")
+    rules[0].name = "Rule C"
+    changed_table = generic_helper.format_results(rules, "html", "")
+    assert changed_table != table
+    assert "Rule C" in changed_table and "Rule A" not in changed_table
+
+
+def test_clear_format_results_cache():
+    """Tests that clear_format_results_cache() removes all cached tables.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    generic_helper.format_results(sample_rules(), "html", "")
+    assert len(generic_helper._RENDER_CACHE) == 1
+    generic_helper.clear_format_results_cache()
+    assert len(generic_helper._RENDER_CACHE) == 0
@@ -0,0 +1,174 @@
+# IRIS-SOAR
+# Created by: Martin Offermann
+# This test module is used to test the lib/iris_helper.py module.
+# It will test if the requests to DFIR-IRIS are built as expected, without connecting to a DFIR-IRIS instance.
+
+import lib.iris_helper as iris_helper
+
+
+class FakeResponse:
+    """A response of the dfir_iris_client with the given data."""
+
+    def __init__(self, data=None, success=True):
+        self.data = data or {}
+        self.success = success
+
+    def is_success(self):
+        return self.success
+
+    def get_data(self):
+        return self.data
+
+    def get_data_field(self, field):
+        return self.data.get(field)
+
+    def log_error(self):
+        return "Fake error"
+
+
+class FakeAlert:
+    """Replaces dfir_iris_client.alert.Alert and records the filter requests."""
+
+    requests = []
+    response = FakeResponse()
+
+    def __init__(self, session):
+        self.session = session
+
+    def filter_alerts(self, **kwargs):
+        FakeAlert.requests.append(kwargs)
+        return FakeAlert.response
+
+
+def use_fake_alert(monkeypatch, response):
+    """Replaces the Alert client of iris_helper with FakeAlert, answering every request with the given response.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the Alert client
+        response (FakeResponse): The response of every request
+
+    Returns:
+        list: The recorded requests
+    """
+    monkeypatch.setattr(iris_helper, "Alert", FakeAlert)
+    monkeypatch.setattr(FakeAlert, "requests", [])
+    monkeypatch.setattr(FakeAlert, "response", response)
+    return FakeAlert.requests
+
+
+def test_get_alerts_by_ids(monkeypatch):
+    """Tests that get_alerts_by_ids() fetches all alerts with one request and returns them keyed by their ID.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the Alert client
+
+    Returns:
+        None
+    """
+    alerts = [{"alert_id": 3, "alert_title": "A"}, {"alert_id": 5, "alert_title": "B"}]
+    requests = use_fake_alert(monkeypatch, FakeResponse({"alerts": alerts}))
+
+    assert iris_helper.get_alerts_by_ids([3, 5], session=object()) == {3: alerts[0], 5: alerts[1]}
+    assert requests == [{"alert_ids": "3,5", "per_page": 2}]
+
+
+def test_get_alerts_by_ids_without_ids(monkeypatch):
+    """Tests that get_alerts_by_ids() does not send a request if there are no IDs.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the Alert client
+
+    Returns:
+        None
+    """
+    requests = use_fake_alert(monkeypatch, FakeResponse())
+
+    assert iris_helper.get_alerts_by_ids([], session=object()) == {}
+    assert requests == []
+
+
+def test_get_alerts_by_ids_failed_request(monkeypatch):
+    """Tests that get_alerts_by_ids() returns None if the request failed, so that the caller can fall back.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the Alert client
+
+    Returns:
+        None
+    """
+    use_fake_alert(monkeypatch, FakeResponse(success=False))
+
+    assert iris_helper.get_alerts_by_ids([3], session=object()) is None
+
+
+class FakeCase:
+    """Replaces dfir_iris_client.case.Case and records the requests."""
+
+    requests = []
+
+    def __init__(self, session):
+        self.session = session
+
+    def case_id_exists(self, cid):
+        return cid == 7
+
+    def set_cid(self, cid):
+        pass
+
+    def update_case(self, case_id, case_name):
+        FakeCase.requests.append(("update_case", case_id, case_name))
+        return FakeResponse()
+
+    def add_notes_group(self, group_title, cid):
+        FakeCase.requests.append(("add_notes_group", group_title))
+        return FakeResponse({"group_id": 20 + len(FakeCase.requests)})
+
+    def add_note(self, note_title, message, group_id, cid):
+        FakeCase.requests.append(("add_note", note_title, group_id))
+        return FakeResponse()
+
+
+def test_update_case(monkeypatch):
+    """Tests that update_case() sends the title and all notes with one session and creates each note group only once.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the Case client and the session
+
+    Returns:
+        None
+    """
+    sessions = []
+    monkeypatch.setattr(iris_helper, "ClientSession", lambda **kwargs: sessions.append(kwargs) or object())
+    monkeypatch.setattr(iris_helper, "Case", FakeCase)
+    monkeypatch.setattr(FakeCase, "requests", [])
+
+    notes = [("Note 1", "A", None, "Group"), ("Note 2", "B", None, "Group"), ("Note 3", "C", 9, "Existing")]
+    group_ids, success = iris_helper.update_case(7, "New title", notes)
+
+    assert success is True
+    assert len(sessions) == 1
+    assert FakeCase.requests == [
+        ("update_case", 7, "New title"),
+        ("add_notes_group", "Group"),
+        ("add_note", "Note 1", 22),
+        ("add_note", "Note 2", 22),
+        ("add_note", "Note 3", 9),
+    ]
+    assert group_ids == {"Group": 22, "Existing": 9}
+
+
+def test_update_case_unknown_case(monkeypatch):
+    """Tests that update_case() does not send any update if the case does not exist.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the Case client and the session
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(iris_helper, "ClientSession", lambda **kwargs: object())
+    monkeypatch.setattr(iris_helper, "Case", FakeCase)
+    monkeypatch.setattr(FakeCase, "requests", [])
+
+    assert iris_helper.update_case(8, "New title", [("Note 1", "A", None, "Group")]) == ({}, False)
+    assert FakeCase.requests == []
@@ -0,0 +1,100 @@
+# IRIS-SOAR
+# Created by: Martin Offermann
+# This test module is used to test the isoar_case_worker.py module.
+# It will test if the alerts are loaded from DFIR-IRIS as expected, without connecting to a DFIR-IRIS instance.
+
+import pytest
+
+import isoar_case_worker
+import lib.class_helper as class_helper
+
+ALERTS = [{"alert_id": 3, "alert_title": "A"}, {"alert_id": 5, "alert_title": "B"}]
+CONFIG = {"integrations": {"dfir-iris": {"api_key": "key", "url": "https://localhost"}}, "alert_playbooks": {}}
+
+
+class FakeResponse:
+    """A response of the dfir_iris_client with the given alerts."""
+
+    def __init__(self, alerts):
+        self.alerts = alerts
+
+    def is_success(self):
+        return True
+
+    def get_data_field(self, field):
+        return self.alerts
+
+
+class FakeAlert:
+    """Replaces dfir_iris_client.alert.Alert. Lists ALERTS as 'new' and no 'pending' alerts."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def filter_alerts(self, alert_status_id):
+        return FakeResponse(ALERTS if alert_status_id == 2 else [])
+
+
+@pytest.fixture
+def loaded_alerts(monkeypatch):
+    """Replaces the DFIR-IRIS client of the worker and records the calls of Alert.load_from_iris().
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the client and Alert.load_from_iris()
+
+    Returns:
+        list: The recorded (alert_id, iris_alert) calls
+    """
+    calls = []
+
+    def load_from_iris(self, iris_alert_id, iris_alert=None):
+        calls.append((iris_alert_id, iris_alert))
+
+    monkeypatch.setattr(isoar_case_worker, "ClientSession", lambda **kwargs: object())
+    monkeypatch.setattr(isoar_case_worker, "Alert", FakeAlert)
+    monkeypatch.setattr(class_helper.Alert, "load_from_iris", load_from_iris)
+    return calls
+
+
+def test_main_passes_bulk_loaded_alerts(monkeypatch, loaded_alerts):
+    """Tests that the worker fetches all alerts with one bulk request and passes them to Alert.load_from_iris().
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace Alert.bulk_load_from_iris()
+        loaded_alerts (list): The recorded calls of Alert.load_from_iris()
+
+    Returns:
+        None
+    """
+    bulk_requests = []
+
+    def bulk_load_from_iris(session, alert_ids):
+        bulk_requests.append(alert_ids)
+        return {alert["alert_id"]: {"full": alert["alert_id"]} for alert in ALERTS}
+
+    monkeypatch.setattr(class_helper.Alert, "bulk_load_from_iris", staticmethod(bulk_load_from_iris))
+    isoar_case_worker.main(CONFIG)
+
+    assert bulk_requests == [[3, 5]]
+    assert loaded_alerts == [(3, {"full": 3}), (5, {"full": 5})]
+
+
+def test_main_falls_back_to_loading_each_alert(monkeypatch, loaded_alerts):
+    """Tests that the worker loads every alert on its own if the bulk request failed.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace Alert.bulk_load_from_iris()
+        loaded_alerts (list): The recorded calls of Alert.load_from_iris()
+
+    Returns:
+        None
+    """
+
+    def bulk_load_from_iris(session, alert_ids):
+        raise ValueError("Bulk request failed")
+
+    monkeypatch.setattr(class_helper.Alert, "bulk_load_from_iris", staticmethod(bulk_load_from_iris))
+    isoar_case_worker.main(CONFIG)
+
+    # Without a prefetched alert, load_from_iris() requests the alert itself
+    assert loaded_alerts == [(3, None), (5, None)]